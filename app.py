@@ -11,11 +11,8 @@ sys.path.append(os.path.abspath('.'))
 
 # Imports
 from chapter_sidebar import render_chapter_sidebar
-from topic_handlers.chapter1_real_numbers_handler import handle_chapter1_real_numbers
-from topic_handlers.chapter2_polynomials_handler import handle_chapter2_polynomials
-from topic_handlers.chapter6_triangles_handler import handle_chapter6_triangles
-from topic_handlers.chapter11_areas_circles_handler import handle_chapter11_areas_circles
-from topic_handlers.chapter12_surface_areas_handler import handle_chapter12_surface_areas
+# Chapter handlers (and their sympy/matplotlib/LLM stacks) are imported on first use
+from handler_registry import get_handler
 
 # Sidebar
 render_chapter_sidebar()
@@ -28,16 +25,9 @@ topic = st.session_state.get('selected_topic', '')
 
 if topic:
     # Route to appropriate chapter handler
-    if topic.startswith('Chapter 1: Real Numbers'):
-        handle_chapter1_real_numbers(topic)
-    elif topic.startswith('Chapter 2: Polynomials'):
-        handle_chapter2_polynomials(topic)
-    elif topic.startswith('Chapter 6: Triangles'):
-        handle_chapter6_triangles(topic)
-    elif topic.startswith('Chapter 11: Areas Related to Circles'):
-        handle_chapter11_areas_circles(topic)
-    elif topic.startswith('Chapter 12: Surface Areas and Volumes'):
-        handle_chapter12_surface_areas(topic)
+    handler = get_handler(topic)
+    if handler is not None:
+        handler(topic)
     elif 'Question Bank' in topic:
         st.markdown(f'📚 Displaying questions for **{topic}** (static placeholder)')
         st.markdown('- Q1: Example question\n- Q2: Another question')
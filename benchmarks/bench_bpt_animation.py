@@ -0,0 +1,133 @@
+# File: benchmarks/bench_bpt_animation.py
+"""
+BPT animation benchmark: frame-render throughput with full redraws vs
+blitting of persistent artists, GIF encode time, and the cost of a repeat
+request served from the plot cache.
+
+It also compares the Streamlit keyframes: one new figure per step kept alive
+(the previous approach) vs one shared figure emitting PNG bytes, memoized,
+and the script time auto-play costs: the old time.sleep(1) loop over the
+keyframes vs the cached keyframe GIF that the browser plays.
+
+Usage: python benchmarks/bench_bpt_animation.py [--dpi 60]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+import matplotlib
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+from chapters.chapter6_triangles.animations.bpt_animation import (
+    BPTAnimationExplainer, render_bpt_animation_with_stats, render_keyframes, render_keyframe_gif, FRAMES_PER_STEP
+)
+from utils.plot_cache import PlotCache
+
+# The explanation panel's emoji are missing from the default font; the warnings are noise here
+warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+
+
+def frame_throughput(blit, dpi):
+    animator = BPTAnimationExplainer()
+    for _ in animator.render_frames(dpi=dpi, blit=blit):
+        pass
+    return animator.render_stats
+
+
+def figure_per_step(segments):
+    """The previous keyframe approach: a fresh 16x10 figure per step, all kept alive."""
+    animator = BPTAnimationExplainer()
+    figures = []
+    for step in range(len(animator.animation_steps)):
+        fig = animator.create_figure(segments)
+        animator.animate_frame(step * FRAMES_PER_STEP + FRAMES_PER_STEP - 1)
+        fig.canvas.draw()  # what st.pyplot pays to rasterize each one
+        figures.append(fig)
+    return figures
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, seconds, held
+
+
+def keyframes():
+    segments = (4, 6, 6, 9)
+    figures, old_seconds, old_held = measure(lambda: figure_per_step(segments))
+    for fig in figures:
+        plt.close(fig)
+    render_keyframes.cache_clear()
+    frames, new_seconds, new_held = measure(lambda: render_keyframes(segments))
+    start = time.perf_counter()
+    render_keyframes(segments)
+    memo = time.perf_counter() - start
+
+    print(f"\n{'keyframes':<28} {'seconds':>8} {'held':>10}")
+    print(f"{'figure per step (kept)':<28} {old_seconds:>8.2f} {old_held / 2**20:>7.1f} MB")
+    print(f"{'shared figure -> PNG bytes':<28} {new_seconds:>8.2f} {new_held / 2**20:>7.1f} MB"
+          f"   ({sum(map(len, frames)) / 1024:.0f} KB of PNG)")
+    print(f"{'memoized repeat':<28} {memo * 1e6:>8.1f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BPT animation rendering")
+    parser.add_argument("--dpi", type=int, default=60)
+    args = parser.parse_args()
+
+    print(f"{'mode':<16} {'frames':>7} {'rendered':>9} {'seconds':>8} {'frames/s':>9}")
+    for label, blit in (("full redraw", False), ("blit", True)):
+        stats = frame_throughput(blit, args.dpi)
+        print(f"{label:<16} {stats['frames']:>7} {stats['rendered_frames']:>9} "
+              f"{stats['render_seconds']:>8.2f} {stats['rendered_fps']:>9.1f}")
+
+    # Fresh cache so the first request really renders and encodes
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = PlotCache(cache_dir=cache_dir)
+        import utils.plot_cache as plot_cache_module
+        previous, plot_cache_module.plot_cache = plot_cache_module.plot_cache, cache
+        try:
+            start = time.perf_counter()
+            gif, render_stats = render_bpt_animation_with_stats((4, 6, 6, 9), dpi=args.dpi)
+            cold = time.perf_counter() - start
+            start = time.perf_counter()
+            render_bpt_animation_with_stats([4, 6, 6, 9], dpi=args.dpi)
+            warm = time.perf_counter() - start
+            start = time.perf_counter()
+            autoplay = render_keyframe_gif((4, 6, 6, 9))
+            autoplay_cold = time.perf_counter() - start
+            start = time.perf_counter()
+            render_keyframe_gif((4, 6, 6, 9))
+            autoplay_warm = time.perf_counter() - start
+        finally:
+            plot_cache_module.plot_cache = previous
+
+    print(f"\nGIF: {len(gif) / 1024:.0f} KB, render + encode {render_stats['total_seconds']:.2f} s")
+    print(f"first request (cold)  {cold * 1000:>9.1f} ms")
+    print(f"repeat request (cache) {warm * 1000:>8.2f} ms")
+
+    steps = len(render_keyframes((4, 6, 6, 9)))
+    print(f"\n{'auto-play (script time)':<28} {'seconds':>8}")
+    print(f"{'sleep(1) per keyframe':<28} {steps:>8.2f}   (blocks the session)")
+    print(f"{'keyframe GIF, first':<28} {autoplay_cold:>8.2f}   ({len(autoplay) / 1024:.0f} KB)")
+    print(f"{'keyframe GIF, cached':<28} {autoplay_warm:>8.4f}")
+
+    keyframes()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# File: benchmarks/bench_factorization.py
+"""
+Prime factorization benchmark: the old trial division (i += 1) vs the
+sieve / Miller–Rabin / Pollard-rho engine in utils/prime_factorization.py.
+
+For each magnitude 10^3 … 10^18 it factorizes random numbers and balanced
+semiprimes (the worst case for trial division). Trial division is only run
+while its projected time stays under --trial-budget seconds per number.
+Engine timings are cold (memo cache cleared); a warm repeat is reported too.
+
+Usage: python benchmarks/bench_factorization.py [--samples 20] [--trial-budget 0.5]
+"""
+
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from utils.prime_factorization import factorize, is_prime, _smallest_prime_factors
+
+
+def trial_division(n):
+    """The previous solver_hcf_lcm.prime_factors."""
+    i = 2
+    factors = []
+    while i * i <= n:
+        while n % i == 0:
+            factors.append(i)
+            n = n // i
+        i += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def random_prime(rng, digits):
+    while True:
+        candidate = rng.randrange(10 ** (digits - 1), 10 ** digits) | 1
+        if is_prime(candidate):
+            return candidate
+
+
+def sample_numbers(rng, exponent, samples):
+    randoms = [rng.randrange(10 ** (exponent - 1), 10 ** exponent) for _ in range(samples)]
+    half = max(1, exponent // 2)
+    semiprimes = [random_prime(rng, half) * random_prime(rng, exponent - half) for _ in range(samples)]
+    return randoms, semiprimes
+
+
+def time_each(func, numbers):
+    samples = []
+    for n in numbers:
+        start = time.perf_counter()
+        func(n)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def engine_cold(numbers):
+    factorize.cache_clear()
+    return time_each(factorize, numbers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark prime factorization")
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--trial-budget", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    _smallest_prime_factors()
+    print(f"sieve build (once per process): {(time.perf_counter() - start) * 1000:.1f} ms\n")
+
+    # Rough trial-division speed, used to skip hopeless runs
+    start = time.perf_counter()
+    trial_division(1_000_003 * 1_000_033)
+    per_step = (time.perf_counter() - start) / 1_000_003
+
+    print(f"{'n ~':<7} {'kind':<11} {'trial division':>16} {'engine cold':>13} {'engine warm':>13}")
+    for exponent in (3, 6, 9, 12, 15, 18):
+        randoms, semiprimes = sample_numbers(rng, exponent, args.samples)
+        for kind, numbers in (("random", randoms), ("semiprime", semiprimes)):
+            projected = per_step * math.isqrt(max(numbers))
+            if projected <= args.trial_budget:
+                trial = f"{time_each(trial_division, numbers) * 1e3:>13.3f} ms"
+            else:
+                trial = f"{'~' + format(projected, '.0f') + ' s':>16}"
+            cold = engine_cold(numbers)
+            warm = time_each(factorize, numbers)
+            print(f"10^{exponent:<4} {kind:<11} {trial} {cold * 1e3:>10.3f} ms {warm * 1e6:>10.2f} µs")
+
+    # The engine must agree with trial division wherever that is affordable
+    for n in rng.sample(range(2, 10**7), 2000):
+        assert [p for p, e in factorize(n) for _ in range(e)] == trial_division(n), n
+    print("\nresults match trial division on 2000 random n < 10^7")
+
+
+if __name__ == "__main__":
+    main()
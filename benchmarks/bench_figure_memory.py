@@ -0,0 +1,95 @@
+# File: benchmarks/bench_figure_memory.py
+"""
+Figure memory over many requests.
+
+Renders the triangle, polynomial, circle and solid plots round-robin with the
+plot cache bypassed (every request draws a new figure) and reports live
+figures and RSS as it goes. With utils.figures managing every figure both
+numbers should stay flat. --leaky repeats the run the way figures used to be
+handled (plt.subplots + st.pyplot, never closed) for comparison.
+
+Usage: python benchmarks/bench_figure_memory.py [--requests 500] [--every 100] [--leaky]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import warnings
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+import matplotlib
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+from utils.figures import figure_stats
+from chapters.chapter6_triangles import visualization
+from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.plot_polynomial import plot_polynomial
+from chapters.chapter11_areas_circles.plot_circles import plot_sector
+from chapters.chapter12_surface_areas_and_volumes.plot_solids import plot_cuboid
+
+warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+warnings.filterwarnings("ignore", message="More than 20 figures have been opened")
+
+
+def uncached(func):
+    return getattr(func, "__wrapped__", func)
+
+
+def request(i):
+    """One uncached render; arguments vary so nothing could be memoized anyway."""
+    kind = i % 5
+    if kind == 0:
+        return uncached(visualization.render_right_triangle)(3 + i % 7, 4 + i % 5, fmt="svg")
+    if kind == 1:
+        return uncached(visualization.render_similar_triangles)([3, 4, 5], [6, 8, 10 + i % 3 * 0.01], 2.0, fmt="svg")
+    if kind == 2:
+        return uncached(plot_polynomial)([1, -(i % 9), 6], degree=2, fmt="svg")
+    if kind == 3:
+        return uncached(plot_sector)(7, 30 + i % 300, fmt="svg")
+    return uncached(plot_cuboid)(2 + i % 4, 3, 4, fmt="svg")
+
+
+def leaky_request(i):
+    """Previous handler behaviour: the figure goes to st.pyplot and is never closed."""
+    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.plot([0, 3 + i % 7, 0, 0], [0, 0, 4, 0])
+    fig.canvas.draw()
+
+
+def report(label, done, start):
+    stats = figure_stats()
+    print(f"{label:<8} {done:>8} {stats['live_figures'] + stats['pyplot_figures']:>13} "
+          f"{stats['rss_mb']:>9.1f} {done / (time.perf_counter() - start):>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Figure count and RSS over many plot requests")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--every", type=int, default=100)
+    parser.add_argument("--leaky", action="store_true", help="also run the unmanaged comparison")
+    args = parser.parse_args()
+
+    print(f"{'run':<8} {'requests':>8} {'live figures':>13} {'RSS (MB)':>9} {'req/s':>10}")
+    start = time.perf_counter()
+    for i in range(1, args.requests + 1):
+        request(i)
+        if i % args.every == 0:
+            gc.collect()
+            report("managed", i, start)
+
+    if args.leaky:
+        start = time.perf_counter()
+        for i in range(1, args.requests + 1):
+            leaky_request(i)
+            if i % args.every == 0:
+                report("leaky", i, start)
+        plt.close("all")
+
+
+if __name__ == "__main__":
+    main()
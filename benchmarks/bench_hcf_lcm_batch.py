@@ -0,0 +1,81 @@
+# File: benchmarks/bench_hcf_lcm_batch.py
+"""
+HCF/LCM batch benchmark: one worksheet of many pairs, and one long list.
+
+* pairs: the per-request path (solve_hcf_lcm builds the full worked text
+  for every pair) vs hcf_lcm_many (np.gcd over all pairs, text on demand)
+* long list: the old pairwise Python fold vs math.gcd(*xs) / math.lcm(*xs)
+
+Usage: python benchmarks/bench_hcf_lcm_batch.py [--pairs 500] [--list-size 5000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from functools import reduce
+from math import gcd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from chapters.chapter1_real_numbers.sub_chapters.hcf_lcm.solver_hcf_lcm import (
+    solve_hcf_lcm, hcf_lcm_many, hcf_lcm_of, answer_key_csv
+)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def pairwise_fold(numbers):
+    """The previous solve_hcf_lcm_multiple_numbers loops."""
+    hcf = reduce(gcd, numbers)
+    lcm = reduce(lambda a, b: abs(a * b) // gcd(a, b), numbers)
+    return hcf, lcm
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch HCF/LCM")
+    parser.add_argument("--pairs", type=int, default=500)
+    parser.add_argument("--list-size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    pairs = [(rng.randrange(2, 10**6), rng.randrange(2, 10**6)) for _ in range(args.pairs)]
+
+    # Warm up: sieve build, numpy ufunc dispatch
+    solve_hcf_lcm({"numbers": pairs[0]})
+    hcf_lcm_many(pairs[:2])
+
+    _, per_request = timed(lambda: [solve_hcf_lcm({"numbers": pair}) for pair in pairs])
+    _, per_pair = timed(lambda: [hcf_lcm_of(pair) for pair in pairs])
+    results, batch = timed(lambda: hcf_lcm_many(pairs))
+    _, csv_seconds = timed(lambda: answer_key_csv(results))
+    _, one_step = timed(lambda: results[0].steps())
+
+    print(f"{args.pairs} pairs")
+    print(f"{'solve_hcf_lcm per pair (with steps)':<38} {per_request * 1e3:>9.2f} ms")
+    print(f"{'hcf_lcm_of per pair':<38} {per_pair * 1e3:>9.2f} ms")
+    print(f"{'hcf_lcm_many (np.gcd)':<38} {batch * 1e3:>9.2f} ms")
+    print(f"{'answer key CSV':<38} {csv_seconds * 1e3:>9.2f} ms")
+    print(f"{'steps for one pair, on demand':<38} {one_step * 1e3:>9.2f} ms")
+
+    numbers = [rng.randrange(1, 10**6) * 6 for _ in range(args.list_size)]
+    old, fold = timed(lambda: pairwise_fold(numbers))
+    new, varargs = timed(lambda: hcf_lcm_of(numbers))
+    assert old == (new.hcf, new.lcm)
+    print(f"\nlist of {args.list_size} numbers (LCM has {new.lcm.bit_length()} bits)")
+    print(f"{'pairwise fold':<38} {fold * 1e3:>9.2f} ms")
+    print(f"{'math.gcd(*xs) / math.lcm(*xs)':<38} {varargs * 1e3:>9.2f} ms")
+
+    assert [(r.hcf, r.lcm) for r in results] == [pairwise_fold(pair) for pair in pairs]
+    print("\nbatch results match the pairwise fold")
+
+
+if __name__ == "__main__":
+    main()
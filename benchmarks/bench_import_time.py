@@ -0,0 +1,96 @@
+# File: benchmarks/bench_import_time.py
+"""
+Import-time benchmark for app start-up and chapter handlers.
+
+Each measurement runs in a fresh interpreter so module caches are cold:
+  * startup   - what app.py imports before any topic is selected
+  * eager     - the old behaviour: all five chapter handlers up front
+  * <chapter> - first selection of one chapter through the lazy registry
+It also times a warm registry lookup, which is what every Streamlit rerun pays.
+
+Usage: python benchmarks/bench_import_time.py [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+HEAVY_MODULES = ["sympy", "matplotlib", "numpy", "groq", "dotenv", "plotly"]
+
+STARTUP_IMPORTS = "import streamlit, chapter_sidebar, handler_registry"
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{setup}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "heavy": heavy}}))
+"""
+
+
+def run_probe(setup: str) -> dict:
+    code = PROBE.format(setup=setup, heavy=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure(label: str, setup: str, repeat: int):
+    runs = [run_probe(setup) for _ in range(repeat)]
+    seconds = statistics.median(r["seconds"] for r in runs)
+    print(f"{label:<42} {seconds * 1000:>9.0f} ms   heavy: {', '.join(runs[-1]['heavy']) or '-'}")
+
+
+def handler_chapters():
+    """(label, entry point) for every chapter that has a handler."""
+    from handler_registry import load_registry
+
+    return [(label, entry.handler) for label, entry in load_registry().items() if entry.handler]
+
+
+def measure_rerun_lookup(iterations: int = 10000):
+    from handler_registry import get_handler
+
+    topic = f"{handler_chapters()[0][0]} > Question Bank"
+    get_handler(topic)  # first selection imports the handler
+    start = time.perf_counter()
+    for _ in range(iterations):
+        get_handler(topic)
+    per_call = (time.perf_counter() - start) / iterations
+    print(f"{'per-rerun handler lookup (warm)':<42} {per_call * 1e6:>9.2f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold-start and handler import times")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    chapters = handler_chapters()
+
+    print(f"Median of {args.repeat} cold runs\n")
+    measure("startup (sidebar + lazy registry)", STARTUP_IMPORTS, args.repeat)
+
+    eager = "; ".join(
+        f"import {entry.split(':')[0]}" for _, entry in chapters
+    )
+    measure("eager: all handlers at startup", f"{STARTUP_IMPORTS}; {eager}", args.repeat)
+
+    for chapter, _ in chapters:
+        setup = f"{STARTUP_IMPORTS}; handler_registry.get_handler({chapter + ' > x'!r})"
+        measure(f"first selection: {chapter.split(':')[0]}", setup, args.repeat)
+
+    print()
+    measure_rerun_lookup()
+
+
+if __name__ == "__main__":
+    main()
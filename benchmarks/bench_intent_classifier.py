@@ -0,0 +1,82 @@
+# File: benchmarks/bench_intent_classifier.py
+"""
+Accuracy / latency benchmark for the offline intent classifier.
+
+Runs k-fold cross-validation over each chapter corpus and reports accuracy,
+how many queries clear the confidence threshold (i.e. skip the LLM) and the
+per-query prediction latency.
+
+Usage: python benchmarks/bench_intent_classifier.py [--folds 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from intent_classifier import CONFIDENCE_THRESHOLD
+from intent_classifier.model import LocalIntentClassifier, load_corpus
+
+CHAPTERS = ["triangles", "solids", "polynomials"]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def evaluate_chapter(chapter: str, folds: int):
+    examples = load_corpus(chapter)
+    correct = confident = confident_correct = 0
+    latencies = []
+
+    for fold in range(folds):
+        train = [ex for i, ex in enumerate(examples) if i % folds != fold]
+        test = [ex for i, ex in enumerate(examples) if i % folds == fold]
+        model = LocalIntentClassifier().fit(train)
+        for query, expected in test:
+            start = time.perf_counter()
+            intent, confidence = model.predict(query)
+            latencies.append((time.perf_counter() - start) * 1e6)
+            correct += intent == expected
+            if confidence >= CONFIDENCE_THRESHOLD:
+                confident += 1
+                confident_correct += intent == expected
+
+    total = len(examples)
+    start = time.perf_counter()
+    LocalIntentClassifier().fit(examples)
+    train_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "chapter": chapter,
+        "examples": total,
+        "accuracy": correct / total,
+        "coverage": confident / total,
+        "confident_accuracy": confident_correct / confident if confident else 0.0,
+        "p50_us": percentile(latencies, 50),
+        "p99_us": percentile(latencies, 99),
+        "train_ms": train_ms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the local intent classifier")
+    parser.add_argument("--folds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Confidence threshold: {CONFIDENCE_THRESHOLD}  ({args.folds}-fold cross-validation)\n")
+    header = f"{'chapter':<12} {'n':>4} {'acc':>7} {'skip-LLM':>9} {'acc@conf':>9} {'p50 µs':>8} {'p99 µs':>8} {'train ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for chapter in CHAPTERS:
+        r = evaluate_chapter(chapter, args.folds)
+        print(f"{r['chapter']:<12} {r['examples']:>4} {r['accuracy']:>7.1%} {r['coverage']:>9.1%} "
+              f"{r['confident_accuracy']:>9.1%} {r['p50_us']:>8.0f} {r['p99_us']:>8.0f} {r['train_ms']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
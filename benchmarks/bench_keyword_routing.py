@@ -0,0 +1,84 @@
+# File: benchmarks/bench_keyword_routing.py
+"""
+Keyword routing benchmark: sequential `any(keyword in query ...)` scans vs
+one Aho–Corasick pass (utils/keyword_matcher.py).
+
+The chapter 1 tables are timed as they are, then padded with synthetic
+tables to show how each approach grows as more chapters add keywords.
+
+Usage: python benchmarks/bench_keyword_routing.py [--repeat 2000]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from utils.keyword_matcher import KeywordMatcher
+from chapters.chapter1_real_numbers.main_router import QUERY_KEYWORDS, QUERY_TYPE_ORDER
+
+QUERIES = [
+    "find hcf and lcm of 24 and 36",
+    "prove that √3 + 2 is irrational",
+    "use the euclidean algorithm to find the hcf of 1071 and 462",
+    "what is the least common multiple of 8, 12 and 20",
+    "prime factorization of 360",
+    "what is the area of a circle of radius 7 cm",  # no hit: every table is scanned
+]
+
+
+def any_chain(tables, order, query):
+    """The previous routing: one any() scan per table until one matches."""
+    for intent in order:
+        if any(keyword in query for keyword in tables[intent]):
+            return intent
+    return None
+
+
+def synthetic_tables(rng, keyword_count):
+    tables, per_table = {}, 20
+    for i in range(0, keyword_count, per_table):
+        tables[f"synthetic_{i // per_table}"] = [
+            "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 14)))
+            for _ in range(per_table)
+        ]
+    return tables
+
+
+def time_per_query(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in QUERIES:
+            func(query)
+    return (time.perf_counter() - start) / (repeat * len(QUERIES))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark keyword routing")
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    print(f"{'keywords':>9} {'any() chain':>13} {'one pass':>10} {'build':>9}")
+    for extra in (0, 100, 1000, 5000):
+        tables = {**QUERY_KEYWORDS, **synthetic_tables(rng, extra)}
+        order = list(QUERY_TYPE_ORDER) + [name for name in tables if name.startswith("synthetic")]
+        start = time.perf_counter()
+        matcher = KeywordMatcher(tables)
+        build = time.perf_counter() - start
+        for query in QUERIES:
+            assert matcher.scan(query).first(order) == any_chain(tables, order, query), query
+        repeat = max(20, args.repeat // (1 + extra // 100))
+        chain = time_per_query(lambda q: any_chain(tables, order, q), repeat)
+        single = time_per_query(lambda q: matcher.scan(q).first(order), repeat)
+        keywords = sum(map(len, tables.values()))
+        print(f"{keywords:>9} {chain * 1e6:>10.1f} µs {single * 1e6:>7.1f} µs {build * 1e3:>6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
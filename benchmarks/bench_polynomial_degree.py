@@ -0,0 +1,101 @@
+# File: benchmarks/bench_polynomial_degree.py
+"""
+Per-degree timing of the higher-degree polynomial engine (degree 4 to 20).
+
+Each sample polynomial is a product of random rational linear factors and
+irreducible quadratics, so it has both rational and irrational/complex roots.
+For every degree the script times:
+
+* rational-root screening + synthetic division (rational_roots, cache cleared)
+* companion-matrix eigenvalues alone (numpy.roots)
+* all roots as used for plotting (numeric_roots.polynomial_roots)
+* a 1000-point curve by vectorized Horner (numeric_roots.evaluate)
+* the full text answer (solver_factoring.factor_polynomial, fresh analysis)
+
+and checks that the rational roots found are exactly the planted ones.
+
+Usage: python benchmarks/bench_polynomial_degree.py [--samples 20] [--max-degree 20]
+"""
+
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from fractions import Fraction
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+import numpy as np
+from sympy import Poly, symbols
+
+from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring import numeric_roots, polynomial_analysis
+from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.rational_roots import _find, find_rational_roots
+from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.solver_factoring import factor_polynomial
+
+x = symbols('x')
+
+
+def random_polynomial(rng, degree):
+    """(integer coefficients, planted rational roots)"""
+    poly, planted = Poly(1, x), []
+    while poly.degree() < degree:
+        b, c = rng.randint(-3, 3), rng.choice([-7, -5, -3, 2, 3, 5, 7])
+        if degree - poly.degree() >= 2 and rng.random() < 0.4 and math.isqrt(abs(b * b - 4 * c)) ** 2 != b * b - 4 * c:
+            poly *= Poly([1, b, c], x)  # discriminant not a square: no rational roots
+        else:
+            root = Fraction(rng.randint(-9, 9), rng.choice([1, 1, 2, 3]))
+            poly *= Poly([root.denominator, -root.numerator], x)
+            planted.append(root)
+    return [int(c) for c in poly.all_coeffs()], sorted(planted)
+
+
+def median_time(func, samples, clear=None):
+    times = []
+    for sample in samples:
+        if clear:
+            clear()
+        start = time.perf_counter()
+        func(sample)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def full_answer(coefficients):
+    expression = " + ".join(f"({c})*x**{len(coefficients) - 1 - i}" for i, c in enumerate(coefficients))
+    polynomial_analysis._analyses.clear()
+    return factor_polynomial(expression)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark higher-degree polynomial roots")
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--max-degree", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    x_values = np.linspace(-10, 10, 1000)
+
+    print(f"{'degree':<7} {'candidates':>10} {'screening':>11} {'np.roots':>10} "
+          f"{'all roots':>11} {'curve':>9} {'text answer':>12}")
+    for degree in range(4, args.max_degree + 1):
+        polys = [random_polynomial(rng, degree) for _ in range(args.samples)]
+        samples = [coefficients for coefficients, _ in polys]
+        for coefficients, planted in polys:
+            assert list(find_rational_roots(coefficients).roots) == planted, coefficients
+
+        candidates = statistics.median(find_rational_roots(c).candidates_tested for c in samples)
+        screening = median_time(find_rational_roots, samples, clear=_find.cache_clear)
+        eigen = median_time(np.roots, samples)
+        roots = median_time(numeric_roots.polynomial_roots, samples, clear=_find.cache_clear)
+        curve = median_time(lambda c: numeric_roots.evaluate(c, x_values), samples)
+        answer = median_time(full_answer, samples)
+        print(f"{degree:<7} {candidates:>10.0f} {screening * 1e3:>8.2f} ms {eigen * 1e6:>7.0f} µs "
+              f"{roots * 1e3:>8.2f} ms {curve * 1e6:>6.0f} µs {answer * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# File: benchmarks/bench_polynomial_roots.py
+"""
+Polynomial root benchmark for the chapter 2 plot path: sympy.solve + evalf
+(what plot_polynomial used to do) vs the closed-form / numpy engine in
+numeric_roots.py, on random quadratics and cubics with integer coefficients.
+
+Half of the samples are built from integer roots (factorable), half are
+arbitrary (irrational / complex roots). The real roots found by each path
+are checked against each other.
+
+Usage: python benchmarks/bench_polynomial_roots.py [--samples 200]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+import numpy as np
+from sympy import I, solve, symbols
+
+from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.numeric_roots import (
+    critical_points, real_roots
+)
+
+x = symbols('x')
+
+
+def sympy_real_roots(coefficients):
+    """The previous plot path."""
+    degree = len(coefficients) - 1
+    expr = sum(c * x**(degree - i) for i, c in enumerate(coefficients))
+    return sorted(float(r.evalf()) for r in solve(expr, x) if not r.has(I))
+
+
+def numpy_real_roots(coefficients):
+    return sorted(r.real for r in np.roots(coefficients) if abs(r.imag) < 1e-9)
+
+
+def random_polynomial(rng, degree):
+    lead = rng.choice([1, -1, 2, 3, -4])
+    if rng.random() < 0.5:
+        return [int(c) for c in np.poly([rng.randint(-9, 9) for _ in range(degree)]) * lead]
+    return [lead] + [rng.randint(-20, 20) for _ in range(degree)]
+
+
+def median_time(func, samples):
+    times = []
+    for coefficients in samples:
+        start = time.perf_counter()
+        func(coefficients)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark polynomial root finding")
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    print(f"{'degree':<8} {'sympy.solve':>13} {'np.roots':>11} {'closed form':>13} {'+ critical pts':>15}")
+    for degree in (2, 3):
+        samples = [random_polynomial(rng, degree) for _ in range(args.samples)]
+        for coefficients in samples:
+            exact, fast = sympy_real_roots(coefficients), real_roots(coefficients)
+            assert all(any(abs(r - f) < 1e-6 * max(1, abs(r)) for f in fast) for r in exact), coefficients
+        symbolic = median_time(sympy_real_roots, samples)
+        eigen = median_time(numpy_real_roots, samples)
+        closed = median_time(real_roots, samples)
+        both = median_time(lambda c: (real_roots(c), critical_points(c)), samples)
+        print(f"{degree:<8} {symbolic * 1e3:>10.3f} ms {eigen * 1e6:>8.1f} µs "
+              f"{closed * 1e6:>10.1f} µs {both * 1e6:>12.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
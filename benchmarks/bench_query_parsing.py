@@ -0,0 +1,141 @@
+# File: benchmarks/bench_query_parsing.py
+"""
+Query parsing microbenchmark over a corpus of sample queries.
+
+Compares the previous extractors (a fresh re.search / re.findall per value,
+nine irrationality scans before dispatch) with the shared tokenizer in
+utils/query_tokens.py: one compiled scan per query, memoized, with the
+irrationality forms tried in priority order until the first hit.
+
+Usage: python benchmarks/bench_query_parsing.py [--repeat 200]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from utils.query_tokens import PATTERNS, tokenize
+from chapters.chapter12_surface_areas_and_volumes.main_router import (
+    extract_cylinder_params, extract_cone_params, extract_sphere_params, extract_cuboid_params
+)
+from chapters.chapter6_triangles.interpret_query_triangles import extract_triangle_measurements
+from chapters.chapter1_real_numbers.main_router import extract_numbers
+from chapters.chapter1_real_numbers.sub_chapters.irrationality import solver_irrationality
+
+CORPUS = [
+    "Find volume of cylinder with radius 7 cm and height 10 cm",
+    "Calculate surface area of cone with radius 5 cm and height 12 cm",
+    "cone with radius: 5 and slant height 13",
+    "Find volume of sphere with radius 14 cm",
+    "hemisphere with diameter 21 cm find volume",
+    "Calculate TSA of cube with side 8 cm",
+    "cuboid length 10 breadth 5 height 4",
+    "cuboid length 10 width 6 height: 2",
+    "Find hypotenuse of right triangle with base 3 cm and height 4 cm",
+    "Check if triangles with sides (3,4,5) and (6,8,10) are similar",
+    "Find area of triangle with sides 5, 6, 7",
+    "angles 30°, 60 degrees and 90 deg",
+    "Find HCF and LCM of 24 and 36",
+    "Prime factorization of 144",
+    "HCF of 48 and 72 using Euclidean algorithm",
+    "Prove √2 is irrational",
+    "Show that 3 + √5 is irrational",
+    "Prove that 1/(2 + √3) is irrational",
+    "prove √2 + √3 is irrational",
+    "prove 2 + 3√5 is irrational",
+]
+
+NUMBER = r'(\d+(?:\.\d+)?)'
+
+
+def previous_parse(query):
+    """The extractors as they were: every value is its own regex scan."""
+    out = {}
+    for label in ("radius", "height", "diameter", "side", "edge", "length", "breadth", "width"):
+        match = re.search(label + r'[:\s]+' + NUMBER, query, re.IGNORECASE)
+        if match:
+            out[label] = float(match.group(1))
+    re.search(r'slant\s*height[:\s]+' + NUMBER, query, re.IGNORECASE)
+    re.search(r'sides?\s*(?:are\s*)?' + NUMBER + r'\s*,\s*' + NUMBER + r'\s*,\s*' + NUMBER, query, re.IGNORECASE)
+    re.findall(r'\(' + NUMBER + r'\s*,\s*' + NUMBER + r'\s*,\s*' + NUMBER + r'\)', query)
+    re.search(r'base[:\s=]+' + NUMBER, query, re.IGNORECASE)
+    re.search(r'height[:\s=]+' + NUMBER, query, re.IGNORECASE)
+    re.findall(NUMBER + r'\s*(?:degree|deg|°)', query, re.IGNORECASE)
+    re.findall(r'\b\d+\.?\d*\b', query.lower())
+    re.findall(r'\b\d+\.?\d*\b', query)
+
+    # Irrationality: normalise, then all nine forms scanned before dispatch
+    text = query.lower().replace("root", "√")
+    text = re.sub(r"[√√]\s+(\d+)", r"√\1", text)
+    text = re.sub(r"[^√0-9+\-*/^=()./ ]", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    text = re.sub(r"\b(prove|is|irrational|rational|that|the|of|number|an|a|whether|show|check|test|if|then)\b", "", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    for form in (r"√(\d+)\s*([\-+])\s*(\d+)", r"(\d+)\s*([\-+])\s*√(\d+)", r"(\d+)\s*\+\s*(\d+)\s*√(\d+)",
+                 r"(\d+)\s*\*?\s*√(\d+)", r"[√√](\d+)", r"√(\d+)\s*([+-])\s*√(\d+)", r"1\s*/\s*√(\d+)",
+                 r"(\d+)\s*([+-])\s*√(\d+)", r"1\s*/\s*\(\s*(\d+)\s*([+-])\s*√(\d+)\s*\)"):
+        re.search(form, text)
+    return out
+
+
+def current_parse(query):
+    """The same work through the shared tokenizer and registry."""
+    extract_cylinder_params(query)
+    extract_cone_params(query)
+    extract_sphere_params(query)
+    extract_cuboid_params(query)
+    extract_triangle_measurements(query)
+    extract_numbers(query.lower())
+    extract_numbers(query)
+
+    text = str(query).lower().replace("root", "√")
+    text = solver_irrationality.ROOT_SPACE.sub(r"√\1", text)
+    text = solver_irrationality.NON_MATH_CHARS.sub(" ", text)
+    text = solver_irrationality.WHITESPACE.sub(" ", text).strip()
+    text = solver_irrationality.FILLER_WORDS.sub("", text)
+    text = solver_irrationality.WHITESPACE.sub(" ", text).strip()
+    if "√" in text:
+        for pattern, _ in solver_irrationality.EXPRESSION_FORMS:
+            if pattern.search(text):
+                break
+
+
+def per_query(func, repeat, clear=None):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if clear:
+            clear()
+        for query in CORPUS:
+            func(query)
+    return (time.perf_counter() - start) / (repeat * len(CORPUS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark query parsing")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    previous = per_query(previous_parse, args.repeat)
+    cold = per_query(current_parse, args.repeat, clear=tokenize.cache_clear)
+    warm = per_query(current_parse, args.repeat)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for query in CORPUS:
+            tokenize.__wrapped__(query)
+    scan = (time.perf_counter() - start) / (args.repeat * len(CORPUS))
+
+    print(f"{len(CORPUS)} queries, {len(PATTERNS)} registered patterns\n")
+    print(f"{'parser':<40} {'µs/query':>9}")
+    print(f"{'previous (one regex per value)':<40} {previous * 1e6:>9.1f}")
+    print(f"{'tokenizer, cold (new queries)':<40} {cold * 1e6:>9.1f}")
+    print(f"{'tokenizer, warm (query seen before)':<40} {warm * 1e6:>9.1f}")
+    print(f"{'single uncached tokenize() scan':<40} {scan * 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# File: benchmarks/bench_solid_renderers.py
+"""
+Server CPU time per render: matplotlib PNGs (plot_solids) vs Plotly mesh JSON
+(plot_solids_plotly) for every chapter 12 solid and net diagram.
+
+The matplotlib timings bypass the plot cache so each run really rasterizes.
+The Plotly timings include serializing the figure to JSON, because that is
+the work the server does before Streamlit sends it to the browser.
+A second table times mesh generation alone: building the grids from scratch
+versus scaling the cached unit meshes from unit_meshes.py.
+
+Usage: python benchmarks/bench_solid_renderers.py [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+import matplotlib
+matplotlib.use("Agg")
+
+from chapters.chapter12_surface_areas_and_volumes import plot_solids, plot_solids_plotly
+from chapters.chapter12_surface_areas_and_volumes import unit_meshes
+
+CASES = [
+    ("cylinder", "plot_cylinder", (5, 10), {}),
+    ("cone", "plot_cone", (5, 12), {}),
+    ("sphere", "plot_sphere", (7,), {}),
+    ("hemisphere", "plot_sphere", (7,), {"is_hemisphere": True}),
+    ("cube", "plot_cuboid", (5, 5, 5), {}),
+    ("cuboid", "plot_cuboid", (8, 6, 4), {}),
+    ("cone on hemisphere", "plot_combined_solid", (3.5, 12), {}),
+    ("cube net", "create_2d_net", ("cube", {"side": 5}), {}),
+    ("cylinder net", "create_2d_net", ("cylinder", {"radius": 3, "height": 8}), {}),
+]
+
+
+def render_matplotlib(name, args, kwargs):
+    func = getattr(plot_solids, name)
+    return getattr(func, "__wrapped__", func)(*args, **kwargs)
+
+
+def render_plotly(name, args, kwargs):
+    return getattr(plot_solids_plotly, name)(*args, **kwargs).to_json().encode("utf-8")
+
+
+def cpu_time(render, name, args, kwargs, repeat):
+    """Median process CPU time per render and the size of the payload it produced."""
+    payload = render(name, args, kwargs)  # warm-up: imports, font cache
+    samples = []
+    for _ in range(repeat):
+        start = time.process_time()
+        payload = render(name, args, kwargs)
+        samples.append(time.process_time() - start)
+    return statistics.median(samples), len(payload)
+
+
+def mesh_generation(iterations=2000):
+    """Per-call cost of producing solid grids: rebuilt every call vs cached unit mesh × scale."""
+    print(f"\n{'mesh':<28} {'rebuild':>10} {'cached':>10} {'speed-up':>9}")
+    for resolution in unit_meshes.RESOLUTIONS:
+        for kind in unit_meshes.SURFACE_KINDS:
+            build = unit_meshes.unit_surface_grid.__wrapped__
+            start = time.perf_counter()
+            for _ in range(iterations):
+                unit_meshes.scale_grid(build(kind, resolution), 5, 10)
+            rebuild = (time.perf_counter() - start) / iterations
+
+            unit_meshes.unit_surface_grid(kind, resolution)
+            start = time.perf_counter()
+            for _ in range(iterations):
+                unit_meshes.scale_grid(unit_meshes.unit_surface_grid(kind, resolution), 5, 10)
+            cached = (time.perf_counter() - start) / iterations
+            print(f"{kind + ' (' + resolution + ')':<28} {rebuild * 1e6:>7.1f} µs {cached * 1e6:>7.1f} µs "
+                  f"{rebuild / cached:>8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare matplotlib and Plotly render cost for solids")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Median CPU time of {args.repeat} renders\n")
+    print(f"{'solid':<20} {'matplotlib':>12} {'PNG':>9} {'plotly':>10} {'JSON':>9} {'speed-up':>9}")
+    totals = [0.0, 0.0]
+    for label, name, call_args, kwargs in CASES:
+        mpl_seconds, png_bytes = cpu_time(render_matplotlib, name, call_args, kwargs, args.repeat)
+        ply_seconds, json_bytes = cpu_time(render_plotly, name, call_args, kwargs, args.repeat)
+        totals[0] += mpl_seconds
+        totals[1] += ply_seconds
+        print(f"{label:<20} {mpl_seconds * 1000:>9.1f} ms {png_bytes / 1024:>6.0f} KB "
+              f"{ply_seconds * 1000:>7.1f} ms {json_bytes / 1024:>6.0f} KB {mpl_seconds / ply_seconds:>8.1f}x")
+    print(f"\n{'total':<20} {totals[0] * 1000:>9.1f} ms {'':>9} {totals[1] * 1000:>7.1f} ms")
+
+    mesh_generation()
+
+
+if __name__ == "__main__":
+    main()
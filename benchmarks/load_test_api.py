@@ -0,0 +1,170 @@
+# File: benchmarks/load_test_api.py
+"""
+Load test for the headless HTTP API (headless/http_api.py).
+
+Opens --concurrency keep-alive connections and sends --requests requests in
+total: solve queries for every chapter mixed with plot requests (--plot-share).
+Parameters vary per request, so most answers are computed, not served from the
+plot cache. Reports throughput and p50/p99 latency overall and per endpoint,
+plus the count of every status code (503 means --max-pending was reached).
+
+Without --port it starts a server on a free port with --workers workers.
+
+Usage: python benchmarks/load_test_api.py [--requests 400] [--concurrency 16] [--workers 2] [--port 8765]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from urllib.parse import quote
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+
+def solve_request(rng):
+    a, b = rng.randint(2, 60), rng.randint(2, 60)
+    query, chapter = rng.choice([
+        (f"Find HCF and LCM of {a * rng.randint(2, 40)} and {b * rng.randint(2, 40)}", "1"),
+        (f"factor x^3 - {a}x^2 + {b}x - {rng.randint(1, 99)}", "2"),
+        (f"right triangle with base {a} and height {b}", "6"),
+        (f"Find area of sector with radius {a} cm and angle {rng.randint(1, 359)}°", "11"),
+        (f"volume of cone radius {a} height {b}", "12"),
+        (f"surface area of cylinder radius {a} height {b}", "auto"),
+    ])
+    return "solve", "GET", f"/solve/{chapter}?q={quote(query)}", b""
+
+
+def plot_request(rng):
+    shape, params = rng.choice([
+        ("sector", {"radius": rng.randint(1, 30), "angle": rng.randint(1, 359)}),
+        ("polynomial", {"coefficients": [1, -rng.randint(0, 9), rng.randint(-9, 9)]}),
+        ("right_triangle", {"base": rng.randint(1, 30), "height": rng.randint(1, 30)}),
+        ("cuboid", {"length": rng.randint(1, 9), "breadth": rng.randint(1, 9), "height": rng.randint(1, 9)}),
+    ])
+    params["fmt"] = "svg"
+    return "plot", "POST", f"/plot/{shape}", json.dumps(params).encode("utf-8")
+
+
+async def fetch(reader, writer, host, method, path, body):
+    """One request on an open connection: (status, keep_alive)."""
+    writer.write((f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Length: {len(body)}\r\n\r\n")
+                 .encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    await reader.readexactly(int(headers.get("content-length", 0)))
+    return status, headers.get("connection", "").lower() != "close"
+
+
+async def client(host, port, jobs, results):
+    reader = writer = None
+    while jobs:
+        endpoint, method, path, body = jobs.pop()
+        if writer is None:
+            reader, writer = await asyncio.open_connection(host, port)
+        start = time.perf_counter()
+        try:
+            status, keep_alive = await fetch(reader, writer, host, method, path, body)
+        except (ConnectionError, asyncio.IncompleteReadError, IndexError, ValueError):
+            status, keep_alive = 0, False
+        results.append((endpoint, status, time.perf_counter() - start))
+        if not keep_alive:
+            writer.close()
+            reader = writer = None
+    if writer is not None:
+        writer.close()
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))] if sorted_values else 0.0
+
+
+def report(label, latencies, elapsed):
+    latencies = sorted(latencies)
+    print(f"{label:<8} {len(latencies):>8} {len(latencies) / elapsed:>9.1f} "
+          f"{percentile(latencies, 0.5) * 1000:>9.1f} {percentile(latencies, 0.99) * 1000:>9.1f}")
+
+
+async def run(host, port, args):
+    rng = random.Random(args.seed)
+    jobs = [plot_request(rng) if rng.random() < args.plot_share else solve_request(rng)
+            for _ in range(args.requests)]
+    results = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, jobs, results) for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    by_endpoint = defaultdict(list)
+    for endpoint, status, seconds in results:
+        if status == 200:
+            by_endpoint[endpoint].append(seconds)
+    print(f"{'endpoint':<8} {'ok':>8} {'req/s':>9} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+    report("all", [seconds for _, status, seconds in results if status == 200], elapsed)
+    for endpoint, latencies in sorted(by_endpoint.items()):
+        report(endpoint, latencies, elapsed)
+    statuses = Counter(status for _, status, _ in results)
+    print(f"\n{len(results)} requests in {elapsed:.2f} s, concurrency {args.concurrency}; status counts: "
+          + ", ".join(f"{status or 'connection error'}: {count}" for status, count in sorted(statuses.items())))
+
+
+def wait_for_port(host, port, timeout=60.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server did not start on {host}:{port}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the headless HTTP API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="test a running server instead of starting one")
+    parser.add_argument("--workers", type=int, default=2, help="workers for the server this script starts")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--plot-share", type=float, default=0.25, help="fraction of requests that are plots")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.port is not None:
+        asyncio.run(run(args.host, args.port, args))
+        return
+
+    with socket.socket() as sock:
+        sock.bind((args.host, 0))
+        port = sock.getsockname()[1]
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Fresh plot cache, so plots are really rendered
+        env = dict(os.environ, CBSE_CACHE_DIR=cache_dir)
+        server = subprocess.Popen(
+            [sys.executable, "-m", "headless.http_api", "--host", args.host, "--port", str(port),
+             "--workers", str(args.workers)],
+            cwd=PROJECT_ROOT, env=env, stderr=subprocess.DEVNULL)
+        try:
+            wait_for_port(args.host, port)
+            asyncio.run(run(args.host, port, args))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 import streamlit as st
 from typing import Dict, List, Optional
+from handler_registry import get_chapter_structure as load_chapter_structure
 
 def initialize_sidebar_state():
     """Initialize sidebar state variables if they don't exist."""
@@ -13,79 +14,8 @@ def initialize_sidebar_state():
         st.session_state['completed_topics'] = set()
 
 def get_chapter_structure() -> Dict[str, List[str]]:
-    """Get the chapter and topic structure."""
-    return {
-        "Chapter 1: Real Numbers": [
-            "Irrationality Proofs",
-            "Euclid Division Lemma",
-            "Question Bank"
-        ],
-        "Chapter 2: Polynomials": [
-            "Polynomial Factoring",
-            "Zeroes Relationship",
-            "Quadratic Construction",
-            "Question Bank"
-        ],
-        "Chapter 3: Linear Equations": [
-            "Graphical Method",
-            "Algebraic Method",
-            "Question Bank"
-        ],
-        "Chapter 4: Quadratic Equations": [
-            "Factorization Method",
-            "Completing Square Method",
-            "Question Bank"
-        ],
-        "Chapter 5: Arithmetic Progressions": [
-            "Nth Term",
-            "Sum of Terms",
-            "Question Bank"
-        ],
-        "Chapter 6: Triangles": [
-            "Right Triangles",
-            "Similar Triangles",
-            "Area Calculations",
-            "Question Bank"
-        ],
-        "Chapter 7: Coordinate Geometry": [
-            "Distance Formula",
-            "Section Formula",
-            "Midpoint",
-            "Question Bank"
-        ],
-        "Chapter 8: Introduction to Trigonometry": [
-            "Ratios",
-            "Identities",
-            "Question Bank"
-        ],
-        "Chapter 9: Applications of Trigonometry": [
-            "Heights and Distances",
-            "Question Bank"
-        ],
-        "Chapter 10: Circles": [
-            "Tangent Properties",
-            "Angle Formations",
-            "Question Bank"
-        ],
-        "Chapter 11: Areas Related to Circles": [
-            "Sector Area",
-            "Segment Area",
-            "Question Bank"
-        ],
-        "Chapter 12: Surface Areas and Volumes": [
-            "Cube & Cuboid",
-            "Sphere & Cone",
-            "Question Bank"
-        ],
-        "Chapter 13: Statistics": [
-            "Mean/Median/Mode",
-            "Question Bank"
-        ],
-        "Chapter 14: Probability": [
-            "Simple Probability",
-            "Question Bank"
-        ],
-    }
+    """Get the chapter and topic structure (loaded once from config/chapters_config.json)."""
+    return load_chapter_structure()
 
 def get_topic_icon(topic: str) -> str:
     """Get the appropriate icon for a topic."""
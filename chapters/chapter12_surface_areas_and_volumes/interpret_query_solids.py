@@ -1,11 +1,8 @@
-import os
 import re
-from dotenv import load_dotenv
-from groq import Groq
-
-load_dotenv()
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+from utils.intent_cache import cached_intent
+from utils.llm_gateway import llm_gateway
 
+@cached_intent("solids")
 def interpret_query_solids(query: str) -> dict:
     """
     Uses LLM to interpret natural language queries related to surface areas and volumes.
@@ -39,12 +36,8 @@ Query: "{query}"
 """
 
     try:
-        response = client.chat.completions.create(
-            model="llama3-8b-8192",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.2
-        )
-        content = response.choices[0].message.content.strip()
+        # Deadline, concurrency limit and circuit breaker are enforced by the gateway
+        content = llm_gateway.complete(prompt, temperature=0.2).strip()
         if content.startswith("{"):
             import json
             return json.loads(content)
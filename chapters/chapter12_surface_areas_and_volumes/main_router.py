@@ -7,6 +7,24 @@ from chapters.chapter12_surface_areas_and_volumes.sub_chapters.cone.solver_cone
 from chapters.chapter12_surface_areas_and_volumes.sub_chapters.sphere.solver_sphere import solve_sphere
 from chapters.chapter12_surface_areas_and_volumes.sub_chapters.cuboid.solver_cuboid import solve_cuboid
 from chapters.chapter12_surface_areas_and_volumes.sub_chapters.combined_solids.solver_combined import solve_combined_solid
+from intent_classifier import interpret_with_fallback
+from utils.keyword_matcher import KeywordMatcher
+from utils.query_tokens import tokenize
+
+# Solid names, in the order they are tried when a query mentions several
+SOLID_KEYWORDS = {
+    "cylinder": ["cylinder", "cylindrical"],
+    "cone": ["cone", "conical"],
+    "sphere": ["sphere", "spherical", "hemisphere"],
+    "cuboid": ["cube", "cuboid", "box"],
+}
+ACTION_KEYWORDS = {
+    "solve": ["volume", "find", "calculate"],
+    "formula": ["formula", "surface area"],
+    "area_abbreviation": ["csa", "tsa"],  # only read as a formula request for cylinders and cones
+    "slant_height": ["slant height"],     # detect_solid_type only: names a cone even without the word
+}
+SOLID_KEYWORD_MATCHER = KeywordMatcher({**SOLID_KEYWORDS, **ACTION_KEYWORDS})
 
 def load_logic_template(intent: str):
     path = os.path.join(os.path.dirname(__file__), 'logic_templates', f'{intent}.json')
@@ -19,11 +37,13 @@ def route_query(query: str) -> str:
     query = query.strip()
     query_lower = query.lower()
     
-    # First, try LLM interpretation if available
+    # First, try the local classifier; the LLM is only asked when it is unsure
     try:
-        llm_result = interpret_query_solids(query)
-        intent = llm_result.get("intent")
-        params = llm_result.get("parameters", {})
+        intent_result = interpret_with_fallback(
+            "solids", query, interpret_query_solids, extract_intent_parameters
+        )
+        intent = intent_result.get("intent")
+        params = intent_result.get("parameters", {})
         
         if intent == "solve_cylinder":
             return solve_cylinder(params)
@@ -42,83 +62,79 @@ def route_query(query: str) -> str:
         # If LLM fails, continue with rule-based approach
         pass
     
-    # Rule-based approach for common queries
-    if any(word in query_lower for word in ["cylinder", "cylindrical"]):
-        if any(word in query_lower for word in ["volume", "find", "calculate"]):
-            return extract_and_solve_cylinder(query)
-        elif any(word in query_lower for word in ["formula", "surface area", "csa", "tsa"]):
-            return get_formula_explanation("cylinder")
-            
-    elif any(word in query_lower for word in ["cone", "conical"]):
-        if any(word in query_lower for word in ["volume", "find", "calculate"]):
-            return extract_and_solve_cone(query)
-        elif any(word in query_lower for word in ["formula", "surface area", "csa", "tsa"]):
-            return get_formula_explanation("cone")
-            
-    elif any(word in query_lower for word in ["sphere", "spherical", "hemisphere"]):
-        if any(word in query_lower for word in ["volume", "find", "calculate"]):
-            return extract_and_solve_sphere(query)
-        elif any(word in query_lower for word in ["formula", "surface area"]):
-            return get_formula_explanation("sphere")
-            
-    elif any(word in query_lower for word in ["cube", "cuboid", "box"]):
-        if any(word in query_lower for word in ["volume", "find", "calculate"]):
-            return extract_and_solve_cuboid(query)
-        elif any(word in query_lower for word in ["formula", "surface area"]):
-            return get_formula_explanation("cuboid")
+    # Rule-based approach for common queries: one keyword pass, then the first solid named
+    hits = SOLID_KEYWORD_MATCHER.scan(query_lower)
+    solid = hits.first(SOLID_KEYWORDS)
+    solvers = {
+        "cylinder": extract_and_solve_cylinder,
+        "cone": extract_and_solve_cone,
+        "sphere": extract_and_solve_sphere,
+        "cuboid": extract_and_solve_cuboid,
+    }
+    if solid:
+        if "solve" in hits:
+            return solvers[solid](query)
+        elif "formula" in hits or ("area_abbreviation" in hits and solid in ("cylinder", "cone")):
+            return get_formula_explanation(solid)
     
     # No match found → show available options
     return show_available_options()
 
-def extract_and_solve_cylinder(query: str):
-    """Extract parameters and solve cylinder problem."""
-    import re
-    # Try to extract radius and height
-    radius_match = re.search(r'radius[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
-    height_match = re.search(r'height[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
+def extract_cylinder_params(query: str):
+    """Extract radius and height for a cylinder, or None if either is missing."""
+    tokens = tokenize(query)
+    radius, height = tokens.label("radius"), tokens.label("height")
     
-    if radius_match and height_match:
-        params = {
-            "radius": float(radius_match.group(1)),
-            "height": float(height_match.group(1)),
+    if radius is not None and height is not None:
+        return {
+            "radius": float(radius),
+            "height": float(height),
             "find": "all"  # Find volume, CSA, and TSA
         }
+    return None
+
+def extract_and_solve_cylinder(query: str):
+    """Extract parameters and solve cylinder problem."""
+    params = extract_cylinder_params(query)
+    if params:
         return solve_cylinder(params)
     else:
         return "❌ Could not extract radius and height from the query. Please specify both values."
 
-def extract_and_solve_cone(query: str):
-    """Extract parameters and solve cone problem."""
-    import re
-    radius_match = re.search(r'radius[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
-    height_match = re.search(r'height[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
-    slant_match = re.search(r'slant\s*height[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
-    
-    params = {}
-    if radius_match:
-        params["radius"] = float(radius_match.group(1))
-    if height_match:
-        params["height"] = float(height_match.group(1))
-    if slant_match:
-        params["slant_height"] = float(slant_match.group(1))
+def extract_cone_params(query: str):
+    """Extract radius / height / slant height for a cone, or None if fewer than two are given."""
+    tokens = tokenize(query)
+    # "slant height 13" is its own label, so it is no longer also read as the height
+    values = {
+        "radius": tokens.label("radius"),
+        "height": tokens.label("height"),
+        "slant_height": tokens.label("slant height"),
+    }
+    params = {name: float(value) for name, value in values.items() if value is not None}
         
     if len(params) >= 2:  # Need at least 2 parameters
         params["find"] = "all"
+        return params
+    return None
+
+def extract_and_solve_cone(query: str):
+    """Extract parameters and solve cone problem."""
+    params = extract_cone_params(query)
+    if params:
         return solve_cone(params)
     else:
         return "❌ Need at least 2 parameters (radius, height, or slant height) to solve cone problems."
 
-def extract_and_solve_sphere(query: str):
-    """Extract parameters and solve sphere problem."""
-    import re
-    radius_match = re.search(r'radius[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
-    diameter_match = re.search(r'diameter[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
+def extract_sphere_params(query: str):
+    """Extract radius (or diameter) for a sphere/hemisphere, or None if missing."""
+    tokens = tokenize(query)
+    radius, diameter = tokens.label("radius"), tokens.label("diameter")
     
     params = {}
-    if radius_match:
-        params["radius"] = float(radius_match.group(1))
-    elif diameter_match:
-        params["radius"] = float(diameter_match.group(1)) / 2
+    if radius is not None:
+        params["radius"] = float(radius)
+    elif diameter is not None:
+        params["radius"] = float(diameter) / 2
         
     if "hemisphere" in query.lower():
         params["type"] = "hemisphere"
@@ -127,53 +143,84 @@ def extract_and_solve_sphere(query: str):
         
     if "radius" in params:
         params["find"] = "all"
+        return params
+    return None
+
+def extract_and_solve_sphere(query: str):
+    """Extract parameters and solve sphere problem."""
+    params = extract_sphere_params(query)
+    if params:
         return solve_sphere(params)
     else:
         return "❌ Could not extract radius or diameter from the query."
 
-def extract_and_solve_cuboid(query: str):
-    """Extract parameters and solve cuboid/cube problem."""
-    import re
+def extract_cuboid_params(query: str):
+    """Extract side (cube) or length/breadth/height (cuboid), or None if incomplete."""
+    tokens = tokenize(query)
     
     if "cube" in query.lower() and "cuboid" not in query.lower():
         # It's a cube - only need side
-        side_match = re.search(r'side[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
-        edge_match = re.search(r'edge[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
+        side = tokens.label("side", "edge")
         
-        if side_match or edge_match:
-            side = float(side_match.group(1) if side_match else edge_match.group(1))
-            params = {
+        if side is not None:
+            side = float(side)
+            return {
                 "length": side,
                 "breadth": side,
                 "height": side,
                 "type": "cube",
                 "find": "all"
             }
-            return solve_cuboid(params)
     else:
         # It's a cuboid - need length, breadth, height
-        length_match = re.search(r'length[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
-        breadth_match = re.search(r'breadth[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
-        width_match = re.search(r'width[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
-        height_match = re.search(r'height[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
-        
-        params = {}
-        if length_match:
-            params["length"] = float(length_match.group(1))
-        if breadth_match:
-            params["breadth"] = float(breadth_match.group(1))
-        elif width_match:
-            params["breadth"] = float(width_match.group(1))
-        if height_match:
-            params["height"] = float(height_match.group(1))
+        values = {
+            "length": tokens.label("length"),
+            "breadth": tokens.label("breadth", "width"),
+            "height": tokens.label("height"),
+        }
+        params = {name: float(value) for name, value in values.items() if value is not None}
             
         if len(params) == 3:
             params["type"] = "cuboid"
             params["find"] = "all"
-            return solve_cuboid(params)
+            return params
             
+    return None
+
+def extract_and_solve_cuboid(query: str):
+    """Extract parameters and solve cuboid/cube problem."""
+    params = extract_cuboid_params(query)
+    if params:
+        return solve_cuboid(params)
     return "❌ Could not extract dimensions. For cube: specify side/edge. For cuboid: specify length, breadth, and height."
 
+def detect_solid_type(query: str):
+    """Return the solid named in the query (cylinder/cone/sphere/cuboid), if any."""
+    hits = SOLID_KEYWORD_MATCHER.scan(query)
+    if "cylinder" in hits:
+        return "cylinder"
+    if "cone" in hits or "slant_height" in hits:
+        return "cone"
+    return hits.first(SOLID_KEYWORDS)
+
+def extract_intent_parameters(intent: str, query: str):
+    """
+    Build solver parameters for a locally classified intent using the regex extractors.
+    Returns None when the values cannot be read, so the LLM gets a chance instead.
+    """
+    if intent == "solve_cylinder":
+        return extract_cylinder_params(query)
+    elif intent == "solve_cone":
+        return extract_cone_params(query)
+    elif intent == "solve_sphere":
+        return extract_sphere_params(query)
+    elif intent == "solve_cuboid":
+        return extract_cuboid_params(query)
+    elif intent == "formula_request":
+        solid_type = detect_solid_type(query)
+        return {"solid_type": solid_type} if solid_type else None
+    return None
+
 def get_formula_explanation(solid_type: str) -> str:
     """Return formula explanation for a solid type."""
     formulas = {
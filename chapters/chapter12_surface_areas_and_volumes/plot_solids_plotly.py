@@ -0,0 +1,233 @@
+# File: chapters/chapter12_surface_areas_and_volumes/plot_solids_plotly.py
+
+"""
+Interactive Plotly versions of the plot_solids.py renderers, with the same
+function names and arguments. Each returns a plotly Figure holding a small
+triangle mesh (a few hundred vertices) that the browser rotates and zooms
+itself, so the server never rasterizes anything.
+"""
+
+import os
+import numpy as np
+import plotly.graph_objects as go
+from chapters.chapter12_surface_areas_and_volumes.solid_measures import calculate_areas
+from chapters.chapter12_surface_areas_and_volumes.unit_meshes import unit_triangle_mesh, scale_mesh, circle
+
+# Coordinates are rounded so the mesh JSON stays small
+PRECISION = 3
+
+
+def _solid_trace(kind, radius, height, resolution, color, name):
+    """Mesh3d trace of a cached unit solid scaled to the given radius and height."""
+    x, y, z, i, j, k = scale_mesh(unit_triangle_mesh(kind, resolution), radius, height)
+    return go.Mesh3d(x=np.round(x, PRECISION), y=np.round(y, PRECISION), z=np.round(z, PRECISION),
+                     i=i, j=j, k=k, color=color, opacity=0.7,
+                     name=name, hoverinfo="skip", flatshading=False)
+
+
+def _circle_trace(radius, height, color, resolution):
+    circle_x, circle_y = circle(radius, resolution)
+    return go.Scatter3d(x=np.round(circle_x, PRECISION), y=np.round(circle_y, PRECISION),
+                        z=np.full(len(circle_x), height), mode="lines",
+                        line=dict(color=color, width=4), hoverinfo="skip", showlegend=False)
+
+
+def _dimension_trace(start, end, label, dash="solid"):
+    """A red line between two points labelled at its midpoint, like the matplotlib annotations."""
+    xs, ys, zs = zip(start, end)
+    return go.Scatter3d(x=[xs[0], xs[1], None, (xs[0] + xs[1]) / 2],
+                        y=[ys[0], ys[1], None, (ys[0] + ys[1]) / 2],
+                        z=[zs[0], zs[1], None, (zs[0] + zs[1]) / 2],
+                        mode="lines+text", text=["", "", "", label], textfont=dict(color="red", size=14),
+                        line=dict(color="red", width=4, dash=dash), hoverinfo="skip", showlegend=False)
+
+
+def _finish(fig, title, info_text, save_name=None):
+    """Shared layout: title, formula box, equal-scale axes; optionally saved as HTML."""
+    fig.update_layout(
+        title=dict(text=title, x=0.5),
+        scene=dict(aspectmode="data", xaxis_title="X", yaxis_title="Y", zaxis_title="Z"),
+        annotations=[dict(text=info_text, x=0.01, y=0.99, xref="paper", yref="paper",
+                          xanchor="left", yanchor="top", showarrow=False, align="left",
+                          bgcolor="rgba(255,255,255,0.8)", font=dict(size=11))],
+        margin=dict(l=0, r=0, t=60, b=0),
+        showlegend=False,
+        height=600,
+    )
+    if save_name:
+        save_path = os.path.join(os.path.dirname(__file__), "plots", save_name)
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        fig.write_html(save_path, include_plotlyjs="cdn")
+    return fig
+
+
+def _areas_text(shape_type, params):
+    areas = calculate_areas(shape_type, params)
+    return "<br>".join(f"<b>{k}:</b><br>{v}" for k, v in areas.items())
+
+
+def plot_cylinder(radius, height, save_name=None, resolution="preview"):
+    """
+    Creates an interactive 3D plot of a cylinder.
+    """
+    fig = go.Figure([
+        _solid_trace("cylinder", radius, height, resolution, "lightblue", "Cylinder"),
+        _circle_trace(radius, 0, "blue", resolution),
+        _circle_trace(radius, height, "blue", resolution),
+        _dimension_trace((0, 0, 0), (0, 0, height), f"h = {height}"),
+        _dimension_trace((0, 0, 0), (radius, 0, 0), f"r = {radius}"),
+    ])
+    return _finish(fig, f"<b>Cylinder</b><br>Radius = {radius}, Height = {height} cm",
+                   _areas_text("cylinder", {"radius": radius, "height": height}), save_name)
+
+
+def plot_cone(radius, height, save_name=None, resolution="preview"):
+    """
+    Creates an interactive 3D plot of a cone.
+    """
+    slant_height = np.sqrt(radius**2 + height**2)
+    fig = go.Figure([
+        _solid_trace("cone", radius, height, resolution, "lightcoral", "Cone"),
+        _circle_trace(radius, 0, "red", resolution),
+        _dimension_trace((0, 0, 0), (0, 0, height), f"h = {height}"),
+        _dimension_trace((0, 0, 0), (radius, 0, 0), f"r = {radius}"),
+        _dimension_trace((radius, 0, 0), (0, 0, height), f"l = {slant_height:.1f}", dash="dash"),
+    ])
+    return _finish(fig, f"<b>Cone</b><br>Radius = {radius}, Height = {height} cm, "
+                        f"Slant Height = {slant_height:.2f} cm",
+                   _areas_text("cone", {"radius": radius, "height": height}), save_name)
+
+
+def plot_sphere(radius, is_hemisphere=False, save_name=None, resolution="preview"):
+    """
+    Creates an interactive 3D plot of a sphere or hemisphere.
+    """
+    shape_name = "Hemisphere" if is_hemisphere else "Sphere"
+    traces = [
+        _solid_trace(shape_name.lower(), radius, radius, resolution, "lightgreen", shape_name),
+        _dimension_trace((0, 0, 0), (radius, 0, 0), f"r = {radius}"),
+    ]
+    if is_hemisphere:
+        traces.append(_circle_trace(radius, 0, "green", resolution))
+    fig = go.Figure(traces)
+    return _finish(fig, f"<b>{shape_name}</b><br>Radius = {radius} cm",
+                   _areas_text("hemisphere" if is_hemisphere else "sphere", {"radius": radius}),
+                   save_name)
+
+
+def plot_cuboid(length, breadth, height, save_name=None):
+    """
+    Creates an interactive 3D plot of a cuboid or cube.
+    """
+    x = [0, length, length, 0, 0, length, length, 0]
+    y = [0, 0, breadth, breadth, 0, 0, breadth, breadth]
+    z = [0, 0, 0, 0, height, height, height, height]
+    # Two triangles per face: bottom, top, front, right, back, left
+    i = [0, 0, 4, 4, 0, 0, 1, 1, 2, 2, 3, 3]
+    j = [1, 2, 5, 6, 1, 5, 2, 6, 3, 7, 0, 4]
+    k = [2, 3, 6, 7, 5, 4, 6, 5, 7, 6, 4, 7]
+
+    edges = [(0, 1), (1, 2), (2, 3), (3, 0), (4, 5), (5, 6), (6, 7), (7, 4),
+             (0, 4), (1, 5), (2, 6), (3, 7)]
+    edge_x, edge_y, edge_z = [], [], []
+    for a, b in edges:
+        edge_x += [x[a], x[b], None]
+        edge_y += [y[a], y[b], None]
+        edge_z += [z[a], z[b], None]
+
+    traces = [
+        go.Mesh3d(x=x, y=y, z=z, i=i, j=j, k=k, color="lightblue", opacity=0.7,
+                  hoverinfo="skip", flatshading=True),
+        go.Scatter3d(x=edge_x, y=edge_y, z=edge_z, mode="lines",
+                     line=dict(color="darkblue", width=4), hoverinfo="skip"),
+    ]
+
+    if length == breadth == height:
+        title = f"<b>Cube</b><br>Side = {length} cm"
+        traces.append(_dimension_trace((0, 0, 0), (length, 0, 0), f"a = {length}"))
+        info = _areas_text("cube", {"side": length})
+    else:
+        title = f"<b>Cuboid</b><br>Length = {length}, Breadth = {breadth}, Height = {height} cm"
+        traces += [
+            _dimension_trace((0, 0, 0), (length, 0, 0), f"l = {length}"),
+            _dimension_trace((length, 0, 0), (length, breadth, 0), f"b = {breadth}"),
+            _dimension_trace((0, 0, 0), (0, 0, height), f"h = {height}"),
+        ]
+        info = _areas_text("cuboid", {"length": length, "breadth": breadth, "height": height})
+    return _finish(go.Figure(traces), title, info, save_name)
+
+
+def plot_combined_solid(radius, height=None, save_name=None, resolution="preview"):
+    """Creates an interactive 3D plot of a cone standing on a hemisphere."""
+    if height is None:
+        height = radius  # If height not provided, use radius as height
+
+    slant_height = np.sqrt(radius**2 + height**2)
+
+    hemisphere_volume = (2/3) * (22/7) * radius**3
+    cone_volume = (1/3) * (22/7) * radius**2 * height
+    total_volume = hemisphere_volume + cone_volume
+    volume_text = (f"Total Volume = Hemisphere Volume + Cone Volume<br>"
+                   f"= ⅔πr³ + ⅓πr²h<br>"
+                   f"= ⅔ × ²²⁄₇ × {radius}³ + ⅓ × ²²⁄₇ × {radius}² × {height}<br>"
+                   f"= {hemisphere_volume:.2f} + {cone_volume:.2f}<br>"
+                   f"= {total_volume:.2f} cm³")
+
+    fig = go.Figure([
+        # Open hemisphere flipped below the cone's base
+        _solid_trace("hemisphere_shell", radius, -radius, resolution, "lightgreen", "Hemisphere"),
+        _solid_trace("cone_side", radius, height, resolution, "lightcoral", "Cone"),
+        _circle_trace(radius, 0, "blue", resolution),
+        _dimension_trace((0, 0, 0), (0, 0, height), f"h = {height}"),
+        _dimension_trace((0, 0, 0), (radius, 0, 0), f"r = {radius}"),
+    ])
+    return _finish(fig, f"<b>Cone on Hemisphere</b><br>Radius = {radius}, Height = {height} cm, "
+                        f"Slant Height = {slant_height:.2f} cm",
+                   volume_text, save_name)
+
+
+def create_2d_net(solid_type, params, save_name=None):
+    """
+    Creates 2D net diagrams for solids.
+    """
+    fig = go.Figure()
+    line = dict(color="black", width=2)
+
+    if solid_type == "cube":
+        side = params.get("side", 5)
+        faces = {"Base": (1, 1), "Top": (1, 2), "Bottom": (1, 0),
+                 "Left": (0, 1), "Right": (2, 1), "Back": (3, 1)}
+        for label, (col, row) in faces.items():
+            x0, y0 = col * side, row * side
+            fig.add_shape(type="rect", x0=x0, y0=y0, x1=x0 + side, y1=y0 + side, line=line)
+            fig.add_annotation(x=x0 + side / 2, y=y0 + side / 2, text=label, showarrow=False)
+        x_range, y_range = (-0.5, 4 * side + 0.5), (-0.5, 3 * side + 0.5)
+        title = f"<b>Net Diagram of Cube (side = {side})</b>"
+
+    elif solid_type == "cylinder":
+        radius = params.get("radius", 3)
+        height = params.get("height", 8)
+        rect_width = 2 * np.pi * radius
+        fig.add_shape(type="rect", x0=0, y0=radius, x1=rect_width, y1=radius + height, line=line)
+        fig.add_annotation(x=rect_width / 2, y=radius + height / 2,
+                           text="Curved Surface<br>(2πr × h)", showarrow=False)
+        for cx, label in ((rect_width / 4, "Base"), (3 * rect_width / 4, "Top")):
+            fig.add_shape(type="circle", x0=cx - radius, y0=-radius, x1=cx + radius, y1=radius, line=line)
+            fig.add_annotation(x=cx, y=0, text=label, showarrow=False)
+        x_range, y_range = (-radius - 1, rect_width + radius + 1), (-radius - 1, radius + height + 1)
+        title = f"<b>Net Diagram of Cylinder (r = {radius}, h = {height})</b>"
+
+    else:
+        x_range, y_range, title = (0, 1), (0, 1), f"<b>No net diagram for {solid_type}</b>"
+
+    fig.update_layout(
+        title=dict(text=title, x=0.5),
+        xaxis=dict(range=list(x_range), visible=False),
+        yaxis=dict(range=list(y_range), visible=False, scaleanchor="x", scaleratio=1),
+        plot_bgcolor="white", margin=dict(l=0, r=0, t=60, b=0), height=500,
+    )
+    if save_name:
+        save_path = os.path.join(os.path.dirname(__file__), "plots", save_name)
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        fig.write_html(save_path, include_plotlyjs="cdn")
+    return fig
@@ -0,0 +1,78 @@
+# File: chapters/chapter12_surface_areas_and_volumes/solid_measures.py
+
+# Use π = 22/7 for all calculations
+PI = 22/7
+
+def format_calculation(expression, value):
+    """Format calculation with π = 22/7."""
+    return f"{expression} = {value:.2f}"
+
+def calculate_areas(shape_type, params):
+    """Calculate areas and volumes for different shapes."""
+    if shape_type == "sphere":
+        radius = params["radius"]
+        volume = (4/3) * PI * radius**3
+        surface_area = 4 * PI * radius**2
+        return {
+            "Volume": f"⁴⁄₃πr³ = ⁴⁄₃ × ²²⁄₇ × {radius}³ = {volume:.2f} cm³",
+            "Surface Area": f"4πr² = 4 × ²²⁄₇ × {radius}² = {surface_area:.2f} cm²"
+        }
+    
+    elif shape_type == "hemisphere":
+        radius = params["radius"]
+        volume = (2/3) * PI * radius**3
+        csa = 2 * PI * radius**2
+        tsa = 3 * PI * radius**2
+        return {
+            "Volume": f"⅔πr³ = ⅔ × ²²⁄₇ × {radius}³ = {volume:.2f} cm³",
+            "Curved Surface Area": f"2πr² = 2 × ²²⁄₇ × {radius}² = {csa:.2f} cm²",
+            "Total Surface Area": f"3πr² = 3 × ²²⁄₇ × {radius}² = {tsa:.2f} cm²"
+        }
+    
+    elif shape_type == "cube":
+        side = params["side"]
+        volume = side**3
+        tsa = 6 * side**2
+        lsa = 4 * side**2
+        return {
+            "Volume": f"a³ = {side}³ = {volume:.2f} cm³",
+            "Total Surface Area": f"6a² = 6 × {side}² = {tsa:.2f} cm²",
+            "Lateral Surface Area": f"4a² = 4 × {side}² = {lsa:.2f} cm²"
+        }
+    
+    elif shape_type == "cuboid":
+        l, b, h = params["length"], params["breadth"], params["height"]
+        volume = l * b * h
+        tsa = 2 * (l*b + b*h + h*l)
+        lsa = 2 * h * (l + b)
+        return {
+            "Volume": f"l × b × h = {l} × {b} × {h} = {volume:.2f} cm³",
+            "Total Surface Area": f"2(lb + bh + hl) = 2({l}×{b} + {b}×{h} + {h}×{l}) = {tsa:.2f} cm²",
+            "Lateral Surface Area": f"2h(l + b) = 2×{h}({l} + {b}) = {lsa:.2f} cm²"
+        }
+    
+    elif shape_type == "cylinder":
+        r, h = params["radius"], params["height"]
+        volume = PI * r**2 * h
+        csa = 2 * PI * r * h
+        tsa = 2 * PI * r * (r + h)
+        return {
+            "Volume": f"πr²h = ²²⁄₇ × {r}² × {h} = {volume:.2f} cm³",
+            "Curved Surface Area": f"2πrh = 2 × ²²⁄₇ × {r} × {h} = {csa:.2f} cm²",
+            "Total Surface Area": f"2πr(r + h) = 2 × ²²⁄₇ × {r} × ({r} + {h}) = {tsa:.2f} cm²"
+        }
+    
+    elif shape_type == "cone":
+        r, h = params["radius"], params["height"]
+        l = (r**2 + h**2)**0.5  # slant height
+        volume = (1/3) * PI * r**2 * h
+        csa = PI * r * l
+        tsa = PI * r * (r + l)
+        return {
+            "Volume": f"⅓πr²h = ⅓ × ²²⁄₇ × {r}² × {h} = {volume:.2f} cm³",
+            "Curved Surface Area": f"πrl = ²²⁄₇ × {r} × {l:.2f} = {csa:.2f} cm²",
+            "Total Surface Area": f"πr(r + l) = ²²⁄₇ × {r} × ({r} + {l:.2f}) = {tsa:.2f} cm²",
+            "Slant Height": f"l = √(r² + h²) = √({r}² + {h}²) = {l:.2f} cm"
+        }
+    
+    return {}
@@ -0,0 +1,139 @@
+# File: chapters/chapter12_surface_areas_and_volumes/unit_meshes.py
+
+"""
+Unit meshes for the round solids (radius 1, height 1), built once per
+resolution level and shared by the matplotlib and Plotly renderers.
+A solid of any size is then just a multiply of the cached arrays.
+"""
+
+from functools import lru_cache
+import numpy as np
+
+# Points around each circle and along each curved profile
+RESOLUTIONS = {
+    "preview": {"segments": 40, "rings": 20},  # interactive views
+    "export": {"segments": 50, "rings": 50},   # saved / high-dpi images
+}
+
+SURFACE_KINDS = ("cylinder", "cone", "sphere", "hemisphere")
+MESH_KINDS = ("cylinder", "cone", "cone_side", "sphere", "hemisphere", "hemisphere_shell")
+
+
+def resolution_levels(resolution: str):
+    """(segments, rings) for a resolution name."""
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"Unknown resolution: {resolution}. Use one of {tuple(RESOLUTIONS)}")
+    level = RESOLUTIONS[resolution]
+    return level["segments"], level["rings"]
+
+
+def _frozen(*arrays):
+    """Cached arrays are shared between calls, so make them read-only."""
+    for array in arrays:
+        array.setflags(write=False)
+    return arrays
+
+
+@lru_cache(maxsize=None)
+def unit_circle(resolution: str = "export"):
+    """(cos θ, sin θ) around a closed circle of radius 1."""
+    segments, _ = resolution_levels(resolution)
+    theta = np.linspace(0, 2 * np.pi, segments)
+    return _frozen(np.cos(theta), np.sin(theta))
+
+
+@lru_cache(maxsize=None)
+def unit_surface_grid(kind: str, resolution: str = "export"):
+    """
+    (X, Y, Z) grids for ax.plot_surface. The cylinder and cone have radius 1 and
+    height 1; the sphere and hemisphere have radius 1.
+    """
+    segments, rings = resolution_levels(resolution)
+    if kind in ("cylinder", "cone"):
+        theta = np.linspace(0, 2 * np.pi, segments)
+        z = np.linspace(0, 1, rings)
+        if kind == "cone":
+            # rows run around the circle, columns up the side, as plot_cone always drew it
+            z_grid, theta_grid = np.meshgrid(z, theta)
+            r_grid = 1 - z_grid
+        else:
+            theta_grid, z_grid = np.meshgrid(theta, z)
+            r_grid = np.ones_like(z_grid)
+        return _frozen(r_grid * np.cos(theta_grid), r_grid * np.sin(theta_grid), z_grid)
+    if kind in ("sphere", "hemisphere"):
+        u = np.linspace(0, 2 * np.pi, segments)
+        v = np.linspace(0, np.pi / 2, rings // 2) if kind == "hemisphere" else np.linspace(0, np.pi, rings)
+        return _frozen(np.outer(np.cos(u), np.sin(v)),
+                       np.outer(np.sin(u), np.sin(v)),
+                       np.outer(np.ones(segments), np.cos(v)))
+    raise ValueError(f"Unknown surface: {kind}. Use one of {SURFACE_KINDS}")
+
+
+def revolution_mesh(radii, heights, segments):
+    """
+    Triangulate the surface swept by rotating the profile (radii[k], heights[k])
+    around the z-axis. Returns (x, y, z, i, j, k) for go.Mesh3d.
+    """
+    radii = np.asarray(radii, dtype=float)
+    heights = np.asarray(heights, dtype=float)
+    theta = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+
+    x = np.outer(radii, np.cos(theta)).ravel()
+    y = np.outer(radii, np.sin(theta)).ravel()
+    z = np.repeat(heights, segments)
+
+    # Two triangles per quad between consecutive rings
+    ring = np.arange(len(radii) - 1)[:, None] * segments
+    col = np.arange(segments)[None, :]
+    a = (ring + col).ravel()
+    b = (ring + (col + 1) % segments).ravel()
+    c = a + segments
+    d = b + segments
+    return x, y, z, np.concatenate([a, b]), np.concatenate([b, d]), np.concatenate([c, c])
+
+
+def _profile(kind: str, rings: int):
+    """(radii, heights) of the unit profile rotated to make each solid."""
+    if kind == "cylinder":
+        return [0, 1, 1, 0], [0, 0, 1, 1]
+    if kind == "cone":
+        return [0, 1, 0], [0, 0, 1]
+    if kind == "cone_side":
+        return [1, 0], [0, 1]
+    if kind == "sphere":
+        v = np.linspace(0, np.pi, rings + 1)
+        return np.sin(v), np.cos(v)
+    if kind in ("hemisphere", "hemisphere_shell"):
+        v = np.linspace(0, np.pi / 2, rings // 2 + 1)
+        radii, heights = np.sin(v), np.cos(v)
+        if kind == "hemisphere":
+            # close the flat base
+            radii, heights = np.append(radii, 0), np.append(heights, 0)
+        return radii, heights
+    raise ValueError(f"Unknown mesh: {kind}. Use one of {MESH_KINDS}")
+
+
+@lru_cache(maxsize=None)
+def unit_triangle_mesh(kind: str, resolution: str = "preview"):
+    """Cached (x, y, z, i, j, k) triangle mesh of a unit solid."""
+    segments, rings = resolution_levels(resolution)
+    radii, heights = _profile(kind, rings)
+    return _frozen(*revolution_mesh(radii, heights, segments))
+
+
+def scale_grid(grid, radius, height):
+    """Scale a unit surface grid: x and y by the radius, z by the height."""
+    x, y, z = grid
+    return x * radius, y * radius, z * height
+
+
+def scale_mesh(mesh, radius, height):
+    """Scale a unit triangle mesh; the triangle indices are shared unchanged."""
+    x, y, z, i, j, k = mesh
+    return x * radius, y * radius, z * height, i, j, k
+
+
+def circle(radius, resolution: str = "export"):
+    """(x, y) points around a closed circle."""
+    cos_t, sin_t = unit_circle(resolution)
+    return cos_t * radius, sin_t * radius
@@ -1,8 +1,50 @@
 # File: chapters/chapter1_real_numbers/main_router.py
 
-import re
-import math
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple
+from utils.keyword_matcher import KeywordMatcher
+from utils.query_tokens import register, tokenize
+
+PROOF_FILLER_WORDS = register(
+    "irrational.query_filler", r'\b(prove|show|that|is|irrational|rational|whether|check|test)\b'
+)
+
+# Keyword tables per query type
+QUERY_KEYWORDS = {
+    "hcf_lcm": [
+        "hcf and lcm", "lcm and hcf", "highest common factor and least common multiple",
+        "gcd and lcm", "both hcf lcm", "find hcf lcm"
+    ],
+    "irrationality_proof": [
+        "irrational", "prove irrational", "show irrational", "is irrational",
+        "irrationality proof", "rational or irrational", "√", "root", "square root"
+    ],
+    "euclidean_algorithm": [
+        "euclidean algorithm", "euclidean method", "division algorithm"
+    ],
+    "hcf_only": [
+        "hcf", "highest common factor", "gcd", "greatest common divisor",
+        "common factor", "euclidean algorithm"
+    ],
+    "lcm_only": [
+        "lcm", "least common multiple", "lowest common multiple", "common multiple"
+    ],
+    "prime_factorization": [
+        "prime factorization", "prime factors", "factorize", "factor",
+        "prime decomposition", "fundamental theorem"
+    ],
+    # Not a query type: asks for Bézout coefficients with the Euclidean algorithm
+    "extended_euclid": ["extended", "bezout", "bézout"],
+}
+
+# When several tables match, the first query type in this order wins
+QUERY_TYPE_ORDER = (
+    "hcf_lcm", "irrationality_proof", "euclidean_algorithm", "hcf_only", "lcm_only", "prime_factorization"
+)
+
+QUERY_KEYWORD_MATCHER = KeywordMatcher(QUERY_KEYWORDS)
+
+# Euclid on huge inputs can take thousands of divisions; show the first and last ones
+MAX_EUCLID_STEPS = 40
 
 # Import solvers with error handling
 try:
@@ -63,60 +105,20 @@ def parse_real_numbers_query(query: str) -> Tuple[str, Dict[str, Any]]:
     # Extract numbers from the query
     numbers = extract_numbers(query)
     
-    # HCF/LCM patterns
-    hcf_lcm_keywords = [
-        "hcf and lcm", "lcm and hcf", "highest common factor and least common multiple",
-        "gcd and lcm", "both hcf lcm", "find hcf lcm"
-    ]
+    # One pass over the query finds the hits of every keyword table
+    hits = QUERY_KEYWORD_MATCHER.scan(query)
+    query_type = hits.first(QUERY_TYPE_ORDER)
     
-    # HCF only patterns
-    hcf_keywords = [
-        "hcf", "highest common factor", "gcd", "greatest common divisor",
-        "common factor", "euclidean algorithm"
-    ]
-    
-    # LCM only patterns
-    lcm_keywords = [
-        "lcm", "least common multiple", "lowest common multiple", "common multiple"
-    ]
-    
-    # Irrationality patterns
-    irrationality_keywords = [
-        "irrational", "prove irrational", "show irrational", "is irrational",
-        "irrationality proof", "rational or irrational", "√", "root", "square root"
-    ]
-    
-    # Prime factorization patterns
-    prime_factorization_keywords = [
-        "prime factorization", "prime factors", "factorize", "factor",
-        "prime decomposition", "fundamental theorem"
-    ]
-    
-    # Euclidean algorithm patterns
-    euclidean_keywords = [
-        "euclidean algorithm", "euclidean method", "division algorithm"
-    ]
-    
-    # Determine query type based on keywords
-    if any(keyword in query for keyword in hcf_lcm_keywords):
-        return "hcf_lcm", {"numbers": numbers}
-    
-    elif any(keyword in query for keyword in irrationality_keywords):
+    if query_type == "irrationality_proof":
         # Extract expression for irrationality proof
         expression = extract_irrationality_expression(query)
         return "irrationality_proof", {"expression": expression}
     
-    elif any(keyword in query for keyword in euclidean_keywords):
-        return "euclidean_algorithm", {"numbers": numbers}
-    
-    elif any(keyword in query for keyword in hcf_keywords):
-        return "hcf_only", {"numbers": numbers}
-    
-    elif any(keyword in query for keyword in lcm_keywords):
-        return "lcm_only", {"numbers": numbers}
+    elif query_type == "euclidean_algorithm":
+        return "euclidean_algorithm", {"numbers": numbers, "extended": "extended_euclid" in hits}
     
-    elif any(keyword in query for keyword in prime_factorization_keywords):
-        return "prime_factorization", {"numbers": numbers}
+    elif query_type:
+        return query_type, {"numbers": numbers}
     
     # Auto-detect based on numbers and context
     elif len(numbers) >= 2:
@@ -133,15 +135,13 @@ def parse_real_numbers_query(query: str) -> Tuple[str, Dict[str, Any]]:
         return "unknown", {}
 
 def extract_numbers(text: str) -> List[float]:
-    """Extract all numbers from text."""
-    pattern = r'\b\d+\.?\d*\b'
-    matches = re.findall(pattern, text)
-    return [float(match) for match in matches]
+    """Extract all numbers from text; whole numbers stay exact ints (no float rounding above 2^53)."""
+    return list(tokenize(text).numbers)
 
 def extract_irrationality_expression(query: str) -> str:
     """Extract the mathematical expression for irrationality proof."""
     # Remove common words but keep mathematical symbols
-    expression = re.sub(r'\b(prove|show|that|is|irrational|rational|whether|check|test)\b', '', query)
+    expression = PROOF_FILLER_WORDS.sub('', query)
     expression = expression.strip()
     
     # If empty after cleaning, return original query
@@ -188,10 +188,11 @@ def handle_prime_factorization(params: Dict[str, Any]) -> str:
     if num <= 1:
         return "❌ Please provide a number greater than 1 for prime factorization."
     
-    from chapters.chapter1_real_numbers.sub_chapters.hcf_lcm.solver_hcf_lcm import prime_factors, format_prime_factors, factor_counter
+    from chapters.chapter1_real_numbers.sub_chapters.hcf_lcm.solver_hcf_lcm import format_prime_factors, factor_counter
     
-    factors = prime_factors(num)
+    # Factorize once; the flat list is expanded from the counts
     factor_count = factor_counter(num)
+    factors = [prime for prime in sorted(factor_count) for _ in range(factor_count[prime])]
     
     result = f"""
 ✅ **Prime Factorization of {num}**
@@ -226,7 +227,7 @@ def handle_euclidean_algorithm(params: Dict[str, Any]) -> str:
     
     from chapters.chapter1_real_numbers.sub_chapters.hcf_lcm.solver_hcf_lcm import euclidean_algorithm_steps
     
-    return euclidean_algorithm_steps(a, b)
+    return euclidean_algorithm_steps(a, b, max_steps=MAX_EUCLID_STEPS, extended=params.get("extended", False))
 
 def generate_help_message(original_query: str) -> str:
     """Generate helpful message with examples."""
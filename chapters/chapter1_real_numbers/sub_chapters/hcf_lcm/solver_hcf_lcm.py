@@ -1,27 +1,29 @@
 # File: chapters/chapter1_real_numbers/sub_chapters/hcf_lcm/solver_hcf_lcm.py
 
-from collections import Counter
-from math import gcd
+from collections import Counter, deque
+from math import gcd, lcm as math_lcm
 from functools import reduce
+import csv
+import io
+import numbers
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+import numpy as np
+from utils.prime_factorization import factorize, prime_factor_list
+
+# np.gcd works on int64; pairs below this bound also keep a // hcf * b inside int64
+NUMPY_PAIR_LIMIT = 2**31
+
+# Signed integers and decimals; a '-' straight after a digit ("12-18") separates, it is not a sign
+NUMBER_TOKEN = re.compile(r'(?<![\d.])[-+]?\d+(?:\.\d+)?')
 
 def prime_factors(n):
-    """Get prime factors of a number."""
-    i = 2
-    factors = []
-    while i * i <= n:
-        while n % i == 0:
-            factors.append(i)
-            n = n // i
-        i += 1
-    if n > 1:
-        factors.append(n)
-    return factors
+    """Get prime factors of a number (sieve / Pollard's rho, memoized)."""
+    return prime_factor_list(n)
 
 def factor_counter(n):
     """Count occurrences of each prime factor."""
-    return Counter(prime_factors(n))
+    return Counter(dict(factorize(n)))
 
 def get_hcf_lcm(a, b):
     """Calculate HCF and LCM using prime factorization."""
@@ -42,6 +44,108 @@ def get_hcf_lcm(a, b):
 
     return hcf, lcm, fa, fb
 
+class HcfLcmResult(NamedTuple):
+    """HCF and LCM of one group of numbers; the worked solution is only built when asked for."""
+    numbers: Tuple[int, ...]
+    hcf: int
+    lcm: int
+
+    def steps(self, method: str = "prime_factorization") -> str:
+        """Step-by-step markdown, by prime factorization or (for two numbers) Euclid's algorithm."""
+        if method == "euclidean" and len(self.numbers) == 2:
+            return euclidean_algorithm_steps(*self.numbers)
+        if len(self.numbers) == 2:
+            return explain_hcf_lcm_detailed(*self.numbers)
+        return explain_hcf_lcm_multiple(list(self.numbers))
+
+class InvalidGroup(NamedTuple):
+    """A worksheet line that cannot be solved; the answer key shows the reason instead of an answer."""
+    numbers: Tuple
+    error: str
+
+    def steps(self, method: str = "prime_factorization") -> str:
+        return f"❌ {self.error}"
+
+def _as_integer(n) -> int:
+    """n as a Python int; 12 and 12.0 are accepted, 12.7 is rejected rather than truncated."""
+    if isinstance(n, numbers.Integral) and not isinstance(n, bool):
+        return int(n)
+    if isinstance(n, numbers.Real) and float(n).is_integer():
+        return int(n)
+    raise ValueError(f"Only whole numbers are allowed, got {n!r}")
+
+def _validate_group(numbers: Iterable) -> Tuple[int, ...]:
+    group = tuple(_as_integer(n) for n in numbers)
+    if len(group) < 2:
+        raise ValueError(f"Need at least 2 numbers, got {list(group)}")
+    if any(n <= 0 for n in group):
+        raise ValueError(f"Only positive integers are allowed, got {list(group)}")
+    return group
+
+def hcf_lcm_of(numbers: Iterable[int]) -> HcfLcmResult:
+    """HCF and LCM of any number of integers in one C-level call each."""
+    group = _validate_group(numbers)
+    return HcfLcmResult(group, gcd(*group), math_lcm(*group))
+
+def hcf_lcm_many(groups: Iterable[Sequence[int]]) -> List[HcfLcmResult]:
+    """
+    HCF and LCM for many independent groups (e.g. a worksheet of pairs).
+    When every group is a pair of moderate size, all pairs are solved at once with np.gcd.
+    """
+    groups = [_validate_group(group) for group in groups]
+    if groups and all(len(group) == 2 for group in groups) and max(map(max, groups)) < NUMPY_PAIR_LIMIT:
+        pairs = np.asarray(groups, dtype=np.int64)
+        hcfs = np.gcd(pairs[:, 0], pairs[:, 1])
+        lcms = pairs[:, 0] // hcfs * pairs[:, 1]
+        return list(map(HcfLcmResult, groups, hcfs.tolist(), lcms.tolist()))
+    # Groups of three or more, or values where int64 could overflow: exact Python ints
+    return [HcfLcmResult(group, gcd(*group), math_lcm(*group)) for group in groups]
+
+def hcf_lcm_worksheet(groups: Iterable[Sequence]) -> List[Union[HcfLcmResult, InvalidGroup]]:
+    """
+    hcf_lcm_many for a worksheet: a group with a zero, negative or fractional
+    number becomes an InvalidGroup in its place instead of failing the batch.
+    """
+    checked = []
+    for group in groups:
+        try:
+            checked.append(_validate_group(group))
+        except ValueError as e:
+            checked.append(InvalidGroup(tuple(group), str(e)))
+    solved = iter(hcf_lcm_many([group for group in checked if not isinstance(group, InvalidGroup)]))
+    return [group if isinstance(group, InvalidGroup) else next(solved) for group in checked]
+
+def parse_number_groups(text: str) -> List[List[Union[int, float]]]:
+    """
+    One group per non-empty line, numbers separated by commas, spaces or 'and': '12, 18' or '12 and 18'.
+    Signs and decimals are kept ('-12', '2.5') so validation can reject them instead of misreading them.
+    """
+    return [[float(token) if "." in token else int(token) for token in NUMBER_TOKEN.findall(line)]
+            for line in text.splitlines() if re.search(r'\d', line)]
+
+def format_answer_key(results: List[Union[HcfLcmResult, InvalidGroup]]) -> str:
+    """Markdown answer key table for a batch of results."""
+    rows = ["| # | Numbers | HCF | LCM |", "|---|---|---|---|"]
+    for i, result in enumerate(results, 1):
+        numbers = ', '.join(map(str, result.numbers))
+        if isinstance(result, InvalidGroup):
+            rows.append(f"| {i} | {numbers} | ❌ {result.error} | — |")
+        else:
+            rows.append(f"| {i} | {numbers} | {result.hcf} | {result.lcm} |")
+    return "\n".join(rows)
+
+def answer_key_csv(results: List[Union[HcfLcmResult, InvalidGroup]]) -> str:
+    """CSV answer key (question number, numbers, HCF, LCM) for download; an invalid line has its reason as the HCF."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["question", "numbers", "hcf", "lcm"])
+    for i, result in enumerate(results, 1):
+        if isinstance(result, InvalidGroup):
+            writer.writerow([i, " ".join(map(str, result.numbers)), f"❌ {result.error}", ""])
+            continue
+        writer.writerow([i, " ".join(map(str, result.numbers)), result.hcf, result.lcm])
+    return buffer.getvalue()
+
 def solve_hcf_lcm(params: Dict[str, Any]) -> str:
     """
     Main solver for HCF and LCM problems.
@@ -177,18 +281,8 @@ def solve_hcf_lcm_multiple_numbers(numbers: List[int]) -> str:
     if len(numbers) < 2:
         return "❌ Need at least 2 numbers"
     
-    # Calculate HCF of all numbers
-    overall_hcf = numbers[0]
-    for num in numbers[1:]:
-        overall_hcf = gcd(overall_hcf, num)
-    
-    # Calculate LCM of all numbers
-    def lcm(a, b):
-        return abs(a * b) // gcd(a, b)
-    
-    overall_lcm = numbers[0]
-    for num in numbers[1:]:
-        overall_lcm = lcm(overall_lcm, num)
+    result = hcf_lcm_of(numbers)
+    overall_hcf, overall_lcm = result.hcf, result.lcm
     
     result = f"""
 ✅ **HCF and LCM of {len(numbers)} numbers: {', '.join(map(str, numbers))}**
@@ -238,9 +332,7 @@ def find_hcf_only(numbers: List[int]) -> str:
         return euclidean_algorithm_steps(a, b)
     else:
         # Multiple numbers
-        result_hcf = numbers[0]
-        for num in numbers[1:]:
-            result_hcf = gcd(result_hcf, num)
+        result_hcf = gcd(*numbers)
         
         return f"""
 ✅ **HCF of {', '.join(map(str, numbers))} = {result_hcf}**
@@ -251,39 +343,98 @@ def find_hcf_only(numbers: List[int]) -> str:
 • Continue until all numbers are processed
 """
 
-def euclidean_algorithm_steps(a, b) -> str:
+class EuclidStep(NamedTuple):
+    """One division dividend = divisor × quotient + remainder, with remainder = x·a + y·b."""
+    number: int
+    dividend: int
+    divisor: int
+    quotient: int
+    remainder: int
+    x: int
+    y: int
+
+def iter_euclidean_steps(a: int, b: int) -> Iterator[EuclidStep]:
+    """
+    Yield the divisions of Euclid's algorithm one at a time, tracking the
+    Bézout coefficients of every remainder in the same pass (extended Euclid).
+    """
+    r0, r1 = int(a), int(b)
+    x0, y0, x1, y1 = 1, 0, 0, 1
+    number = 1
+    while r1 != 0:
+        quotient, remainder = divmod(r0, r1)
+        x0, y0, x1, y1 = x1, y1, x0 - quotient * x1, y0 - quotient * y1
+        yield EuclidStep(number, r0, r1, quotient, remainder, x1, y1)
+        r0, r1 = r1, remainder
+        number += 1
+
+def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
+    """(g, x, y) with g = HCF(a, b) = a·x + b·y."""
+    g, x, y = int(a), 1, 0
+    divisor_x, divisor_y = 0, 1
+    for step in iter_euclidean_steps(a, b):
+        if step.remainder == 0:
+            # The last non-zero divisor is the HCF
+            g, x, y = step.divisor, divisor_x, divisor_y
+        divisor_x, divisor_y = step.x, step.y
+    return g, x, y
+
+def _format_euclid_step(step: EuclidStep, a: int, b: int, extended: bool) -> str:
+    line = f"Step {step.number}: {step.dividend} = {step.divisor} × {step.quotient} + {step.remainder}"
+    if extended and step.remainder:
+        line += f"  →  {step.remainder} = {a} × ({step.x}) + {b} × ({step.y})"
+    return line
+
+def iter_euclidean_lines(a: int, b: int, max_steps: Optional[int] = None,
+                         extended: bool = False) -> Iterator[str]:
+    """
+    Markdown lines of the Euclidean algorithm, produced as the divisions happen.
+    With max_steps, only the first and last steps are shown and the middle is
+    summarised; the last ones are kept in a bounded buffer, never the full list.
+    """
+    a, b = int(a), int(b)
+    yield f"**Finding HCF of {a} and {b} using Euclidean Algorithm:**"
+    yield ""
+
+    head = (max_steps + 1) // 2 if max_steps else None
+    tail = deque(maxlen=max_steps - head if max_steps else 0)
+    g, x, y, total = a, 1, 0, 0
+    divisor_x, divisor_y = 0, 1
+    for step in iter_euclidean_steps(a, b):
+        total = step.number
+        if step.remainder == 0:
+            g, x, y = step.divisor, divisor_x, divisor_y
+        divisor_x, divisor_y = step.x, step.y
+        if head is None or step.number <= head:
+            yield _format_euclid_step(step, a, b, extended)
+        else:
+            tail.append(step)
+
+    if head is not None and total > head + len(tail):
+        omitted = total - head - len(tail)
+        span = f"Step {head + 1}" if omitted == 1 else f"Steps {head + 1}–{head + omitted}"
+        yield f"⋮ *{span} omitted ({omitted} more division{'s' if omitted != 1 else ''})*"
+    for step in tail:
+        yield _format_euclid_step(step, a, b, extended)
+
+    yield ""
+    yield f"✅ **HCF({a}, {b}) = {g}**"
+    if extended:
+        yield f"🔁 **Bézout identity:** {g} = {a} × ({x}) + {b} × ({y})"
+
+def euclidean_algorithm_steps(a, b, max_steps: Optional[int] = None, extended: bool = False) -> str:
     """Show Euclidean algorithm steps for HCF."""
-    original_a, original_b = a, b
-    steps = []
-    
-    steps.append(f"**Finding HCF of {a} and {b} using Euclidean Algorithm:**")
-    steps.append("")
-    
-    step_num = 1
-    while b != 0:
-        quotient = a // b
-        remainder = a % b
-        steps.append(f"Step {step_num}: {a} = {b} × {quotient} + {remainder}")
-        a, b = b, remainder
-        step_num += 1
-    
-    steps.append("")
-    steps.append(f"✅ **HCF({original_a}, {original_b}) = {a}**")
-    
-    return "\n".join(steps)
+    return "\n".join(iter_euclidean_lines(a, b, max_steps, extended))
 
 def find_lcm_only(numbers: List[int]) -> str:
     """Find only LCM with detailed steps."""
     if len(numbers) < 2:
         return "❌ Need at least 2 numbers"
     
-    def lcm(a, b):
-        return abs(a * b) // gcd(a, b)
-    
     if len(numbers) == 2:
         a, b = numbers[0], numbers[1]
         hcf = gcd(a, b)
-        lcm_result = lcm(a, b)
+        lcm_result = math_lcm(a, b)
         
         return f"""
 ✅ **LCM of {a} and {b}**
@@ -296,9 +447,7 @@ def find_lcm_only(numbers: List[int]) -> str:
 • **LCM = {lcm_result}**
 """
     else:
-        result_lcm = numbers[0]
-        for num in numbers[1:]:
-            result_lcm = lcm(result_lcm, num)
+        result_lcm = math_lcm(*numbers)
         
         return f"""
 ✅ **LCM of {', '.join(map(str, numbers))} = {result_lcm}**
@@ -0,0 +1,92 @@
+# File: chapters/chapter1_real_numbers/sub_chapters/hcf_lcm/test_solver_hcf_lcm.py
+
+import sys
+import os
+import math
+import random
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.abspath(__file__), "../../../../.."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from chapters.chapter1_real_numbers.main_router import route_query
+from chapters.chapter1_real_numbers.sub_chapters.hcf_lcm.solver_hcf_lcm import (
+    hcf_lcm_of, hcf_lcm_many, hcf_lcm_worksheet, InvalidGroup, parse_number_groups, format_answer_key,
+    answer_key_csv,
+    iter_euclidean_steps, extended_gcd, euclidean_algorithm_steps
+)
+
+
+def test_hcf_lcm_with_large_numbers():
+    result = route_query("find hcf and lcm of 600851475143 and 1000000000000000000")
+    assert "HCF = 1**" in result
+    assert "LCM = 600851475143000000000000000000**" in result
+
+
+def test_hcf_lcm_batch_and_answer_key():
+    assert hcf_lcm_of([12, 18, 30]) == ((12, 18, 30), 6, 180)
+    groups = parse_number_groups("12, 18\n\n1071 and 462\n24 36 48")
+    assert groups == [[12, 18], [1071, 462], [24, 36, 48]]
+    results = hcf_lcm_many(groups)
+    assert [(r.hcf, r.lcm) for r in results] == [(6, 36), (21, 23562), (12, 144)]
+    # All pairs (np.gcd) and beyond int64 (Python ints) agree with hcf_lcm_of
+    pairs = [(12, 18), (10**15, 10**15 - 2), (2**62, 3**39)]
+    assert hcf_lcm_many(pairs) == [hcf_lcm_of(pair) for pair in pairs]
+    assert hcf_lcm_many([(12.0, 18)])[0].numbers == (12, 18)
+    for bad in ([(12.7, 18)], [(0, 5)], [(7,)]):
+        try:
+            hcf_lcm_many(bad)
+            assert False, bad
+        except ValueError:
+            pass
+
+    assert format_answer_key(results[:1]).splitlines()[-1] == "| 1 | 12, 18 | 6 | 36 |"
+    assert answer_key_csv(results[:2]).splitlines() == [
+        "question,numbers,hcf,lcm", "1,12 18,6,36", "2,1071 462,21,23562"
+    ]
+
+
+def test_worksheet_reports_bad_lines_in_the_answer_key():
+    groups = parse_number_groups("-12, 18\n2.5, 4\n12-18\n2.0 and 4\n7")
+    assert groups == [[-12, 18], [2.5, 4], [12, 18], [2.0, 4], [7]]
+    results = hcf_lcm_worksheet(groups)
+    assert [isinstance(r, InvalidGroup) for r in results] == [True, True, False, False, True]
+    assert results[2] == hcf_lcm_of([12, 18]) and results[3] == hcf_lcm_of([2, 4])
+    assert "positive" in results[0].error and "whole numbers" in results[1].error
+
+    key = format_answer_key(results).splitlines()
+    assert key[2].startswith("| 1 | -12, 18 | ❌ ") and key[2].endswith(" | — |")
+    assert key[3].startswith("| 2 | 2.5, 4 | ❌ Only whole numbers")
+    assert key[4] == "| 3 | 12, 18 | 6 | 36 |"
+    assert answer_key_csv(results).splitlines()[3] == "3,12 18,6,36"
+    assert results[4].steps().startswith("❌ Need at least 2 numbers")
+
+
+def test_euclid_steps_bezout_and_step_cap():
+    steps = list(iter_euclidean_steps(1071, 462))
+    assert [(s.dividend, s.divisor, s.quotient, s.remainder) for s in steps] == [
+        (1071, 462, 2, 147), (462, 147, 3, 21), (147, 21, 7, 0)
+    ]
+    assert all(s.remainder == 1071 * s.x + 462 * s.y for s in steps)
+
+    rng = random.Random(14)
+    for a, b in [(7, 0), (0, 7), (1071, 462)] + [(rng.randrange(10**29, 10**30), rng.randrange(1, 10**30))
+                                                  for _ in range(200)]:
+        g, x, y = extended_gcd(a, b)
+        assert g == math.gcd(a, b) and a * x + b * y == g
+
+    # 89, 55 takes 9 divisions; with max_steps=4 the first and last two are shown
+    lines = euclidean_algorithm_steps(89, 55, max_steps=4, extended=True).splitlines()
+    shown = [line.split(":")[0] for line in lines if line.startswith("Step")]
+    assert shown == ["Step 1", "Step 2", "Step 8", "Step 9"]
+    assert "⋮ *Steps 3–7 omitted (5 more divisions)*" in lines
+    assert lines[-1] == "🔁 **Bézout identity:** 1 = 89 × (-21) + 55 × (34)"
+    full = euclidean_algorithm_steps(89, 55)
+    assert sum(line.startswith("Step") for line in full.splitlines()) == 9 and "omitted" not in full
+
+
+if __name__ == "__main__":
+    test_hcf_lcm_with_large_numbers()
+    test_hcf_lcm_batch_and_answer_key()
+    test_worksheet_reports_bad_lines_in_the_answer_key()
+    test_euclid_steps_bezout_and_step_cap()
+    print("All HCF and LCM solver tests passed")
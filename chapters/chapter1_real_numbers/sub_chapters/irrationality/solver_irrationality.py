@@ -1,7 +1,16 @@
 # File: chapters/chapter1_real_numbers/sub_chapters/irrationality/solver_irrationality.py
 
-import re
 from typing import Dict, Any
+from utils.query_tokens import register
+
+# Normalisation applied before the expression forms are matched
+ROOT_SPACE = register("irrational.root_space", r"[√\u221a]\s+(\d+)")
+NON_MATH_CHARS = register("irrational.non_math", r"[^√0-9+\-*/^=()./ ]")
+WHITESPACE = register("irrational.whitespace", r"\s+")
+FILLER_WORDS = register(
+    "irrational.filler",
+    r"\b(prove|is|irrational|rational|that|the|of|number|an|a|whether|show|check|test|if|then)\b"
+)
 
 def solve_irrationality_proof(params: Dict[str, Any]) -> str:
     """
@@ -25,62 +34,22 @@ def prove_irrationality_detailed(value) -> str:
     
     # Clean and normalize the input
     query = str(value).lower().replace("root", "√")
-    query = re.sub(r"[√\u221a]\s+(\d+)", r"√\1", query)  # remove space between √ and number
-    query = re.sub(r"[^√0-9+\-*/^=()./ ]", " ", query)
-    query = re.sub(r"\s+", " ", query).strip()
+    query = ROOT_SPACE.sub(r"√\1", query)  # remove space between √ and number
+    query = NON_MATH_CHARS.sub(" ", query)
+    query = WHITESPACE.sub(" ", query).strip()
     
     # Remove irrelevant words
-    query = re.sub(r"\b(prove|is|irrational|rational|that|the|of|number|an|a|whether|show|check|test|if|then)\b", "", query)
-    query = re.sub(r"\s+", " ", query).strip()
-    
-    # Pattern matching for different types of expressions
-    
-    # √n ± k patterns
-    match_root_n_offset = re.search(r"√(\d+)\s*([\-+])\s*(\d+)", query)
-    match_root_offset_alt = re.search(r"(\d+)\s*([\-+])\s*√(\d+)", query)
-    
-    # a + b√n patterns
-    match_a_brootn = re.search(r"(\d+)\s*\+\s*(\d+)\s*√(\d+)", query)
-    
-    # r√n patterns
-    match_r_root_n = re.search(r"(\d+)\s*\*?\s*√(\d+)", query)
-    
-    # √n only
-    match_root_only = re.search(r"[√\u221a](\d+)", query)
-    
-    # √n ± √m patterns
-    match_root_diff = re.search(r"√(\d+)\s*([+-])\s*√(\d+)", query)
-    
-    # 1/√n patterns
-    match_one_by_root = re.search(r"1\s*/\s*√(\d+)", query)
-    
-    # k ± √n patterns
-    match_k_rootn = re.search(r"(\d+)\s*([+-])\s*√(\d+)", query)
-    
-    # 1/(k ± √n) patterns
-    match_one_by_k_rootn = re.search(r"1\s*/\s*\(\s*(\d+)\s*([+-])\s*√(\d+)\s*\)", query)
+    query = FILLER_WORDS.sub("", query)
+    query = WHITESPACE.sub(" ", query).strip()
     
-    # Process patterns (most specific first)
-    if match_root_n_offset:
-        return prove_root_plus_minus_constant(match_root_n_offset)
-    elif match_a_brootn:
-        return prove_linear_combination(match_a_brootn)
-    elif match_r_root_n:
-        return prove_coefficient_times_root(match_r_root_n)
-    elif match_root_offset_alt:
-        return prove_constant_plus_root(match_root_offset_alt)
-    elif match_root_diff:
-        return prove_root_sum_difference(match_root_diff)
-    elif match_one_by_root:
-        return prove_reciprocal_root(match_one_by_root)
-    elif match_k_rootn:
-        return prove_constant_plus_minus_root(match_k_rootn)
-    elif match_one_by_k_rootn:
-        return prove_reciprocal_linear_combination(match_one_by_k_rootn)
-    elif match_root_only:
-        return prove_simple_root(match_root_only)
-    else:
-        return """
+    # Every supported form contains a √; otherwise there is nothing to match.
+    # Forms are tried most specific first and scanning stops at the first hit.
+    if "√" in query:
+        for pattern, prove in EXPRESSION_FORMS:
+            match = pattern.search(query)
+            if match:
+                return prove(match)
+    return """
 ❌ **Could not parse the expression.**
 
 💡 **Supported formats:**
@@ -472,4 +441,19 @@ def prove_irrationality_from_query(query: str) -> str:
     """
     Extract expression from query and prove its irrationality.
     """
-    return prove_irrationality_detailed(query)
\ No newline at end of file
+    return prove_irrationality_detailed(query)
+
+# Expression forms in priority order (most specific first), with their provers.
+# "k ± √n" is matched by the "k + √n" form above it; prove_constant_plus_minus_root
+# is kept for direct callers.
+EXPRESSION_FORMS = [
+    (register("irrational.root_plus_k", r"√(\d+)\s*([\-+])\s*(\d+)"), prove_root_plus_minus_constant),
+    (register("irrational.a_plus_b_root", r"(\d+)\s*\+\s*(\d+)\s*√(\d+)"), prove_linear_combination),
+    (register("irrational.r_root", r"(\d+)\s*\*?\s*√(\d+)"), prove_coefficient_times_root),
+    (register("irrational.k_plus_root", r"(\d+)\s*([\-+])\s*√(\d+)"), prove_constant_plus_root),
+    (register("irrational.root_plus_root", r"√(\d+)\s*([+-])\s*√(\d+)"), prove_root_sum_difference),
+    (register("irrational.one_over_root", r"1\s*/\s*√(\d+)"), prove_reciprocal_root),
+    (register("irrational.one_over_k_plus_root", r"1\s*/\s*\(\s*(\d+)\s*([+-])\s*√(\d+)\s*\)"),
+     prove_reciprocal_linear_combination),
+    (register("irrational.root", r"[√\u221a](\d+)"), prove_simple_root),
+]
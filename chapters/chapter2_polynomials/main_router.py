@@ -3,6 +3,7 @@ import json
 from utils.sanitizer import sanitize_expression
 from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.solver_factoring import factor_polynomial
 from chapters.chapter2_polynomials.interpret_query_polynomial import interpret_query_polynomial
+from intent_classifier import interpret_with_fallback
 
 def load_logic_template(intent: str):
     path = os.path.join(os.path.dirname(__file__), 'logic_templates', f'{intent}.json')
@@ -11,15 +12,35 @@ def load_logic_template(intent: str):
             return json.load(f)
     return None
 
+def extract_expression(query: str):
+    """Return the longest polynomial-looking fragment of the query, or None."""
+    import re
+    # Look for polynomial patterns
+    pattern = r'[x\d\s\+\-\*\^]+'
+    matches = [m.strip() for m in re.findall(pattern, query)]
+    # Take the longest match (likely the expression)
+    return max(matches, key=len) if matches else None
+
+def extract_intent_parameters(intent: str, query: str):
+    """Parameters for a locally classified intent; None if no expression is found."""
+    if intent in ("factor_polynomial", "find_zeroes"):
+        expr = extract_expression(query)
+        return {"expression": expr} if expr and "x" in expr else None
+    return None
+
 def route_query(query: str) -> str:
     query = query.strip()
     query_lower = query.lower()
     
-    # First, try LLM interpretation if available
+    # First, try the local classifier; the LLM is only asked when it is unsure
     try:
-        llm_result = interpret_query_polynomial(query)
-        if llm_result.get("intent") == "factor_polynomial" and llm_result.get("expression"):
-            expr = sanitize_expression(llm_result["expression"])
+        intent_result = interpret_with_fallback(
+            "polynomials", query, interpret_query_polynomial, extract_intent_parameters
+        )
+        # The LLM returns "expression" at the top level, the local classifier in "parameters"
+        expression = intent_result.get("expression") or intent_result.get("parameters", {}).get("expression")
+        if intent_result.get("intent") in ("factor_polynomial", "find_zeroes") and expression:
+            expr = sanitize_expression(expression)
             return factor_polynomial(expr)
     except Exception as e:
         # If LLM fails, continue with rule-based approach
@@ -28,15 +49,9 @@ def route_query(query: str) -> str:
     # Rule-based approach
     if any(kw in query_lower for kw in ["factor", "factorise", "expand"]):
         # Extract expression more flexibly
-        import re
-        # Look for polynomial patterns
-        pattern = r'[x\d\s\+\-\*\^]+'
-        matches = re.findall(pattern, query)
-        if matches:
-            # Take the longest match (likely the expression)
-            expr = max(matches, key=len)
-            expr = sanitize_expression(expr)
-            return factor_polynomial(expr)
+        expr = extract_expression(query)
+        if expr:
+            return factor_polynomial(sanitize_expression(expr))
     
     # Direct polynomial check (already sanitized)
     expr = sanitize_expression(query)
@@ -1,10 +1,23 @@
+from sympy import nsimplify
+from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.polynomial_analysis import analyze_coefficients
+from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.plot_polynomial import SUPERSCRIPTS
+
+def _approximate_real_roots(analysis):
+    """Distinct real roots for degree > 3: exact when rational, else as decimals."""
+    rational = analysis.rational_roots
+    exact = sorted(set(rational.roots)) if rational else []
+    texts = []
+    for value in analysis.real_root_values:
+        match = next((r for r in exact if abs(float(r) - value) < 1e-9), None)
+        texts.append(f"x = {match}" if match is not None else f"x = {value:.2f}")
+    return texts
+
 def narrate_polynomial_plot(coefficients, degree=2):
-    from sympy import symbols, solve, nsimplify, I
-    x = symbols('x')
+    # Same cached analysis as the solver and the plotter
+    analysis = analyze_coefficients(coefficients)
     
     if degree == 2:
         a, b, c = coefficients
-        expr = a * x**2 + b * x + c
         vertex_x = -b / (2*a)
         vertex_y = a * vertex_x**2 + b * vertex_x + c
         
@@ -20,7 +33,6 @@ def narrate_polynomial_plot(coefficients, degree=2):
         
     elif degree == 3:
         a, b, c, d = coefficients
-        expr = a * x**3 + b * x**2 + c * x + d
         
         if a > 0:
             behavior = "rises to +∞ as x→+∞ and falls to -∞ as x→-∞"
@@ -37,16 +49,29 @@ def narrate_polynomial_plot(coefficients, degree=2):
             narration += "The curve has one critical point (inflection point). "
         else:
             narration += "The curve has no critical points (monotonic). "
+
+    else:
+        a = coefficients[0]
+        power = str(degree).translate(SUPERSCRIPTS)
+        if degree % 2 == 0:
+            behavior = "rises to +∞ at both ends" if a > 0 else "falls to -∞ at both ends"
+        elif a > 0:
+            behavior = "rises to +∞ as x→+∞ and falls to -∞ as x→-∞"
+        else:
+            behavior = "falls to -∞ as x→+∞ and rises to +∞ as x→-∞"
+
+        narration = f"This degree {degree} curve {behavior} since the coefficient of x{power} is {a}. "
+        turning_points = len(analysis.critical_points)
+        narration += f"The curve has {turning_points} critical point{'s' if turning_points != 1 else ''} where it flattens out. "
     
     # Find and describe roots
-    roots = solve(expr, x)
-    real_roots = [r for r in roots if not r.has(I)]
-    complex_roots = [r for r in roots if r.has(I)]
-    
-    # Format roots nicely
-    if real_roots:
+    if degree > 3:
+        # No symbolic solve above cubics: rational roots are exact, the rest numeric
+        root_texts = _approximate_real_roots(analysis)
+        complex_count = sum(1 for r in analysis.approximate_roots if abs(r.imag) > 1e-9)
+    else:
         root_texts = []
-        for r in real_roots:
+        for r in analysis.real_roots:
             try:
                 simplified = nsimplify(r, rational=True)
                 if simplified.is_Integer or simplified.is_Rational:
@@ -55,17 +80,20 @@ def narrate_polynomial_plot(coefficients, degree=2):
                     root_texts.append(f"x = {float(r):.2f}")
             except:
                 root_texts.append(f"x = {float(r):.2f}")
-        
+        complex_count = len(analysis.complex_roots)
+    
+    # Format roots nicely
+    if root_texts:
         root_text = ', '.join(root_texts)
         narration += f"It intersects the x-axis at: {root_text}. "
         
-        if len(real_roots) == 1 and degree == 3:
+        if len(root_texts) == 1 and degree == 3:
             narration += "This cubic has one real root and two complex roots. "
     else:
         narration += "The curve does not intersect the x-axis (no real roots). "
     
-    if complex_roots:
-        narration += f"It has {len(complex_roots)} complex root(s). "
+    if complex_count:
+        narration += f"It has {complex_count} complex root(s). "
     
     narration += "These are the zeros of the polynomial."
     
@@ -0,0 +1,146 @@
+# File: chapters/chapter2_polynomials/sub_chapters/polynomial_factoring/numeric_roots.py
+
+"""
+Floating-point roots for plotting: where the zeros and turning points go
+and how wide the viewing window is. The exact answers shown as text still
+come from sympy (polynomial_analysis.PolynomialAnalysis.roots).
+
+* degree 1–3: closed forms (stable quadratic formula; trigonometric /
+  Cardano cubic), polished with a Newton step
+* higher degree: exact rational roots are divided out first (rational_roots),
+  then numpy.roots (companion-matrix eigenvalues) on what is left; repeated
+  rational roots would otherwise split into clusters of nearby eigenvalues
+* evaluate() is Horner's rule over a whole numpy array, for drawing curves
+"""
+
+import cmath
+import math
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.rational_roots import find_rational_roots
+
+# Relative size below which an imaginary part, or the gap between two roots, is
+# rounding noise (a double root computed in floating point splits by ~√ε)
+ROOT_TOLERANCE = 1e-6
+
+
+def _trim(coefficients: Sequence[float]) -> Tuple[float, ...]:
+    """Drop leading zero coefficients."""
+    coefficients = tuple(float(c) for c in coefficients)
+    first = next((i for i, c in enumerate(coefficients) if c != 0), len(coefficients))
+    return coefficients[first:]
+
+
+def quadratic_roots(a: float, b: float, c: float) -> Tuple[complex, complex]:
+    """Roots of ax² + bx + c, without the cancellation of the textbook formula."""
+    root_d = cmath.sqrt(b * b - 4 * a * c)
+    # q takes the sign that adds magnitudes, so neither root loses digits
+    q = -0.5 * (b + root_d) if b >= 0 else -0.5 * (b - root_d)
+    if q == 0:
+        return 0j, 0j
+    return q / a, c / q
+
+
+def _cbrt(value: float) -> float:
+    return math.copysign(abs(value) ** (1 / 3), value)
+
+
+def cubic_roots(a: float, b: float, c: float, d: float) -> Tuple[complex, complex, complex]:
+    """Roots of ax³ + bx² + cx + d by the trigonometric or Cardano formula."""
+    shift = b / (3 * a)
+    p = (3 * a * c - b * b) / (3 * a * a)
+    q = (2 * b ** 3 - 9 * a * b * c + 27 * a * a * d) / (27 * a ** 3)
+
+    if p == 0 and q == 0:
+        return (-shift + 0j,) * 3
+    if 4 * p ** 3 + 27 * q ** 2 < 0:
+        # Three distinct real roots (p < 0 here)
+        m = 2 * math.sqrt(-p / 3)
+        theta = math.acos(max(-1.0, min(1.0, 3 * q / (p * m)))) / 3
+        return tuple(complex(m * math.cos(theta - 2 * math.pi * k / 3) - shift) for k in range(3))
+
+    # One real root (or a repeated one); the other two come from deflation
+    s = math.sqrt(max(q * q / 4 + p ** 3 / 27, 0.0))
+    x0 = _cbrt(-q / 2 + s) + _cbrt(-q / 2 - s) - shift
+    pair = quadratic_roots(a, b + a * x0, c + (b + a * x0) * x0)
+    return (complex(x0),) + pair
+
+
+def _horner(coefficients: Tuple[float, ...], point: complex) -> Tuple[complex, complex]:
+    """p(point) and p'(point) in one pass (plain Python; np.polyval is slow per scalar)."""
+    value, slope = 0j, 0j
+    for c in coefficients:
+        slope = slope * point + value
+        value = value * point + c
+    return value, slope
+
+
+def _polish(coefficients: Tuple[float, ...], root: complex) -> complex:
+    """One Newton step on the original polynomial, kept only if it helps."""
+    value, slope = _horner(coefficients, root)
+    if slope == 0:
+        return root
+    better = root - value / slope
+    return better if abs(_horner(coefficients, better)[0]) < abs(value) else root
+
+
+def _numeric_roots(coefficients: Tuple[float, ...]) -> Tuple[complex, ...]:
+    degree = len(coefficients) - 1
+    if degree < 1:
+        return ()
+    if degree == 1:
+        roots = (complex(-coefficients[1] / coefficients[0]),)
+    elif degree == 2:
+        roots = quadratic_roots(*coefficients)
+    elif degree == 3:
+        roots = cubic_roots(*coefficients)
+    else:
+        return tuple(complex(r) for r in np.roots(coefficients))
+    return tuple(_polish(coefficients, complex(r)) for r in roots)
+
+
+def polynomial_roots(coefficients: Sequence[float]) -> Tuple[complex, ...]:
+    """All complex roots, highest power first in coefficients."""
+    coefficients = _trim(coefficients)
+    if len(coefficients) <= 4:
+        return _numeric_roots(coefficients)
+    rational = find_rational_roots(coefficients)
+    if rational is None:
+        return _numeric_roots(coefficients)
+    remaining = _numeric_roots(tuple(float(c) for c in rational.quotient))
+    return tuple(complex(r) for r in rational.roots) + remaining
+
+
+def evaluate(coefficients: Sequence[float], x_values: np.ndarray) -> np.ndarray:
+    """Polynomial values at every point of x_values (Horner's rule, vectorized)."""
+    x_values = np.asarray(x_values, dtype=float)
+    y_values = np.zeros_like(x_values)
+    for c in coefficients:
+        y_values *= x_values
+        y_values += c
+    return y_values
+
+
+def real_roots(coefficients: Sequence[float]) -> Tuple[float, ...]:
+    """Distinct real roots in increasing order; repeated roots are listed once."""
+    values = sorted(
+        r.real for r in polynomial_roots(coefficients)
+        if abs(r.imag) <= ROOT_TOLERANCE * max(1.0, abs(r))
+    )
+    distinct = []
+    for value in values:
+        if not distinct or abs(value - distinct[-1]) > ROOT_TOLERANCE * max(1.0, abs(value)):
+            distinct.append(value)
+    return tuple(distinct)
+
+
+def critical_points(coefficients: Sequence[float]) -> Tuple[Tuple[float, float], ...]:
+    """Real (x, y) where the derivative is zero."""
+    coefficients = _trim(coefficients)
+    degree = len(coefficients) - 1
+    if degree < 2:
+        return ()
+    derivative = [c * (degree - i) for i, c in enumerate(coefficients[:-1])]
+    return tuple((px, _horner(coefficients, px)[0].real) for px in real_roots(derivative))
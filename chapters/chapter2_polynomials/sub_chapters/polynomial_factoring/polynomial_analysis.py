@@ -0,0 +1,142 @@
+# File: chapters/chapter2_polynomials/sub_chapters/polynomial_factoring/polynomial_analysis.py
+
+"""
+One analysed polynomial shared by the factoring solver, the plotter and the narrator.
+
+The expression is parsed and expanded once; roots, factors, discriminant,
+critical points and coefficients are computed on first use and kept.
+Analyses are memoized by the canonical (expanded) expression string, so
+"(x-2)*(x-3)", "x^2 - 5x + 6" and the coefficients [1, -5, 6] share one.
+
+Exact roots (sympy.solve) are only computed for the textual answer to
+quadratics and cubics; above degree 3 the answer lists the rational roots
+(rational_roots) and approximates the rest, and plotting values always come
+from numeric_roots.
+"""
+
+import threading
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from typing import Optional, Sequence, Tuple
+
+from sympy import I, Poly, discriminant, expand, factor, nsimplify, solve, sympify, symbols
+
+from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring import numeric_roots
+from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.rational_roots import RationalRoots, find_rational_roots
+
+x = symbols('x')
+
+CACHE_SIZE = 128
+
+# Highest degree the solver, plotter and narrator accept
+MAX_DEGREE = 20
+
+_analyses: "OrderedDict[str, PolynomialAnalysis]" = OrderedDict()
+_analyses_lock = threading.Lock()
+
+
+class PolynomialAnalysis:
+    """Lazily computed facts about one expanded expression in x."""
+
+    def __init__(self, expr, canonical: str):
+        self.expr = expr
+        self.canonical = canonical
+
+    @cached_property
+    def is_polynomial(self) -> bool:
+        return bool(self.expr.is_polynomial(x))
+
+    @cached_property
+    def poly(self) -> Poly:
+        return self.expr.as_poly(x)
+
+    @cached_property
+    def degree(self) -> int:
+        return self.poly.degree()
+
+    @cached_property
+    def coefficients(self) -> Tuple:
+        """Exact coefficients, highest power first."""
+        return tuple(self.poly.all_coeffs())
+
+    @cached_property
+    def float_coefficients(self) -> Tuple[float, ...]:
+        return tuple(float(c) for c in self.coefficients)
+
+    @cached_property
+    def discriminant(self):
+        """b² - 4ac for a quadratic; the general polynomial discriminant otherwise."""
+        return discriminant(self.poly)
+
+    @cached_property
+    def roots(self) -> Tuple:
+        """Exact roots from sympy.solve, real and complex."""
+        return tuple(solve(self.expr, x))
+
+    @cached_property
+    def real_roots(self) -> Tuple:
+        return tuple(r for r in self.roots if not r.has(I))
+
+    @cached_property
+    def complex_roots(self) -> Tuple:
+        return tuple(r for r in self.roots if r.has(I))
+
+    @cached_property
+    def rational_roots(self) -> Optional[RationalRoots]:
+        """Exact rational roots with multiplicity; None if a coefficient is irrational."""
+        return find_rational_roots(self.coefficients)
+
+    @cached_property
+    def approximate_roots(self) -> Tuple[complex, ...]:
+        """All roots with multiplicity, rational ones exact, the rest numeric."""
+        return numeric_roots.polynomial_roots(self.float_coefficients)
+
+    @cached_property
+    def real_root_values(self) -> Tuple[float, ...]:
+        """Distinct real roots as floats, increasing (closed form / numpy, no symbolic solve)."""
+        return numeric_roots.real_roots(self.float_coefficients)
+
+    @cached_property
+    def factored(self):
+        return factor(self.expr)
+
+    @cached_property
+    def critical_points(self) -> Tuple[Tuple[float, float], ...]:
+        """Real (x, y) points where the derivative is zero, computed numerically."""
+        return numeric_roots.critical_points(self.float_coefficients)
+
+    def __repr__(self) -> str:
+        return f"PolynomialAnalysis({self.canonical})"
+
+
+@lru_cache(maxsize=256)
+def _parse(expression: str):
+    return expand(sympify(expression))
+
+
+def analyze_polynomial(expression) -> PolynomialAnalysis:
+    """Shared analysis for an expression string or sympy expression."""
+    expr = _parse(expression) if isinstance(expression, str) else expand(expression)
+    canonical = str(expr)
+    with _analyses_lock:
+        analysis = _analyses.get(canonical)
+        if analysis is not None:
+            _analyses.move_to_end(canonical)
+            return analysis
+        analysis = _analyses[canonical] = PolynomialAnalysis(expr, canonical)
+        if len(_analyses) > CACHE_SIZE:
+            _analyses.popitem(last=False)
+    return analysis
+
+
+@lru_cache(maxsize=256)
+def _analysis_for_coefficients(coefficients: Tuple[float, ...]) -> PolynomialAnalysis:
+    # 1.0 → 1 and 0.5 → 1/2, so float coefficients from the UI meet the solver's exact analysis
+    exact = [nsimplify(c, rational=True) for c in coefficients]
+    degree = len(exact) - 1
+    return analyze_polynomial(sum(c * x**(degree - i) for i, c in enumerate(exact)))
+
+
+def analyze_coefficients(coefficients: Sequence[float]) -> PolynomialAnalysis:
+    """Shared analysis for coefficients given highest power first."""
+    return _analysis_for_coefficients(tuple(coefficients))
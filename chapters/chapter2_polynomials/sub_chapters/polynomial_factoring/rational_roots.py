@@ -0,0 +1,129 @@
+# File: chapters/chapter2_polynomials/sub_chapters/polynomial_factoring/rational_roots.py
+
+"""
+Exact rational roots for polynomials of any degree (Rational Root Theorem).
+
+* coefficients are scaled to integers; a rational root p/q in lowest terms
+  must have p | a₀ and q | aₙ, with the divisor sets taken from the cached
+  factorization engine (utils.prime_factorization.divisors)
+* candidates are screened before evaluation: |p/q| must be within the Cauchy
+  bound, and (q - p) | f(1), (q + p) | f(-1)
+* survivors are evaluated exactly in integers, and each root found is divided
+  out by synthetic division, so repeated roots are counted
+"""
+
+import math
+from fractions import Fraction
+from functools import lru_cache, reduce
+from numbers import Rational
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from utils.prime_factorization import divisors
+
+
+class RationalRoots(NamedTuple):
+    roots: Tuple[Fraction, ...]      # with multiplicity, increasing
+    quotient: Tuple[Fraction, ...]   # what is left after dividing out (x - r) for each root
+    candidates_tested: int
+
+
+def to_fractions(coefficients: Sequence) -> Optional[Tuple[Fraction, ...]]:
+    """Coefficients as Fractions; None if any is irrational (√2, π) or not finite."""
+    result = []
+    for c in coefficients:
+        if isinstance(c, Rational):
+            result.append(Fraction(int(c.numerator), int(c.denominator)))
+        elif isinstance(c, float) and math.isfinite(c):
+            result.append(Fraction(repr(c)))  # 0.1 → 1/10, not the binary expansion
+        else:
+            return None
+    return tuple(result)
+
+
+def synthetic_division(coefficients: Sequence[Fraction], root: Fraction) -> Tuple[List[Fraction], Fraction]:
+    """Divide by (x - root): (quotient coefficients, remainder)."""
+    quotient = []
+    carry = 0
+    for c in coefficients:
+        carry = carry * root + c
+        quotient.append(carry)
+    remainder = quotient.pop()
+    return quotient, remainder
+
+
+def _integer_coefficients(coefficients: Sequence[Fraction]) -> List[int]:
+    """Scale by the common denominator and divide out the content."""
+    scale = reduce(math.lcm, (c.denominator for c in coefficients), 1)
+    integers = [int(c * scale) for c in coefficients]
+    content = reduce(math.gcd, integers, 0) or 1
+    return [n // content for n in integers]
+
+
+def _is_root(integers: Sequence[int], p: int, q: int) -> bool:
+    """f(p/q) == 0, evaluated as qⁿ·f(p/q) = Σ aᵢ·pⁿ⁻ⁱ·qⁱ in integers (Horner)."""
+    total = 0
+    q_power = 1
+    for a in integers:
+        total = total * p + a * q_power
+        q_power *= q
+    return total == 0
+
+
+def _candidates(integers: Sequence[int]) -> List[Fraction]:
+    """Screened candidates p/q for a polynomial with nonzero constant term."""
+    lead, constant = integers[0], integers[-1]
+    # Cauchy bound |root| ≤ 1 + max|aᵢ / aₙ|, rounded up so the comparisons stay in integers
+    bound = 1 + max(-(-abs(a) // abs(lead)) for a in integers[1:])
+    f_one, f_minus_one = sum(integers), sum(a if i % 2 == 0 else -a for i, a in enumerate(reversed(integers)))
+    found = set()
+    for q in divisors(lead):
+        for p in divisors(constant):
+            if p > bound * q:
+                break
+            if math.gcd(p, q) != 1:
+                continue
+            for signed in (p, -p):
+                # f(1) = (q - p)·g(1) and f(-1) = -(q + p)·g(-1) for integer g
+                if f_one and (q - signed == 0 or f_one % (q - signed)):
+                    continue
+                if f_minus_one and (q + signed == 0 or f_minus_one % (q + signed)):
+                    continue
+                found.add(Fraction(signed, q))
+    return sorted(found)
+
+
+@lru_cache(maxsize=256)
+def _find(coefficients: Tuple[Fraction, ...]) -> RationalRoots:
+    roots: List[Fraction] = []
+    quotient = list(coefficients)
+
+    # x = 0, once per trailing zero coefficient
+    while len(quotient) > 1 and quotient[-1] == 0:
+        quotient.pop()
+        roots.append(Fraction(0))
+    if len(quotient) < 2:
+        return RationalRoots(tuple(roots), tuple(quotient), 0)
+
+    integers = _integer_coefficients(quotient)
+    candidates = _candidates(integers)
+    for candidate in candidates:
+        while len(quotient) > 1 and _is_root(integers, candidate.numerator, candidate.denominator):
+            quotient, _ = synthetic_division(quotient, candidate)
+            roots.append(candidate)
+            integers = _integer_coefficients(quotient)
+        if len(quotient) < 2:
+            break
+    return RationalRoots(tuple(sorted(roots)), tuple(quotient), len(candidates))
+
+
+def find_rational_roots(coefficients: Sequence) -> Optional[RationalRoots]:
+    """
+    All rational roots of the polynomial (highest power first), with
+    multiplicity, and the quotient left once they are divided out.
+    None when a coefficient is not rational.
+    """
+    fractions = to_fractions(coefficients)
+    if fractions is None:
+        return None
+    first = next((i for i, c in enumerate(fractions) if c != 0), len(fractions))
+    return _find(fractions[first:])
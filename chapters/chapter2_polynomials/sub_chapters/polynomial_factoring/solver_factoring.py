@@ -1,7 +1,8 @@
 # File: chapters/chapter2_polynomials/sub_chapters/polynomial_factoring/solver_factoring.py
 
-from sympy import factor, sympify, symbols, solve, I, expand, nsimplify, Rational
-import re
+from sympy import symbols, nsimplify
+from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.polynomial_analysis import MAX_DEGREE, analyze_polynomial
+from utils.prime_factorization import divisor_pairs
 
 x = symbols('x')
 
@@ -20,10 +21,25 @@ def format_root(root):
     except:
         return f"{float(root):.3f}"
 
+def split_middle_term(product, total):
+    """
+    Integers (p, q) with p * q = product and p + q = total, or None.
+    Only divisors of product up to √|product| are tried, with both signs.
+    """
+    product, total = int(product), int(total)
+    if product == 0:
+        return (0, total)
+    for d, e in divisor_pairs(product):
+        candidates = ((d, e), (-d, -e)) if product > 0 else ((-d, e), (d, -e))
+        for p, q in candidates:
+            if p + q == total:
+                return (p, q)
+    return None
+
 def explain_factoring_steps(expr, degree):
     """Generate step-by-step explanation for factoring."""
-    poly = expr.as_poly(x)
-    coeffs = poly.all_coeffs()
+    analysis = analyze_polynomial(expr)
+    coeffs = analysis.coefficients
     
     if degree == 2:
         a, b, c = coeffs
@@ -34,12 +50,9 @@ def explain_factoring_steps(expr, degree):
         if b**2 - 4*a*c >= 0:
             steps += f"3. Find two numbers that multiply to {a*c} and add to {b}\n"
             # Try to find integer factors
-            for i in range(1, abs(a*c) + 1):
-                if (a*c) % i == 0:
-                    j = (a*c) // i
-                    if i + j == b or -i - j == b:
-                        steps += f"   Found: {i} and {j}\n"
-                        break
+            pair = split_middle_term(a*c, b) if all(v.is_Integer for v in (a, b, c)) else None
+            if pair:
+                steps += f"   Found: {pair[0]} and {pair[1]}\n"
         return steps
     
     elif degree == 3:
@@ -50,59 +63,87 @@ def explain_factoring_steps(expr, degree):
         steps += f"   Possible rational roots: ±(factors of {abs(d)})/(factors of {abs(a)})\n"
         
         # Find actual roots
-        roots = solve(expr, x)
-        real_roots = [r for r in roots if not r.has(I)]
+        real_roots = analysis.real_roots
         if real_roots:
             steps += f"3. Found roots: {', '.join([format_root(r) for r in real_roots])}\n"
         
         return steps
     
+    elif degree > 3:
+        steps = f"\n📝 **Steps for factoring the degree {degree} polynomial {expr}:**\n"
+        steps += f"1. Coefficients: {', '.join(str(c) for c in coeffs)}\n"
+        rational = analysis.rational_roots
+        if rational is None:
+            steps += "2. Some coefficients are irrational, so the Rational Root Theorem does not apply\n"
+            return steps
+        steps += f"2. Rational Root Theorem: ±(factors of the constant)/(factors of {coeffs[0]}), "
+        steps += f"{rational.candidates_tested} candidates left after screening\n"
+        if rational.roots:
+            steps += f"3. Dividing out each root by synthetic division: {', '.join(str(r) for r in rational.roots)}\n"
+            if len(rational.quotient) > 1:
+                remaining = sum(c * x**(len(rational.quotient) - 1 - i) for i, c in enumerate(rational.quotient))
+                steps += f"   Remaining factor (no rational roots): {remaining}\n"
+        else:
+            steps += "3. No candidate is a root, so there is no linear factor over the rationals\n"
+        return steps
+    
     return ""
 
+def describe_approximate_roots(analysis):
+    """Root lines for degree > 3: rational roots exact, the others to 3 decimals."""
+    rational = analysis.rational_roots
+    exact = list(rational.roots) if rational else []
+    roots = []
+    for root in analysis.approximate_roots:
+        if exact and abs(root - float(exact[0])) < 1e-9:
+            roots.append((root.real, 0.0, f"= {exact.pop(0)}"))
+        elif abs(root.imag) < 1e-9:
+            roots.append((root.real, 0.0, f"≈ {root.real:.3f}"))
+        else:
+            sign = '+' if root.imag >= 0 else '-'
+            roots.append((root.real, root.imag, f"≈ {root.real:.3f} {sign} {abs(root.imag):.3f}i (complex)"))
+    # Real roots first, then complex pairs, each in increasing order
+    roots.sort(key=lambda r: (r[1] != 0, r[0], r[1]))
+    return [f"   x_{i} {text}\n" for i, (_, _, text) in enumerate(roots, 1)]
+
 def factor_polynomial(expression: str) -> str:
     """
-    Factors polynomials (quadratic and cubic) with detailed explanations.
+    Factors polynomials (quadratic, cubic and up to degree MAX_DEGREE) with detailed explanations.
     """
     try:
-        expr = sympify(expression)
-        
-        # Expand first to ensure standard form
-        expr = expand(expr)
+        # Parsed and expanded once; shared with the plotter and narrator
+        analysis = analyze_polynomial(expression)
+        expr = analysis.expr
 
         # Degree of the polynomial
-        if not expr.is_polynomial(x):
+        if not analysis.is_polynomial:
             return "Only polynomial expressions are supported."
 
-        degree = expr.as_poly(x).degree()
+        degree = analysis.degree
         
-        if degree > 3:
-            return f"Currently supporting polynomials up to degree 3. Your polynomial has degree {degree}."
+        if degree > MAX_DEGREE:
+            return f"Currently supporting polynomials up to degree {MAX_DEGREE}. Your polynomial has degree {degree}."
 
         # Get factoring steps explanation
         steps = explain_factoring_steps(expr, degree)
 
         # ✅ Quadratic check: discriminant
         if degree == 2:
-            a, b, c = expr.as_poly(x).all_coeffs()
-            discriminant = b**2 - 4*a*c
-            if discriminant < 0:
+            if analysis.discriminant < 0:
                 return f"The polynomial {expr} cannot be factorized over real numbers.\n{steps}❌ Since discriminant < 0, this has complex roots only."
 
         # ✅ Cubic check: real roots
         if degree == 3:
-            roots = solve(expr, x)
-            real_roots = [r for r in roots if not r.has(I)]
-            complex_roots = [r for r in roots if r.has(I)]
+            real_roots = analysis.real_roots
             
             if len(real_roots) == 0:
                 return f"The cubic polynomial {expr} has no real roots and cannot be factorized over real numbers.\n{steps}❌ All roots are complex."
             elif len(real_roots) == 1:
                 # One real root, two complex roots
-                real_root = real_roots[0]
                 steps += f"\n✅ This cubic has 1 real root and 2 complex roots.\n"
 
         # Perform factoring
-        factored = factor(expr)
+        factored = analysis.factored
 
         # If unchanged, it's irreducible
         if factored == expr:
@@ -112,7 +153,11 @@ def factor_polynomial(expression: str) -> str:
         result = f"✅ **Factored form of {expr}:**\n\n**{factored}**"
         
         # Add roots information
-        roots = solve(expr, x)
+        if degree > 3:
+            result += f"\n\n🎯 **Roots/Zeros:**\n" + "".join(describe_approximate_roots(analysis))
+            return result + steps
+
+        roots = analysis.roots
         if roots:
             result += f"\n\n🎯 **Roots/Zeros:**\n"
             for i, root in enumerate(roots, 1):
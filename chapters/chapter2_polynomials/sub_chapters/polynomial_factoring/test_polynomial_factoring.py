@@ -16,7 +16,9 @@ def run_tests():
         "Factor 3x^2 + 5x + 2",
         "Factor x^2 - 4x + 4",
         "Factor x^2 + 1",
-        "Factor x^3 + x^2 + x + 1"
+        "Factor x^3 + x^2 + x + 1",
+        "Factor x^4 - 5x^2 + 4",
+        "Factor 2x^5 - 3x^4 - 2x^3 + 3x^2"
     ]
 
     for query in test_queries:
@@ -1,21 +1,39 @@
 # File: chapters/chapter6_triangles/animations/bpt_animation.py
 
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import numpy as np
 from matplotlib.patches import Rectangle
-import time
+from functools import lru_cache
+from PIL import Image
+from utils.figures import close_figure, closing_figure, create_figure, figure_to_bytes
+from utils.plot_cache import cached_plot
+
+FRAMES_PER_STEP = 60  # 6 s per step at the default interval
+FADE_FRAMES = 30      # frames for a new element to fade in fully
+FRAME_INTERVAL_MS = 100
+MAX_EXPLANATION_LINES = 12
+
 
 class BPTAnimationExplainer:
     def __init__(self):
         self.fig = None
         self.ax_triangle = None
         self.ax_explanation = None
-        self.current_step = 0
+        self.current_step = None
         self.animation_steps = []
         self.explanation_texts = []
+        self.artists = {}
+        self.render_stats = {}
         self.setup_animation_data()
-    
+
     def setup_animation_data(self):
         """Setup the step-by-step animation sequence."""
         
@@ -126,328 +144,457 @@ class BPTAnimationExplainer:
             }
         ]
     
-    def create_animation(self, segments=[4, 6, 6, 9]):
-        """Create the main BPT animation with explanation panel."""
-        
-        # Setup figure with two subplots
-        self.fig = plt.figure(figsize=(16, 10))
-        
+    def create_figure(self, segments=(4, 6, 6, 9)):
+        """Build the figure, both panels and every artist the animation will update."""
+        self.fig = create_figure(figsize=(16, 10))
+
         # Left panel: Triangle animation (70% width)
-        self.ax_triangle = plt.subplot2grid((1, 10), (0, 0), colspan=7)
-        
+        self.ax_triangle = plt.subplot2grid((1, 10), (0, 0), colspan=7, fig=self.fig)
+
         # Right panel: Explanation text (30% width)
-        self.ax_explanation = plt.subplot2grid((1, 10), (0, 7), colspan=3)
-        
-        # Setup triangle coordinates
+        self.ax_explanation = plt.subplot2grid((1, 10), (0, 7), colspan=3, fig=self.fig)
+
         self.setup_triangle_coordinates(segments)
-        
-        # Configure axes
         self.configure_axes()
-        
-        # Create animation
+        self.build_artists()
+        self.current_step = None
+        return self.fig
+
+    def create_animation(self, segments=(4, 6, 6, 9)):
+        """Create the main BPT animation with explanation panel."""
+        self.create_figure(segments)
+
+        # Only the artists returned by animate_frame are redrawn each frame
         anim = animation.FuncAnimation(
-            self.fig, 
+            self.fig,
             self.animate_frame,
-            frames=len(self.animation_steps) * 60,  # 60 frames per step
-            interval=100,  # 100ms per frame
+            init_func=self.init_frame,
+            frames=len(self.animation_steps) * FRAMES_PER_STEP,
+            interval=FRAME_INTERVAL_MS,
             repeat=True,
-            blit=False
+            blit=True
         )
-        
+
         return anim
-    
+
     def setup_triangle_coordinates(self, segments):
         """Setup triangle coordinates and calculate BPT points."""
-        
+
         AD, DB, AE, EC = segments
-        
+
         # Main triangle vertices
         self.A = np.array([0, 0])
         self.B = np.array([10, 0])
         self.C = np.array([4, 8])
-        
+
         # Calculate D and E positions based on ratios
         total_AB = AD + DB
         total_AC = AE + EC
-        
+
         # D divides AB in ratio AD:DB
         self.D = self.A + (AD / total_AB) * (self.B - self.A)
-        
-        # E divides AC in ratio AE:EC  
+
+        # E divides AC in ratio AE:EC
         self.E = self.A + (AE / total_AC) * (self.C - self.A)
-        
+
         # Store segments for calculations
         self.segments = {"AD": AD, "DB": DB, "AE": AE, "EC": EC}
-        
+
         # Calculate actual ratios
         self.ratio1 = AD / DB
         self.ratio2 = AE / EC
-    
+
     def configure_axes(self):
-        """Configure both triangle and explanation axes."""
-        
+        """Configure both triangle and explanation axes (static background, drawn once)."""
+
         # Triangle axis
         self.ax_triangle.set_xlim(-2, 12)
         self.ax_triangle.set_ylim(-2, 10)
         self.ax_triangle.set_aspect('equal')
         self.ax_triangle.grid(True, alpha=0.3)
-        self.ax_triangle.set_title("Basic Proportionality Theorem Animation", 
+        self.ax_triangle.set_title("Basic Proportionality Theorem Animation",
                                  fontsize=16, fontweight='bold', pad=20)
-        
+
         # Explanation axis
         self.ax_explanation.set_xlim(0, 1)
         self.ax_explanation.set_ylim(0, 1)
         self.ax_explanation.axis('off')
-        
+
         # Add background color to explanation panel
         bg_rect = Rectangle((0, 0), 1, 1, facecolor='lightblue', alpha=0.1)
         self.ax_explanation.add_patch(bg_rect)
-    
+
+    def build_artists(self):
+        """Create every line, marker and text once; frames only change their visibility and alpha."""
+        ax = self.ax_triangle
+        A, B, C, D, E = self.A, self.B, self.C, self.D, self.E
+        mid_DE = (D + E) / 2
+
+        if abs(self.ratio1 - self.ratio2) < 0.001:
+            equality_text, color, bg_color = f'AD/DB = AE/EC = {self.ratio1:.2f} ✓', 'green', 'lightgreen'
+        else:
+            equality_text, color, bg_color = 'AD/DB ≠ AE/EC (Not parallel!)', 'red', 'lightcoral'
+
+        self.artists = {
+            # Step 0: triangle ABC
+            "triangle": ax.plot([A[0], B[0], C[0], A[0]], [A[1], B[1], C[1], A[1]], 'b-', linewidth=3)[0],
+            "label_A": ax.text(A[0]-0.3, A[1]-0.3, 'A', fontsize=14, fontweight='bold', color='blue'),
+            "label_B": ax.text(B[0]+0.2, B[1]-0.3, 'B', fontsize=14, fontweight='bold', color='blue'),
+            "label_C": ax.text(C[0]-0.3, C[1]+0.2, 'C', fontsize=14, fontweight='bold', color='blue'),
+            # Step 1: point D and segments AD, DB
+            "point_D": ax.plot(D[0], D[1], 'ro', markersize=8)[0],
+            "label_D": ax.text(D[0], D[1]-0.5, 'D', fontsize=12, fontweight='bold', color='red', ha='center'),
+            "seg_AD": ax.plot([A[0], D[0]], [A[1], D[1]], 'g-', linewidth=4)[0],
+            "seg_DB": ax.plot([D[0], B[0]], [D[1], B[1]], 'm-', linewidth=4)[0],
+            # Step 2: point E and segments AE, EC
+            "point_E": ax.plot(E[0], E[1], 'ro', markersize=8)[0],
+            "label_E": ax.text(E[0]-0.5, E[1], 'E', fontsize=12, fontweight='bold', color='red', ha='center'),
+            "seg_AE": ax.plot([A[0], E[0]], [A[1], E[1]], color='orange', linewidth=4)[0],
+            "seg_EC": ax.plot([E[0], C[0]], [E[1], C[1]], color='purple', linewidth=4)[0],
+            # Step 3: DE parallel to BC
+            "line_DE": ax.plot([D[0], E[0]], [D[1], E[1]], 'r-', linewidth=3)[0],
+            "label_DE": ax.text(mid_DE[0], mid_DE[1]+0.3, 'DE || BC', fontsize=10, fontweight='bold',
+                                color='red', ha='center',
+                                bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.7)),
+            # Step 4: ratios
+            "ratio_1": ax.text(0.02, 0.95, f'AD/DB = {self.segments["AD"]}/{self.segments["DB"]} = {self.ratio1:.2f}',
+                               transform=ax.transAxes, fontsize=12, fontweight='bold', color='green',
+                               bbox=dict(boxstyle='round,pad=0.3', facecolor='lightgreen')),
+            "ratio_2": ax.text(0.02, 0.88, f'AE/EC = {self.segments["AE"]}/{self.segments["EC"]} = {self.ratio2:.2f}',
+                               transform=ax.transAxes, fontsize=12, fontweight='bold', color='orange',
+                               bbox=dict(boxstyle='round,pad=0.3', facecolor='lightyellow')),
+            # Step 5: equality
+            "equality": ax.text(0.02, 0.8, equality_text, transform=ax.transAxes, fontsize=14,
+                                fontweight='bold', color=color,
+                                bbox=dict(boxstyle='round,pad=0.5', facecolor=bg_color)),
+            # Step 6: conclusion
+            "conclusion": ax.text(0.5, 0.02, 'BPT: DE || BC ⟹ AD/DB = AE/EC', transform=ax.transAxes,
+                                  fontsize=16, fontweight='bold', color='blue', ha='center',
+                                  bbox=dict(boxstyle='round,pad=0.5', facecolor='lightblue')),
+            # Explanation panel: a title and a fixed pool of lines, rewritten when the step changes
+            "explanation_title": self.ax_explanation.text(0.5, 0.95, "", ha='center', va='top', fontsize=14,
+                                                          fontweight='bold', color='darkblue'),
+        }
+        self.explanation_lines = [
+            self.ax_explanation.text(0.05, 0.85 - 0.08 * i, "", ha='left', va='top', fontsize=10)
+            for i in range(MAX_EXPLANATION_LINES)
+        ]
+        self.dynamic_artists = list(self.artists.values()) + self.explanation_lines
+
+        # Artists that fade in during each step; everything else is fixed within a step
+        self.step_artists = {
+            0: ["triangle", "label_A", "label_B", "label_C"],
+            1: ["point_D", "label_D", "seg_AD", "seg_DB"],
+            2: ["point_E", "label_E", "seg_AE", "seg_EC"],
+            3: ["line_DE", "label_DE"],
+            4: ["ratio_1", "ratio_2"],
+            5: ["equality"],
+            6: ["conclusion"],
+        }
+        for artist in self.dynamic_artists:
+            artist.set_visible(False)
+
+    def set_animated(self, animated):
+        """Mark the dynamic artists for blitting (skipped by full redraws of the background)."""
+        for artist in self.dynamic_artists:
+            artist.set_animated(animated)
+
+    def init_frame(self):
+        """Blank frame FuncAnimation uses to capture the static background."""
+        for artist in self.dynamic_artists:
+            artist.set_visible(False)
+        self.current_step = None
+        return self.dynamic_artists
+
+    def frame_state(self, frame_num):
+        """(step index, frame within step) for a global frame number."""
+        step_index = min(frame_num // FRAMES_PER_STEP, len(self.animation_steps) - 1)
+        return step_index, frame_num % FRAMES_PER_STEP
+
     def animate_frame(self, frame_num):
-        """Animation function called for each frame."""
-        
-        # Clear triangle axis
-        self.ax_triangle.clear()
-        self.configure_axes()
-        
-        # Determine current step
-        step_index = min(frame_num // 60, len(self.animation_steps) - 1)
-        frame_in_step = frame_num % 60
-        
-        current_step = self.animation_steps[step_index]
-        
-        # Execute animation based on current step
-        self.draw_animation_step(current_step, frame_in_step)
-        
-        # Update explanation panel
-        self.update_explanation_panel(step_index)
-        
-        return []
-    
+        """Animation function called for each frame; returns the artists to redraw."""
+        step_index, frame_in_step = self.frame_state(frame_num)
+
+        self.draw_animation_step(self.animation_steps[step_index], frame_in_step)
+
+        # The explanation text only changes when the step does
+        if step_index != self.current_step:
+            self.update_explanation_panel(step_index)
+            self.current_step = step_index
+
+        return self.dynamic_artists
+
+    def _show(self, names, alpha, min_alpha=0.0):
+        """Show the named artists at `alpha` once it passes `min_alpha`, else hide them."""
+        for name in names:
+            artist = self.artists[name]
+            artist.set_visible(alpha > min_alpha)
+            artist.set_alpha(alpha)
+
+    def _show_boxed_text(self, name, alpha):
+        """Text whose background box fades in (the text itself stays opaque)."""
+        artist = self.artists[name]
+        artist.set_visible(alpha > 0.3)
+        artist.get_bbox_patch().set_alpha(alpha)
+
     def draw_animation_step(self, step_data, frame_in_step):
-        """Draw the triangle based on current animation step."""
-        
+        """Update the triangle artists for the current animation step."""
+
         step_num = step_data["step"]
-        alpha = min(frame_in_step / 30.0, 1.0)  # Fade in effect
-        
-        if step_num >= 0:  # Draw triangle
-            self.draw_triangle_abc(alpha)
-        
-        if step_num >= 1:  # Mark point D
-            self.draw_point_d(alpha if step_num == 1 else 1.0)
-        
-        if step_num >= 2:  # Mark point E
-            self.draw_point_e(alpha if step_num == 2 else 1.0)
-        
-        if step_num >= 3:  # Draw parallel line
-            self.draw_parallel_line(alpha if step_num == 3 else 1.0)
-        
-        if step_num >= 4:  # Show ratios
-            self.show_ratio_calculations(alpha if step_num == 4 else 1.0)
-        
-        if step_num >= 5:  # Demonstrate equality
-            self.highlight_equal_ratios(alpha if step_num == 5 else 1.0)
-        
-        if step_num >= 6:  # Show conclusion
-            self.show_theorem_conclusion(alpha if step_num == 6 else 1.0)
-    
+        alpha = min(frame_in_step / float(FADE_FRAMES), 1.0)  # Fade in effect
+
+        self.draw_triangle_abc(alpha if step_num == 0 else 1.0)
+        self.draw_point_d(alpha if step_num == 1 else float(step_num > 1))
+        self.draw_point_e(alpha if step_num == 2 else float(step_num > 2))
+        self.draw_parallel_line(alpha if step_num == 3 else float(step_num > 3))
+        self.show_ratio_calculations(alpha if step_num == 4 else float(step_num > 4))
+        self.highlight_equal_ratios(alpha if step_num == 5 else float(step_num > 5))
+        self.show_theorem_conclusion(alpha if step_num == 6 else float(step_num > 6))
+
     def draw_triangle_abc(self, alpha):
-        """Draw the main triangle ABC."""
-        
-        # Triangle sides
-        triangle_x = [self.A[0], self.B[0], self.C[0], self.A[0]]
-        triangle_y = [self.A[1], self.B[1], self.C[1], self.A[1]]
-        
-        self.ax_triangle.plot(triangle_x, triangle_y, 'b-', linewidth=3, alpha=alpha)
-        
-        # Vertex labels
-        if alpha > 0.5:
-            self.ax_triangle.text(self.A[0]-0.3, self.A[1]-0.3, 'A', fontsize=14, 
-                                fontweight='bold', color='blue')
-            self.ax_triangle.text(self.B[0]+0.2, self.B[1]-0.3, 'B', fontsize=14, 
-                                fontweight='bold', color='blue')
-            self.ax_triangle.text(self.C[0]-0.3, self.C[1]+0.2, 'C', fontsize=14, 
-                                fontweight='bold', color='blue')
-    
+        """Triangle ABC with vertex labels."""
+        self._show(["triangle"], alpha)
+        for name in ("label_A", "label_B", "label_C"):
+            self.artists[name].set_visible(alpha > 0.5)
+
     def draw_point_d(self, alpha):
-        """Draw and label point D."""
-        
-        self.ax_triangle.plot(self.D[0], self.D[1], 'ro', markersize=8, alpha=alpha)
-        
-        if alpha > 0.5:
-            self.ax_triangle.text(self.D[0], self.D[1]-0.5, 'D', fontsize=12, 
-                                fontweight='bold', color='red', ha='center')
-            
-            # Highlight segments AD and DB
-            self.ax_triangle.plot([self.A[0], self.D[0]], [self.A[1], self.D[1]], 
-                                'g-', linewidth=4, alpha=alpha*0.7, label='AD')
-            self.ax_triangle.plot([self.D[0], self.B[0]], [self.D[1], self.B[1]], 
-                                'm-', linewidth=4, alpha=alpha*0.7, label='DB')
-    
+        """Point D with segments AD and DB highlighted."""
+        self._show(["point_D"], alpha)
+        self.artists["label_D"].set_visible(alpha > 0.5)
+        self._show(["seg_AD", "seg_DB"], alpha * 0.7, min_alpha=0.35)
+
     def draw_point_e(self, alpha):
-        """Draw and label point E."""
-        
-        self.ax_triangle.plot(self.E[0], self.E[1], 'ro', markersize=8, alpha=alpha)
-        
-        if alpha > 0.5:
-            self.ax_triangle.text(self.E[0]-0.5, self.E[1], 'E', fontsize=12, 
-                                fontweight='bold', color='red', ha='center')
-            
-            # Highlight segments AE and EC
-            self.ax_triangle.plot([self.A[0], self.E[0]], [self.A[1], self.E[1]], 
-                                'orange', linewidth=4, alpha=alpha*0.7, label='AE')
-            self.ax_triangle.plot([self.E[0], self.C[0]], [self.E[1], self.C[1]], 
-                                'purple', linewidth=4, alpha=alpha*0.7, label='EC')
-    
+        """Point E with segments AE and EC highlighted."""
+        self._show(["point_E"], alpha)
+        self.artists["label_E"].set_visible(alpha > 0.5)
+        self._show(["seg_AE", "seg_EC"], alpha * 0.7, min_alpha=0.35)
+
     def draw_parallel_line(self, alpha):
-        """Draw the parallel line DE."""
-        
-        self.ax_triangle.plot([self.D[0], self.E[0]], [self.D[1], self.E[1]], 
-                            'r-', linewidth=3, alpha=alpha, label='DE')
-        
-        if alpha > 0.5:
-            # Add parallel symbol
-            mid_DE = (self.D + self.E) / 2
-            self.ax_triangle.text(mid_DE[0], mid_DE[1]+0.3, 'DE || BC', 
-                                fontsize=10, fontweight='bold', color='red',
-                                ha='center', bbox=dict(boxstyle='round,pad=0.3', 
-                                facecolor='yellow', alpha=0.7))
-    
+        """The parallel line DE."""
+        self._show(["line_DE"], alpha)
+        self.artists["label_DE"].set_visible(alpha > 0.5)
+
     def show_ratio_calculations(self, alpha):
-        """Show the ratio calculations."""
-        
-        if alpha > 0.3:
-            # Display ratios
-            ratio_text = f'AD/DB = {self.segments["AD"]}/{self.segments["DB"]} = {self.ratio1:.2f}'
-            self.ax_triangle.text(0.02, 0.95, ratio_text, transform=self.ax_triangle.transAxes,
-                                fontsize=12, fontweight='bold', color='green',
-                                bbox=dict(boxstyle='round,pad=0.3', facecolor='lightgreen', alpha=alpha))
-            
-            ratio_text2 = f'AE/EC = {self.segments["AE"]}/{self.segments["EC"]} = {self.ratio2:.2f}'
-            self.ax_triangle.text(0.02, 0.88, ratio_text2, transform=self.ax_triangle.transAxes,
-                                fontsize=12, fontweight='bold', color='orange',
-                                bbox=dict(boxstyle='round,pad=0.3', facecolor='lightyellow', alpha=alpha))
-    
+        """The ratio calculations."""
+        self._show_boxed_text("ratio_1", alpha)
+        self._show_boxed_text("ratio_2", alpha)
+
     def highlight_equal_ratios(self, alpha):
-        """Highlight that the ratios are equal."""
-        
-        if alpha > 0.3:
-            # Show equality
-            if abs(self.ratio1 - self.ratio2) < 0.001:
-                equality_text = f'AD/DB = AE/EC = {self.ratio1:.2f} ✓'
-                color = 'green'
-                bg_color = 'lightgreen'
-            else:
-                equality_text = f'AD/DB ≠ AE/EC (Not parallel!)'
-                color = 'red'
-                bg_color = 'lightcoral'
-            
-            self.ax_triangle.text(0.02, 0.8, equality_text, transform=self.ax_triangle.transAxes,
-                                fontsize=14, fontweight='bold', color=color,
-                                bbox=dict(boxstyle='round,pad=0.5', facecolor=bg_color, alpha=alpha))
-    
+        """Whether the ratios are equal."""
+        self._show_boxed_text("equality", alpha)
+
     def show_theorem_conclusion(self, alpha):
-        """Show the final theorem conclusion."""
-        
-        if alpha > 0.3:
-            conclusion = 'BPT: DE || BC ⟹ AD/DB = AE/EC'
-            self.ax_triangle.text(0.5, 0.02, conclusion, transform=self.ax_triangle.transAxes,
-                                fontsize=16, fontweight='bold', color='blue', ha='center',
-                                bbox=dict(boxstyle='round,pad=0.5', facecolor='lightblue', alpha=alpha))
-    
+        """The final theorem conclusion."""
+        self._show_boxed_text("conclusion", alpha)
+
     def update_explanation_panel(self, step_index):
-        """Update the explanation text panel."""
-        
-        self.ax_explanation.clear()
-        self.ax_explanation.set_xlim(0, 1)
-        self.ax_explanation.set_ylim(0, 1)
-        self.ax_explanation.axis('off')
-        
-        # Add background
-        bg_rect = Rectangle((0, 0), 1, 1, facecolor='lightblue', alpha=0.1)
-        self.ax_explanation.add_patch(bg_rect)
-        
-        # Get current explanation
-        if step_index < len(self.explanation_texts):
-            explanation = self.explanation_texts[step_index]
-            
-            # Title
-            self.ax_explanation.text(0.5, 0.95, explanation["title"], 
-                                   ha='center', va='top', fontsize=14, fontweight='bold',
-                                   color='darkblue')
-            
-            # Content
-            y_pos = 0.85
-            for line in explanation["content"]:
-                if line.startswith("🎯") or line.startswith("📊") or line.startswith("✅"):
-                    # Special formatting for key points
-                    self.ax_explanation.text(0.05, y_pos, line, ha='left', va='top', 
-                                           fontsize=11, fontweight='bold', color='darkgreen')
-                elif line.startswith("🔹") or line.startswith("🤔") or line.startswith("📐"):
-                    # Secondary points
-                    self.ax_explanation.text(0.05, y_pos, line, ha='left', va='top', 
-                                           fontsize=10, color='darkblue')
-                elif line == "":
-                    # Empty line for spacing
-                    pass
+        """Rewrite the explanation title and lines for a step."""
+        explanation = self.explanation_texts[step_index]
+        title = self.artists["explanation_title"]
+        title.set_text(explanation["title"])
+        title.set_visible(True)
+
+        for i, text in enumerate(self.explanation_lines):
+            line = explanation["content"][i] if i < len(explanation["content"]) else ""
+            if line.startswith("🎯") or line.startswith("📊") or line.startswith("✅"):
+                # Special formatting for key points
+                text.set(fontsize=11, fontweight='bold', color='darkgreen')
+            elif line.startswith("🔹") or line.startswith("🤔") or line.startswith("📐"):
+                # Secondary points
+                text.set(fontsize=10, fontweight='normal', color='darkblue')
+            else:
+                # Regular text
+                text.set(fontsize=10, fontweight='normal', color='black')
+            text.set_text(line)
+            text.set_visible(bool(line))
+
+    def render_frames(self, segments=(4, 6, 6, 9), dpi=60, blit=True, fade_levels=8):
+        """
+        Yield (RGB array, duration in ms) for the whole animation. Frames that
+        would look the same are merged into one longer frame; the fade-in is
+        sampled at `fade_levels` alpha steps.
+
+        With `blit`, the axes are rendered once, each step's settled content
+        (earlier steps, explanation panel) once per step, and each frame only
+        draws the few artists fading in. Without it every frame is a full redraw.
+        """
+        self.create_figure(segments)
+        self.fig.set_dpi(dpi)
+        canvas = self.fig.canvas
+        self.set_animated(blit)
+        self.init_frame()
+
+        render_seconds = 0.0
+        start = time.perf_counter()
+        if blit:
+            canvas.draw()
+            background = canvas.copy_from_bbox(self.fig.bbox)
+        step_background, background_step = None, None
+
+        previous_key, pending, hold = None, None, 0
+        rendered = total = 0
+        try:
+            for frame_num in range(len(self.animation_steps) * FRAMES_PER_STEP):
+                step_index, frame_in_step = self.frame_state(frame_num)
+                fade = min(frame_in_step / float(FADE_FRAMES), 1.0)
+                key = (step_index, np.ceil(fade * fade_levels))
+                total += 1
+                if key == previous_key:
+                    hold += 1
+                    continue
+                if pending is not None:
+                    render_seconds += time.perf_counter() - start
+                    yield pending, hold * FRAME_INTERVAL_MS
+                    start = time.perf_counter()
+
+                # Sample the fade at the level boundary so merged frames share one look
+                level_frame = int(np.ceil(key[1] / fade_levels * FADE_FRAMES))
+                self.animate_frame(step_index * FRAMES_PER_STEP + level_frame)
+                if blit:
+                    fading = [self.artists[name] for name in self.step_artists.get(step_index, [])]
+                    if background_step != step_index:
+                        canvas.restore_region(background)
+                        for artist in self.dynamic_artists:
+                            if artist.get_visible() and artist not in fading:
+                                artist.axes.draw_artist(artist)
+                        step_background, background_step = canvas.copy_from_bbox(self.fig.bbox), step_index
+                    canvas.restore_region(step_background)
+                    for artist in fading:
+                        if artist.get_visible():
+                            artist.axes.draw_artist(artist)
                 else:
-                    # Regular text
-                    self.ax_explanation.text(0.05, y_pos, line, ha='left', va='top', 
-                                           fontsize=10, color='black')
-                y_pos -= 0.08
-    
-    def save_animation(self, filename="bpt_animation.gif"):
-        """Save the animation as GIF."""
-        anim = self.create_animation()
-        anim.save(filename, writer='pillow', fps=10)
+                    canvas.draw()
+                pending = np.asarray(canvas.buffer_rgba())[..., :3].copy()
+                previous_key, hold = key, 1
+                rendered += 1
+            render_seconds += time.perf_counter() - start
+            if pending is not None:
+                yield pending, hold * FRAME_INTERVAL_MS
+        finally:
+            self.render_stats = {
+                "frames": total,
+                "rendered_frames": rendered,
+                "render_seconds": render_seconds,
+                "rendered_fps": rendered / render_seconds if render_seconds else 0.0,
+                "blit": blit,
+            }
+            close_figure(self.fig)
+
+    def save_animation(self, filename="bpt_animation.gif", segments=(4, 6, 6, 9), dpi=60):
+        """Save the animation as GIF or MP4 (chosen by extension)."""
+        fmt = os.path.splitext(filename)[1].lstrip(".").lower() or "gif"
+        data = render_bpt_animation(tuple(segments), fmt=fmt, dpi=dpi)
+        with open(filename, "wb") as f:
+            f.write(data)
         return filename
 
+
+def encode_gif(frames):
+    """Encode (RGB array, duration ms) pairs as a looping GIF."""
+    images, durations = [], []
+    for rgb, duration in frames:
+        images.append(Image.fromarray(rgb).quantize(colors=128, method=Image.Quantize.FASTOCTREE))
+        durations.append(duration)
+    buffer = io.BytesIO()
+    images[0].save(buffer, format="GIF", save_all=True, append_images=images[1:],
+                   duration=durations, loop=0, disposal=1)
+    return buffer.getvalue()
+
+
+def encode_mp4(frames):
+    """Encode (RGB array, duration ms) pairs as H.264 MP4 through ffmpeg; held frames are repeated."""
+    ffmpeg = shutil.which(matplotlib.rcParams["animation.ffmpeg_path"])
+    if not ffmpeg:
+        raise RuntimeError("ffmpeg is not installed; use GIF output instead")
+    fps = 1000 // FRAME_INTERVAL_MS
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bpt.mp4")
+        process = None
+        for rgb, duration in frames:
+            if process is None:
+                height, width = rgb.shape[:2]
+                process = subprocess.Popen(
+                    [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgb24",
+                     "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+                     "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-pix_fmt", "yuv420p",
+                     "-vcodec", "libx264", path],
+                    stdin=subprocess.PIPE)
+            process.stdin.write(rgb.tobytes() * (duration // FRAME_INTERVAL_MS))
+        process.stdin.close()
+        if process.wait() != 0:
+            raise RuntimeError("ffmpeg failed to encode the animation")
+        with open(path, "rb") as f:
+            return f.read()
+
+
+@cached_plot(with_info=True)
+def render_bpt_animation_with_stats(segments=(4, 6, 6, 9), fmt="gif", dpi=60):
+    """
+    Encoded BPT animation for one (AD, DB, AE, EC) tuple, with the throughput
+    stats of this render: (bytes, stats). Cached on disk by parameters, so
+    repeat requests skip rendering and encoding; stats is None for those.
+    """
+    if fmt not in ("gif", "mp4"):
+        raise ValueError(f"Unsupported animation format: {fmt}. Use 'gif' or 'mp4'")
+    animator = BPTAnimationExplainer()
+    start = time.perf_counter()
+    frames = animator.render_frames(segments, dpi=dpi)
+    data = encode_gif(frames) if fmt == "gif" else encode_mp4(frames)
+    stats = dict(animator.render_stats, format=fmt, bytes=len(data),
+                 total_seconds=time.perf_counter() - start)
+    return data, stats
+
+
+def render_bpt_animation(segments=(4, 6, 6, 9), fmt="gif", dpi=60):
+    """Encoded BPT animation bytes only (cached, see render_bpt_animation_with_stats)."""
+    return render_bpt_animation_with_stats(segments, fmt, dpi)[0]
+
+@lru_cache(maxsize=32)
+def render_keyframes(segments=(4, 6, 6, 9), fmt="png", dpi=80):
+    """
+    One image per animation step, fully faded in, as compressed bytes.
+    All steps are drawn on a single figure with one set of artists, and the
+    result is memoized per segment configuration.
+    """
+    animator = BPTAnimationExplainer()
+    with closing_figure(animator.create_figure(segments)) as fig:
+        keyframes = []
+        for step in range(len(animator.animation_steps)):
+            animator.animate_frame(step * FRAMES_PER_STEP + FRAMES_PER_STEP - 1)
+            keyframes.append(figure_to_bytes(fig, fmt=fmt, dpi=dpi, close=False))
+        return tuple(keyframes)
+
+@cached_plot()
+def render_keyframe_gif(segments=(4, 6, 6, 9), step_ms=1000, dpi=80):
+    """
+    The keyframes as one looping GIF, each step held for step_ms. The browser
+    plays it, so auto-play costs the server one cached encode and nothing more.
+    """
+    frames = [(np.asarray(Image.open(io.BytesIO(png)).convert("RGB")), step_ms)
+              for png in render_keyframes(tuple(segments), fmt="png", dpi=dpi)]
+    return encode_gif(frames)
+
 # Usage function for Streamlit integration
 def create_bpt_animation_for_streamlit(segments=[4, 6, 6, 9]):
-    """Create BPT animation for Streamlit display."""
-    
-    animator = BPTAnimationExplainer()
-    
-    # Create static frames for Streamlit (since Streamlit doesn't support live animation)
-    frames = []
-    
-    # Generate key frames
-    for step in range(len(animator.animation_steps)):
-        fig = plt.figure(figsize=(16, 10))
-        
-        # Setup same layout
-        ax_triangle = plt.subplot2grid((1, 10), (0, 0), colspan=7)
-        ax_explanation = plt.subplot2grid((1, 10), (0, 7), colspan=3)
-        
-        animator.ax_triangle = ax_triangle
-        animator.ax_explanation = ax_explanation
-        animator.setup_triangle_coordinates(segments)
-        animator.configure_axes()
-        
-        # Draw this step
-        step_data = animator.animation_steps[step]
-        animator.draw_animation_step(step_data, 59)  # Full alpha
-        animator.update_explanation_panel(step)
-        
-        frames.append(fig)
-        plt.close()
-    
-    return frames
+    """Create BPT animation keyframes (PNG bytes, one per step) for Streamlit display."""
+    # Streamlit doesn't support live animation, so show one still per step
+    return list(render_keyframes(tuple(segments)))
+
+def create_bpt_autoplay_for_streamlit(segments=[4, 6, 6, 9]):
+    """Auto-playing BPT animation (GIF bytes, one step per second) for st.image."""
+    return render_keyframe_gif(tuple(segments))
 
 # Interactive BPT demonstration
 def interactive_bpt_demo():
     """Create interactive BPT demonstration with sliders."""
-    
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
-    
+
     # Will be implemented with matplotlib widgets
     # This allows real-time manipulation of point D position
     # and shows how ratios change dynamically
-    
+
     pass
 
 if __name__ == "__main__":
-    # Test the animation
+    # Test the animation (figures are off-screen, so write it out)
     animator = BPTAnimationExplainer()
-    anim = animator.create_animation([4, 6, 6, 9])
-    plt.show()
\ No newline at end of file
+    print(animator.save_animation("bpt_animation.gif", [4, 6, 6, 9]))
@@ -3,7 +3,8 @@
 import json
 import streamlit as st
 from typing import Dict, Any, List
-from .animations.bpt_animation import BPTAnimationExplainer, create_bpt_animation_for_streamlit
+from .animations.bpt_animation import (BPTAnimationExplainer, create_bpt_animation_for_streamlit,
+                                      create_bpt_autoplay_for_streamlit)
 
 class EducationalIntentHandler:
     """Handles educational intents for theorem explanations and animations."""
@@ -155,9 +156,13 @@ The proof uses similar triangles and corresponding angles.
         return explanation
     
     def create_bpt_animation_for_streamlit(self, segments: List[float] = [4, 6, 6, 9]):
-        """Create BPT animation frames for Streamlit display."""
+        """Create BPT keyframe images (PNG bytes, one per step) for Streamlit display."""
         return create_bpt_animation_for_streamlit(segments)
 
+    def create_bpt_autoplay_for_streamlit(self, segments: List[float] = [4, 6, 6, 9]) -> bytes:
+        """Create the auto-playing BPT animation (animated GIF bytes) for Streamlit display."""
+        return create_bpt_autoplay_for_streamlit(segments)
+
 # Streamlit Integration Functions
 def add_educational_features_to_triangle_handler():
     """Add educational features to the triangle handler."""
@@ -201,17 +206,11 @@ def add_educational_features_to_triangle_handler():
                         # Display frames with navigation
                         if frames:
                             frame_number = st.slider("Animation Step", 0, len(frames)-1, 0)
-                            st.pyplot(frames[frame_number])
+                            st.image(frames[frame_number])
                             
-                            # Auto-play option
+                            # Auto-play option: an animated GIF, played by the browser
                             if st.checkbox("Auto-play animation"):
-                                import time
-                                placeholder = st.empty()
-                                for i, frame in enumerate(frames):
-                                    placeholder.pyplot(frame)
-                                    time.sleep(1)
-                                    if i < len(frames) - 1:
-                                        placeholder.empty()
+                                st.image(educational_handler.create_bpt_autoplay_for_streamlit())
                         
                         # Interactive elements
                         st.markdown("### 🎮 Interactive Exploration")
@@ -230,7 +229,7 @@ def add_educational_features_to_triangle_handler():
                         if st.button("🎯 Show Custom BPT"):
                             custom_frames = educational_handler.create_bpt_animation_for_streamlit([AD, DB, AE, EC])
                             if custom_frames:
-                                st.pyplot(custom_frames[-1])  # Show final frame
+                                st.image(custom_frames[-1])  # Show final frame
                                 
                                 # Calculate and show ratios
                                 ratio1 = AD / DB
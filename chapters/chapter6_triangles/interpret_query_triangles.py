@@ -1,11 +1,16 @@
-import os
 import re
-from dotenv import load_dotenv
-from groq import Groq
+from utils.intent_cache import cached_intent
+from utils.llm_gateway import llm_gateway
+from utils.query_tokens import NUMBER, register, tokenize
 
-load_dotenv()
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+# Pattern 1: "sides 3, 4, 5" or "sides are 3, 4, 5"
+SIDES_PATTERN = register(
+    "triangle.sides", rf'sides?\s*(?:are\s*)?({NUMBER})\s*,\s*({NUMBER})\s*,\s*({NUMBER})', re.IGNORECASE
+)
+# Pattern 2: Triangle notation like (3,4,5)
+TRIPLE_PATTERN = register("triangle.triple", rf'\(({NUMBER})\s*,\s*({NUMBER})\s*,\s*({NUMBER})\)')
 
+@cached_intent("triangles")
 def interpret_query_triangles(query: str) -> dict:
     """
     Uses LLM to interpret natural language queries related to triangles.
@@ -37,12 +42,8 @@ Query: "{query}"
 """
 
     try:
-        response = client.chat.completions.create(
-            model="llama3-8b-8192",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.2
-        )
-        content = response.choices[0].message.content.strip()
+        # Deadline, concurrency limit and circuit breaker are enforced by the gateway
+        content = llm_gateway.complete(prompt, temperature=0.2).strip()
         if content.startswith("{"):
             import json
             return json.loads(content)
@@ -56,37 +57,27 @@ def extract_triangle_measurements(query: str) -> dict:
     Extract triangle measurements from query using regex.
     """
     measurements = {}
+    tokens = tokenize(query)
     
     # Common patterns for sides
-    # Pattern 1: "sides 3, 4, 5" or "sides are 3, 4, 5"
-    sides_pattern = r'sides?\s*(?:are\s*)?(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)'
-    sides_match = re.search(sides_pattern, query, re.IGNORECASE)
+    sides_match = SIDES_PATTERN.search(query)
     if sides_match:
         measurements['sides'] = [float(sides_match.group(i)) for i in range(1, 4)]
     
-    # Pattern 2: Triangle notation like (3,4,5)
-    triangle_pattern = r'\((\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\)'
-    triangles = re.findall(triangle_pattern, query)
+    triangles = TRIPLE_PATTERN.findall(query)
     if triangles:
         measurements['triangles'] = [[float(x) for x in t] for t in triangles]
     
-    # Pattern for base and height
-    base_pattern = r'base[:\s=]+(\d+(?:\.\d+)?)'
-    height_pattern = r'height[:\s=]+(\d+(?:\.\d+)?)'
+    # Base and height: the number right after the label ("base 3", "base: 3", "base = 3")
+    base, height = tokens.label("base"), tokens.label("height")
+    if base is not None:
+        measurements['base'] = float(base)
+    if height is not None:
+        measurements['height'] = float(height)
     
-    base_match = re.search(base_pattern, query, re.IGNORECASE)
-    height_match = re.search(height_pattern, query, re.IGNORECASE)
-    
-    if base_match:
-        measurements['base'] = float(base_match.group(1))
-    if height_match:
-        measurements['height'] = float(height_match.group(1))
-    
-    # Pattern for angles
-    angle_pattern = r'(\d+(?:\.\d+)?)\s*(?:degree|deg|°)'
-    angles = re.findall(angle_pattern, query, re.IGNORECASE)
-    if angles:
-        measurements['angles'] = [float(a) for a in angles]
+    # Angles: numbers followed by °, deg or degree(s)
+    if tokens.angles:
+        measurements['angles'] = [float(a) for a in tokens.angles]
     
     # Check for specific terms
     if 'hypotenuse' in query.lower():
@@ -1,18 +1,21 @@
 # File: chapters/chapter6_triangles/main_router.py
 
-import re
 import math
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple
+from utils.query_tokens import register, tokenize
+
+PARENTHESISED_GROUP = register("triangle.group", r'\(([^)]+)\)')
 
 # Import your solvers with CORRECT paths and error handling
 try:
-    from chapters.chapter6_triangles.sub_chapters.right_triangle.solver_right_triangle import solve_right_triangle
+    from chapters.chapter6_triangles.sub_chapters.right_triangle.solver_right_triangle import solve_right_triangle, solve_right_triangle_result
 except ImportError:
     def solve_right_triangle(params):
         return "❌ Right triangle solver not available. Check solver_right_triangle.py file."
+    solve_right_triangle_result = solve_right_triangle
 
 try:
-    from chapters.chapter6_triangles.sub_chapters.similar_triangles.solver_similar import solve_similar_triangles
+    from chapters.chapter6_triangles.sub_chapters.similar_triangles.solver_similar import solve_similar_triangles, solve_similar_triangles_result
     # Try to also import the similarity check function
     try:
         from chapters.chapter6_triangles.sub_chapters.similar_triangles.solver_similar import check_similarity_sss
@@ -22,6 +25,7 @@ try:
 except ImportError:
     def solve_similar_triangles(params):
         return "❌ Similar triangles solver not available. Check solver_similar.py file."
+    solve_similar_triangles_result = solve_similar_triangles
     def check_similarity_sss(triangle1, triangle2):
         return check_similarity_sss_inline(triangle1, triangle2)
 
@@ -39,22 +43,41 @@ except ImportError:
     def extract_triangle_measurements(query):
         return {}
 
+try:
+    from intent_classifier import interpret_with_fallback
+except ImportError:
+    def interpret_with_fallback(chapter, query, llm_interpreter, extract_parameters=None):
+        return llm_interpreter(query)
+
 def route_query(query: str) -> str:
     """
     Main router function that parses natural language queries 
     and routes them to appropriate triangle solvers.
     """
+    return _as_text(solve_query(query))
+
+def _as_text(result) -> str:
+    return result if isinstance(result, str) else result.text
+
+def solve_query(query: str):
+    """
+    Like route_query, but right and similar triangle problems come back as
+    their solution objects (numbers + text) so the caller can draw them
+    with chapters.chapter6_triangles.visualization. Nothing is rendered here.
+    """
     try:
         if not query or not query.strip():
             return "❌ Please enter a query about triangles."
         
         query = query.lower().strip()
         
-        # First try using your existing LLM interpreter
+        # First try the local intent classifier; the LLM is only asked when it is unsure
         try:
-            llm_result = interpret_query_triangles(query)
-            if llm_result.get("intent") != "error" and llm_result.get("intent") != "unknown":
-                return route_by_intent(llm_result)
+            intent_result = interpret_with_fallback(
+                "triangles", query, interpret_query_triangles, extract_intent_parameters
+            )
+            if intent_result.get("intent") != "error" and intent_result.get("intent") != "unknown":
+                return route_by_intent_result(intent_result, query)
         except:
             # Fall back to regex parsing if LLM fails
             pass
@@ -64,9 +87,9 @@ def route_query(query: str) -> str:
         
         # Route to appropriate solver
         if query_type == "right_triangle":
-            return solve_right_triangle(params)
+            return solve_right_triangle_result(params)
         elif query_type == "similar_triangles":
-            return solve_similar_triangles(params)
+            return solve_similar_triangles_result(params)
         elif query_type == "similarity_check":
             # Try to use the similarity check function if available
             try:
@@ -86,13 +109,17 @@ def route_query(query: str) -> str:
     except Exception as e:
         return f"❌ Error processing query: {str(e)}\n\n" + generate_help_message(query)
 
-def route_by_intent(llm_result: dict) -> str:
-    """Route based on LLM interpretation."""
+def route_by_intent(llm_result: dict, query: str = "") -> str:
+    """Route based on LLM or local classifier interpretation."""
+    return _as_text(route_by_intent_result(llm_result, query))
+
+def route_by_intent_result(llm_result: dict, query: str = ""):
+    """route_by_intent, keeping solution objects (see solve_query)."""
     intent = llm_result.get("intent")
     params = llm_result.get("parameters", {})
     
-    if intent == "solve_right_triangle":
-        return solve_right_triangle(params)
+    if intent in ("solve_right_triangle", "apply_pythagoras"):
+        return solve_right_triangle_result(params)
     elif intent == "check_similarity":
         # Convert parameters to expected format
         if "triangle1" in params and "triangle2" in params:
@@ -106,8 +133,34 @@ def route_by_intent(llm_result: dict) -> str:
         return calculate_triangle_area(params)
     elif intent == "apply_bpt":
         return solve_bpt(params)
+    elif intent == "find_angles":
+        return calculate_triangle_angles_from_sides(params)
     else:
-        return generate_help_message(str(llm_result))
+        return generate_help_message(query)
+
+def extract_intent_parameters(intent: str, query: str) -> Dict[str, Any]:
+    """
+    Build solver parameters for a locally classified intent using the regex parsers.
+    Returns None when the values cannot be read, so the LLM gets a chance instead.
+    """
+    measurements = extract_triangle_measurements(query)
+    numbers = extract_numbers(query)
+    
+    if intent in ("solve_right_triangle", "apply_pythagoras"):
+        return parse_right_triangle_params(query, numbers, measurements) or None
+    elif intent == "check_similarity":
+        params = parse_similarity_check_params(query, numbers, measurements)
+        return params if params["triangle1"] and params["triangle2"] else None
+    elif intent == "calculate_area":
+        params = parse_area_params(query, numbers, measurements)
+        return params if len(params.get("sides", ())) == 3 or "base" in params else None
+    elif intent == "apply_bpt":
+        params = parse_bpt_params(query, numbers)
+        return params if len(params["segments"]) == 4 else None
+    elif intent == "find_angles":
+        params = parse_angle_params(query, numbers, measurements)
+        return params if len(params["sides"]) == 3 else None
+    return None
 
 def parse_triangle_query(query: str) -> Tuple[str, Dict[str, Any]]:
     """
@@ -177,10 +230,7 @@ def parse_triangle_query(query: str) -> Tuple[str, Dict[str, Any]]:
 
 def extract_numbers(text: str) -> List[float]:
     """Extract all numbers from text."""
-    # Pattern to match integers and decimals
-    pattern = r'\b\d+\.?\d*\b'
-    matches = re.findall(pattern, text)
-    return [float(match) for match in matches]
+    return [float(number) for number in tokenize(text).numbers]
 
 def parse_right_triangle_params(query: str, numbers: List[float], measurements: dict) -> Dict[str, Any]:
     """Parse parameters for right triangle problems."""
@@ -232,8 +282,7 @@ def parse_similarity_check_params(query: str, numbers: List[float], measurements
         }
     else:
         # Look for patterns like (3,4,5) and (6,8,10)
-        pattern = r'\(([^)]+)\)'
-        matches = re.findall(pattern, query)
+        matches = PARENTHESISED_GROUP.findall(query)
         if len(matches) >= 2:
             try:
                 triangle1 = [float(x.strip()) for x in matches[0].split(',')]
@@ -1,21 +1,36 @@
+# File: chapters/chapter6_triangles/sub_chapters/right_triangle/solver_right_triangle.py
+
 import math
-import os
-from typing import Dict, Any
-from chapters.chapter6_triangles.utils.triangle_plotter import TrianglePlotter
+from typing import Dict, Any, NamedTuple, Union
+
+
+class RightTriangleSolution(NamedTuple):
+    """Numbers and step text for a solved right triangle (drawn separately by visualization.py)."""
+    base: float
+    height: float
+    hypotenuse: float
+    angle_A: float
+    angle_B: float
+    area: float
+    perimeter: float
+    text: str
+
 
 def solve_right_triangle(params: Dict[str, Any]) -> str:
     """
-    Solve right triangle problems: hypotenuse, angles, area, perimeter + plot.
+    Solve right triangle problems: hypotenuse, angles, area, perimeter.
     """
+    solution = solve_right_triangle_result(params)
+    return solution if isinstance(solution, str) else solution.text
+
+
+def solve_right_triangle_result(params: Dict[str, Any]) -> Union[RightTriangleSolution, str]:
+    """The RightTriangleSolution for params, or the ❌ message."""
     try:
         base = params.get("base", 0)
         height = params.get("height", 0)
         hypotenuse = params.get("hypotenuse", 0)
         angle = params.get("angle", 0)
-        
-        # Initialize plotter
-        plotter = TrianglePlotter()
-        plot_info = None
 
         # Case 1: Given base and height
         if base > 0 and height > 0:
@@ -28,16 +43,6 @@ def solve_right_triangle(params: Dict[str, Any]) -> str:
             area = 0.5 * base * height
             perimeter = base + height + hypotenuse
             
-            # Generate plot
-            try:
-                fig = plotter.plot_right_triangle(base, height)
-                plot_path = "static/plots/right_triangle_auto.png"
-                os.makedirs("static/plots", exist_ok=True)
-                fig.savefig(plot_path, dpi=300, bbox_inches='tight')
-                plot_info = f"![Right Triangle]({plot_path})"
-            except Exception as e:
-                plot_info = f"⚠️ Plot generation failed: {str(e)}"
-            
             result = f"""
 ✅ **Right Triangle Solution:**
 
@@ -73,9 +78,6 @@ Given:
    • Perimeter = base + height + hypotenuse
    • Perimeter = {base} + {height} + {hypotenuse:.2f}
    • Perimeter = **{perimeter:.2f} cm**
-
-📊 **Visualization:**
-{plot_info}
 """
         
         # Case 2: Given hypotenuse and one angle
@@ -87,16 +89,7 @@ Given:
             height = hypotenuse * math.sin(angle_rad)
             other_angle = 90 - angle
             area = 0.5 * base * height
-            
-            # Generate plot
-            try:
-                fig = plotter.plot_right_triangle(base, height)
-                plot_path = "static/plots/right_triangle_auto.png"
-                os.makedirs("static/plots", exist_ok=True)
-                fig.savefig(plot_path, dpi=300, bbox_inches='tight')
-                plot_info = f"![Right Triangle]({plot_path})"
-            except Exception as e:
-                plot_info = f"⚠️ Plot generation failed: {str(e)}"
+            angle_B, angle_A = angle, other_angle
 
             result = f"""
 ✅ **Right Triangle Solution:**
@@ -127,9 +120,6 @@ Given:
    • Area = ½ × base × height
    • Area = ½ × {base:.2f} × {height:.2f}
    • Area = **{area:.2f} cm²**
-
-📊 **Visualization:**
-{plot_info}
 """
 
         # Case 3: Given hypotenuse and one side
@@ -157,16 +147,6 @@ Given:
             angle_B = math.degrees(math.atan(height / base))
             angle_A = 90 - angle_B
             area = 0.5 * base * height
-            
-            # Generate plot
-            try:
-                fig = plotter.plot_right_triangle(base, height)
-                plot_path = "static/plots/right_triangle_auto.png"
-                os.makedirs("static/plots", exist_ok=True)
-                fig.savefig(plot_path, dpi=300, bbox_inches='tight')
-                plot_info = f"![Right Triangle]({plot_path})"
-            except Exception as e:
-                plot_info = f"⚠️ Plot generation failed: {str(e)}"
 
             result = f"""
 ✅ **Right Triangle Solution:**
@@ -198,15 +178,13 @@ Given:
    • Area = ½ × base × height
    • Area = ½ × {base:.2f} × {height:.2f}
    • Area = **{area:.2f} cm²**
-
-📊 **Visualization:**
-{plot_info}
 """
         
         else:
-            result = "❌ Insufficient data. Need at least:\n• Base and height, OR\n• Hypotenuse and one angle, OR\n• Hypotenuse and one other side."
+            return "❌ Insufficient data. Need at least:\n• Base and height, OR\n• Hypotenuse and one angle, OR\n• Hypotenuse and one other side."
         
-        return result
+        return RightTriangleSolution(base, height, hypotenuse, angle_A, angle_B, area,
+                                     base + height + hypotenuse, result)
 
     except Exception as e:
         return f"❌ Error solving right triangle: {str(e)}"
\ No newline at end of file
@@ -1,22 +1,34 @@
 import math
-import streamlit as st
-import numpy as np
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple, Union
 from ...utils.triangle_base import TriangleBase, TriangleData
-from ...utils.triangle_plotter import TrianglePlotter
+
+class SimilarTrianglesSolution(NamedTuple):
+    """Numbers and step text for two triangles checked for similarity (drawn separately by visualization.py)."""
+    triangle1: Tuple[float, float, float]
+    triangle2: Tuple[float, float, float]
+    is_similar: bool
+    scale_factor: Optional[float]
+    angles1: Tuple[float, ...]
+    angles2: Tuple[float, ...]
+    text: str
 
 def solve_similar_triangles(params: Dict) -> str:
     """Entry point for similar triangles solver."""
     solver = SimilarTriangleSolver()
     return solver.solve(params)
 
+def solve_similar_triangles_result(params: Dict) -> Union[SimilarTrianglesSolution, str]:
+    """The SimilarTrianglesSolution for params, or the ❌ message."""
+    return SimilarTriangleSolver().solve_result(params)
+
 class SimilarTriangleSolver(TriangleBase):
-    def __init__(self):
-        super().__init__()
-        self.plotter = TrianglePlotter()
-    
     def solve(self, params: Dict) -> str:
         """Solve similar triangles problem."""
+        solution = self.solve_result(params)
+        return solution if isinstance(solution, str) else solution.text
+
+    def solve_result(self, params: Dict) -> Union[SimilarTrianglesSolution, str]:
+        """Solve similar triangles problem; no drawing, so it is safe outside Streamlit."""
         try:
             # Extract parameters
             triangle1_sides = params.get('triangle1', [])
@@ -41,6 +53,7 @@ class SimilarTriangleSolver(TriangleBase):
             
             # Prepare response
             response = []
+            angles1 = angles2 = ()
             
             if is_similar:
                 response.append("✅ The triangles are similar!")
@@ -73,25 +86,6 @@ class SimilarTriangleSolver(TriangleBase):
                 response.append(f"Second triangle: {area2:.2f} square units")
                 response.append(f"Area ratio: {(area2/area1):.2f} (should be square of scale factor)")
                 
-                # Visualize triangles
-                response.append("\n📐 **Visualization:**")
-                
-                # Calculate points for visualization
-                points1 = self._calculate_triangle_points(triangle1.sides)
-                points2 = self._calculate_triangle_points(triangle2.sides)
-                
-                # Plot triangles
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write("First Triangle")
-                    fig1 = self.plotter.plot_triangle(points1, angles1)
-                    st.pyplot(fig1)
-                
-                with col2:
-                    st.write("Second Triangle")
-                    fig2 = self.plotter.plot_triangle(points2, angles2)
-                    st.pyplot(fig2)
-                
                 # Explanation
                 response.append("\n📐 **Explanation:**")
                 response.append("Two triangles are similar if their corresponding sides are proportional.")
@@ -114,29 +108,14 @@ class SimilarTriangleSolver(TriangleBase):
                 response.append("\nFor triangles to be similar, all side ratios must be equal.")
                 response.append("In this case, the ratios are different, which means the triangles are not similar.")
             
-            return "\n".join(response)
+            return SimilarTrianglesSolution(
+                tuple(triangle1.sides), tuple(triangle2.sides), is_similar,
+                scale_factor if is_similar else None,
+                tuple(map(float, angles1)), tuple(map(float, angles2)), "\n".join(response)
+            )
             
         except Exception as e:
             return f"❌ Error: {str(e)}"
-    
-    def _calculate_triangle_points(self, sides: List[float]) -> List[Tuple[float, float]]:
-        """Calculate points for triangle visualization."""
-        # Place first point at origin
-        points = [(0, 0)]
-        
-        # Place second point on x-axis
-        points.append((sides[0], 0))
-        
-        # Calculate third point using cosine law
-        a, b, c = sides
-        cos_C = (a**2 + b**2 - c**2) / (2 * a * b)
-        sin_C = np.sqrt(1 - cos_C**2)
-        
-        x = a * cos_C
-        y = a * sin_C
-        points.append((x, y))
-        
-        return points
 
 def check_similarity_sss(sides1: List[float], sides2: List[float]) -> str:
     """
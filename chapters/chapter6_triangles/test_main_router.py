@@ -0,0 +1,52 @@
+# File: chapters/chapter6_triangles/test_main_router.py
+
+import sys
+import os
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.abspath(__file__), "../../.."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from chapters.chapter6_triangles import main_router
+
+
+def with_llm(answer):
+    """Swap the LLM interpreter for one returning `answer`; returns the list of queries it saw."""
+    calls = []
+
+    def interpret(query):
+        calls.append(query)
+        return answer
+
+    main_router.interpret_query_triangles = interpret
+    return calls
+
+
+def test_missing_numbers_defer_to_the_llm():
+    original = main_router.interpret_query_triangles
+    try:
+        calls = with_llm({"intent": "calculate_area", "parameters": {"sides": [3, 4, 5]}})
+        assert main_router.extract_intent_parameters("calculate_area", "find area of triangle") is None
+        assert main_router.extract_intent_parameters("apply_bpt", "verify bpt with ad = 2") is None
+        answer = main_router.route_query("find area of triangle")
+        assert calls == ["find area of triangle"]
+        assert "Heron" in answer and "6.00" in answer
+    finally:
+        main_router.interpret_query_triangles = original
+
+
+def test_unhandled_intent_echoes_the_query():
+    original = main_router.interpret_query_triangles
+    try:
+        with_llm({"intent": "formula_request", "parameters": {}})
+        assert main_router.extract_intent_parameters("formula_request", "state the pythagoras theorem") is None
+        answer = main_router.route_query("state the pythagoras theorem")
+        assert '"state the pythagoras theorem"' in answer
+        assert "'intent'" not in answer
+    finally:
+        main_router.interpret_query_triangles = original
+
+
+if __name__ == "__main__":
+    test_missing_numbers_defer_to_the_llm()
+    test_unhandled_intent_echoes_the_query()
+    print("All triangle router tests passed")
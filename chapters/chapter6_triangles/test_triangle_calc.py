@@ -1,8 +1,17 @@
 import math
 from typing import Dict, Any
-import matplotlib.pyplot as plt
 import numpy as np
 import os
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.abspath(__file__), "../../.."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.figures import figure_to_bytes, managed_subplots
+
+# Diagrams go to the temp directory, not the tracked chapters/chapter6_triangles/plots
+PLOT_DIR = os.path.join(tempfile.gettempdir(), "cbse4fun_test_plots")
 
 def test_right_triangle_calc():
     """Test right triangle calculations with different input cases."""
@@ -230,76 +239,71 @@ Given:
 def plot_triangle(sides, angles, save_name="triangle_plot.png"):
     """Plot a triangle with given sides and angles."""
     # Create figure and axis
-    fig, ax = plt.subplots(figsize=(10, 10))
-    
-    # Calculate coordinates using law of cosines
-    a, b, c = sides
-    A, B, C = angles
-    
-    # For right triangles, place the right angle at the origin
-    if C == 90:  # Right angle is C
-        x1, y1 = 0, 0  # Right angle vertex
-        x2, y2 = a, 0  # Base vertex
-        x3, y3 = 0, b  # Height vertex
-    elif B == 90:  # Right angle is B
-        x1, y1 = 0, 0  # Right angle vertex
-        x2, y2 = c, 0  # Base vertex
-        x3, y3 = c, a  # Height vertex
-    else:  # Right angle is A
-        x1, y1 = 0, 0  # Right angle vertex
-        x2, y2 = b, 0  # Base vertex
-        x3, y3 = 0, c  # Height vertex
+    with managed_subplots(figsize=(10, 10)) as (fig, ax):
     
-    # Plot triangle
-    ax.plot([x1, x2], [y1, y2], 'b-', linewidth=2)  # Base
-    ax.plot([x1, x3], [y1, y3], 'b-', linewidth=2)  # Height
-    ax.plot([x2, x3], [y2, y3], 'b-', linewidth=2)  # Hypotenuse
+        # Calculate coordinates using law of cosines
+        a, b, c = sides
+        A, B, C = angles
     
-    # Add angle arcs
-    def plot_angle_arc(x, y, angle, radius, start_angle=0):
-        arc_theta = np.linspace(start_angle, start_angle + np.radians(angle), 100)
-        arc_x = x + radius * np.cos(arc_theta)
-        arc_y = y + radius * np.sin(arc_theta)
-        ax.plot(arc_x, arc_y, 'r-')
-        # Adjust text position to be inside the triangle
-        text_x = x + radius*0.5*np.cos(np.radians(start_angle + angle/2))
-        text_y = y + radius*0.5*np.sin(np.radians(start_angle + angle/2))
-        ax.text(text_x, text_y, f'{angle}°', ha='center', va='center')
+        # For right triangles, place the right angle at the origin
+        if C == 90:  # Right angle is C
+            x1, y1 = 0, 0  # Right angle vertex
+            x2, y2 = a, 0  # Base vertex
+            x3, y3 = 0, b  # Height vertex
+        elif B == 90:  # Right angle is B
+            x1, y1 = 0, 0  # Right angle vertex
+            x2, y2 = c, 0  # Base vertex
+            x3, y3 = c, a  # Height vertex
+        else:  # Right angle is A
+            x1, y1 = 0, 0  # Right angle vertex
+            x2, y2 = b, 0  # Base vertex
+            x3, y3 = 0, c  # Height vertex
     
-    # Plot angle arcs with smaller radius
-    arc_radius = min(a, b, c) * 0.15
-    plot_angle_arc(x1, y1, A, arc_radius)
-    plot_angle_arc(x2, y2, B, arc_radius, start_angle=180)
-    plot_angle_arc(x3, y3, C, arc_radius, start_angle=-B)
+        # Plot triangle
+        ax.plot([x1, x2], [y1, y2], 'b-', linewidth=2)  # Base
+        ax.plot([x1, x3], [y1, y3], 'b-', linewidth=2)  # Height
+        ax.plot([x2, x3], [y2, y3], 'b-', linewidth=2)  # Hypotenuse
     
-    # Add side labels with correct positions
-    ax.text((x1 + x2)/2, -0.5, f'Base = {a:.1f} cm', ha='center')
-    ax.text(-0.5, (y1 + y3)/2, f'Hypotenuse = {b:.1f} cm', va='center')
-    ax.text((x2 + x3)/2, (y2 + y3)/2, f'Height = {c:.1f} cm', ha='center')
+        # Add angle arcs
+        def plot_angle_arc(x, y, angle, radius, start_angle=0):
+            arc_theta = np.linspace(start_angle, start_angle + np.radians(angle), 100)
+            arc_x = x + radius * np.cos(arc_theta)
+            arc_y = y + radius * np.sin(arc_theta)
+            ax.plot(arc_x, arc_y, 'r-')
+            # Adjust text position to be inside the triangle
+            text_x = x + radius*0.5*np.cos(np.radians(start_angle + angle/2))
+            text_y = y + radius*0.5*np.sin(np.radians(start_angle + angle/2))
+            ax.text(text_x, text_y, f'{angle}°', ha='center', va='center')
     
-    # Calculate and display area
-    area = 0.5 * a * c  # For right triangle
-    ax.text(-max(sides), max(sides), f'Area = {area:.2f} cm²',
-            bbox=dict(facecolor='white', alpha=0.8))
+        # Plot angle arcs with smaller radius
+        arc_radius = min(a, b, c) * 0.15
+        plot_angle_arc(x1, y1, A, arc_radius)
+        plot_angle_arc(x2, y2, B, arc_radius, start_angle=180)
+        plot_angle_arc(x3, y3, C, arc_radius, start_angle=-B)
     
-    # Set equal aspect ratio and limits
-    ax.set_aspect('equal')
-    margin = max(sides) * 0.2
-    ax.set_xlim(-margin, max(sides) + margin)
-    ax.set_ylim(-margin, max(sides) + margin)
+        # Add side labels with correct positions
+        ax.text((x1 + x2)/2, -0.5, f'Base = {a:.1f} cm', ha='center')
+        ax.text(-0.5, (y1 + y3)/2, f'Hypotenuse = {b:.1f} cm', va='center')
+        ax.text((x2 + x3)/2, (y2 + y3)/2, f'Height = {c:.1f} cm', ha='center')
     
-    # Remove axes
-    ax.axis('off')
+        # Calculate and display area
+        area = 0.5 * a * c  # For right triangle
+        ax.text(-max(sides), max(sides), f'Area = {area:.2f} cm²',
+                bbox=dict(facecolor='white', alpha=0.8))
     
-    # Create plots directory if it doesn't exist
-    os.makedirs('chapters/chapter6_triangles/plots', exist_ok=True)
+        # Set equal aspect ratio and limits
+        ax.set_aspect('equal')
+        margin = max(sides) * 0.2
+        ax.set_xlim(-margin, max(sides) + margin)
+        ax.set_ylim(-margin, max(sides) + margin)
     
-    # Save the plot
-    plt.savefig(f'chapters/chapter6_triangles/plots/{save_name}',
-                bbox_inches='tight', dpi=300)
-    plt.close()
+        # Remove axes
+        ax.axis('off')
     
-    return f'chapters/chapter6_triangles/plots/{save_name}'
+        # Write the PNG bytes to the temp directory and link that file
+        plot_path = os.path.join(PLOT_DIR, save_name)
+        figure_to_bytes(fig, dpi=300, save_path=plot_path, bbox_inches='tight')
+    return plot_path
 
 if __name__ == "__main__":
     test_right_triangle_calc() 
\ No newline at end of file
@@ -1,9 +1,12 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from typing import List, Tuple, Dict, Any
+from utils.figures import create_subplots
 from .triangle_base import TriangleBase
 
 class TrianglePlotter:
+    """Builds triangle figures; the caller takes ownership with utils.figures.closing_figure."""
+
     def __init__(self):
         self.base = TriangleBase()
         self.config = self.base.config["plotting"]
@@ -21,7 +24,7 @@ class TrianglePlotter:
         y = [0, 0, b * sin_A, 0]
         
         # Create figure
-        fig, ax = plt.subplots(figsize=(8, 6))
+        fig, ax = create_subplots(figsize=(8, 6))
         ax.plot(x, y, color=color, linewidth=2)
         ax.fill(x, y, color=color, alpha=alpha)
         
@@ -46,7 +49,7 @@ class TrianglePlotter:
                              scale_factor: float = 1.0) -> plt.Figure:
         """Plot two similar triangles with their corresponding sides."""
         # Create figure with two subplots
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        fig, (ax1, ax2) = create_subplots(1, 2, figsize=(14, 6))
         
         # Plot first triangle directly on ax1
         self._plot_triangle_on_axis(ax1, triangle1, "Triangle 1", "blue", 0.3)
@@ -70,7 +73,7 @@ class TrianglePlotter:
         fig.text(0.5, 0.02, info_text, ha='center', fontsize=11,
                 bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow', alpha=0.9))
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
     def _plot_triangle_on_axis(self, ax, sides: List[float], title: str, color: str, alpha: float):
@@ -133,7 +136,7 @@ class TrianglePlotter:
         y = [0, 0, height, 0]
         
         # Create figure
-        fig, ax = plt.subplots(figsize=(8, 6))
+        fig, ax = create_subplots(figsize=(8, 6))
         ax.plot(x, y, color='blue', linewidth=2)
         ax.fill(x, y, color='blue', alpha=0.3)
         
@@ -191,7 +194,7 @@ class TrianglePlotter:
         AD, DB, AE, EC = segments[:4]
         
         # Create figure
-        fig, ax = plt.subplots(figsize=(10, 7))
+        fig, ax = create_subplots(figsize=(10, 7))
         
         # Calculate proportional coordinates
         total_base = AD + DB
@@ -0,0 +1,62 @@
+# File: chapters/chapter6_triangles/visualization.py
+
+"""
+Optional drawing stage for the triangle solvers.
+
+The solvers return numbers and step text only (RightTriangleSolution,
+SimilarTrianglesSolution); the UI passes a solution to render_solution() when
+it wants a picture. Images are rendered in memory and go through the shared
+plot cache, so the same triangle is only drawn once.
+"""
+
+from typing import Optional, Sequence
+
+from utils.figures import closing_figure, figure_to_bytes
+from utils.plot_cache import cached_plot
+from chapters.chapter6_triangles.utils.triangle_plotter import TrianglePlotter
+from chapters.chapter6_triangles.sub_chapters.right_triangle.solver_right_triangle import RightTriangleSolution
+from chapters.chapter6_triangles.sub_chapters.similar_triangles.solver_similar import SimilarTrianglesSolution
+
+DPI = 150
+
+_plotter = None
+
+
+def _get_plotter() -> TrianglePlotter:
+    """One TrianglePlotter per process (it reads the chapter config on creation)."""
+    global _plotter
+    if _plotter is None:
+        _plotter = TrianglePlotter()
+    return _plotter
+
+
+@cached_plot()
+def render_right_triangle(base: float, height: float, fmt: str = "png") -> bytes:
+    """Right triangle with legs base and height."""
+    with closing_figure(_get_plotter().plot_right_triangle(base, height)) as fig:
+        return figure_to_bytes(fig, fmt=fmt, dpi=DPI, bbox_inches='tight')
+
+
+@cached_plot()
+def render_triangle(sides: Sequence[float], title: str = "Triangle", fmt: str = "png") -> bytes:
+    """Any valid triangle from its three sides."""
+    with closing_figure(_get_plotter().plot_triangle(list(sides), title)) as fig:
+        return figure_to_bytes(fig, fmt=fmt, dpi=DPI, bbox_inches='tight')
+
+
+@cached_plot()
+def render_similar_triangles(triangle1: Sequence[float], triangle2: Sequence[float],
+                             scale_factor: float = 1.0, fmt: str = "png") -> bytes:
+    """Two triangles side by side with their areas and scale factor."""
+    with closing_figure(_get_plotter().plot_similar_triangles(list(triangle1), list(triangle2), scale_factor)) as fig:
+        return figure_to_bytes(fig, fmt=fmt, dpi=DPI, bbox_inches='tight')
+
+
+def render_solution(solution, fmt: str = "png") -> Optional[bytes]:
+    """Image for a solver result; None when there is nothing to draw (e.g. a ❌ message)."""
+    if isinstance(solution, RightTriangleSolution):
+        return render_right_triangle(solution.base, solution.height, fmt=fmt)
+    if isinstance(solution, SimilarTrianglesSolution):
+        scale_factor = solution.scale_factor if solution.scale_factor is not None else 1.0
+        return render_similar_triangles(solution.triangle1, solution.triangle2, scale_factor, fmt=fmt)
+    return None
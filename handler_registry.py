@@ -0,0 +1,118 @@
+# File: cbse_math_solver/handler_registry.py
+
+import importlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config", "chapters_config.json")
+
+
+@dataclass(frozen=True)
+class ChapterEntry:
+    """One chapter of config/chapters_config.json."""
+    number: int
+    title: str
+    status: str
+    description: str
+    topics: Tuple[str, ...]
+    handler: Optional[str] = None  # "module:function", imported on first use
+    router: Optional[str] = None   # "module:function", query → markdown, no Streamlit
+
+    @property
+    def label(self) -> str:
+        """Sidebar label and topic prefix, e.g. 'Chapter 6: Triangles'."""
+        return f"Chapter {self.number}: {self.title}"
+
+
+@lru_cache(maxsize=1)
+def load_registry() -> Dict[str, ChapterEntry]:
+    """Read chapters_config.json once per process; keyed by chapter label, in chapter order."""
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    entries = []
+    for key, chapter in config["chapters"].items():
+        entries.append(ChapterEntry(
+            number=int(key.replace("chapter", "")),
+            title=chapter["title"],
+            status=chapter.get("status", "coming_soon"),
+            description=chapter.get("description", ""),
+            topics=tuple(chapter.get("topics", [])),
+            handler=chapter.get("handler"),
+            router=chapter.get("router"),
+        ))
+    entries.sort(key=lambda entry: entry.number)
+    return {entry.label: entry for entry in entries}
+
+
+@lru_cache(maxsize=1)
+def get_chapter_structure() -> Dict[str, List[str]]:
+    """Chapter label → topic names, built once from the registry for the sidebar."""
+    return {label: list(entry.topics) for label, entry in load_registry().items()}
+
+
+def split_topic(topic: str) -> Tuple[str, str]:
+    """Split a selected topic 'Chapter 6: Triangles > Right Triangles' into (chapter, topic)."""
+    chapter, _, name = topic.partition(" > ")
+    return chapter, name
+
+
+_loaded_handlers: Dict[str, Callable[[str], None]] = {}
+_load_lock = threading.Lock()
+
+
+def load_entry_point(entry_point: str) -> Callable:
+    """Import 'package.module:function' and return the function."""
+    module_name, func_name = entry_point.split(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, func_name)
+
+
+def get_handler(topic: str) -> Optional[Callable[[str], None]]:
+    """
+    Return the handler for a topic with a single dict lookup, importing its
+    module on first use. Later reruns get the already-imported function.
+    """
+    chapter, _ = split_topic(topic)
+    entry = load_registry().get(chapter)
+    if entry is None or not entry.handler:
+        return None
+    handler = _loaded_handlers.get(chapter)
+    if handler is None:
+        with _load_lock:
+            handler = _loaded_handlers.get(chapter)
+            if handler is None:
+                handler = load_entry_point(entry.handler)
+                _loaded_handlers[chapter] = handler
+    return handler
+
+
+_loaded_routers: Dict[str, Callable[[str], str]] = {}
+
+
+def get_router(chapter: str) -> Optional[Callable[[str], str]]:
+    """
+    Return a chapter's route_query (query → markdown) by chapter label,
+    importing it on first use. Routers do not import Streamlit, so this is
+    the entry point for headless solving.
+    """
+    entry = load_registry().get(chapter)
+    if entry is None or not entry.router:
+        return None
+    router = _loaded_routers.get(chapter)
+    if router is None:
+        with _load_lock:
+            router = _loaded_routers.get(chapter)
+            if router is None:
+                router = load_entry_point(entry.router)
+                _loaded_routers[chapter] = router
+    return router
+
+
+def loaded_chapters() -> list:
+    """Chapters whose handler has been imported in this process."""
+    return list(_loaded_handlers)
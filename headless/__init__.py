@@ -0,0 +1,10 @@
+"""
+headless package
+
+Solving without Streamlit: dispatch a query to its chapter router
+(dispatch.solve), batch-solve JSONL files across a process pool
+(python -m headless.batch_cli) or serve both solving and plotting over
+HTTP (python -m headless.http_api).
+"""
+
+from headless.dispatch import SolveResult, detect_chapter, resolve_chapter, solve
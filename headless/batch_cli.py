@@ -0,0 +1,111 @@
+# File: headless/batch_cli.py
+
+"""
+Batch solver: JSONL queries in, JSONL answers out, across a process pool.
+
+Each input line is {"query": ..., "id": ..., "chapter": ...}; only "query" is
+required (id defaults to the line number, chapter is detected from the query
+when missing). Each output line is a dispatch.SolveResult as JSON, written in
+input order as soon as it and everything before it are solved. A summary with
+latency percentiles goes to stderr.
+
+Usage: python -m headless.batch_cli worksheet.jsonl [-o answers.jsonl] [--workers 4] [--chapter 6]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import Iterable, Iterator, Optional, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from headless.dispatch import SolveResult, solve, warm_up
+
+Task = Tuple[object, Optional[str], Optional[object]]  # (id, query or None, chapter or parse error)
+
+
+def read_tasks(lines: Iterable[str], default_chapter=None) -> Iterator[Task]:
+    """One task per non-blank line; a line that is not a query object becomes a task with query None."""
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict) or not isinstance(record.get("query"), str):
+                raise ValueError('expected an object with a "query" string')
+        except ValueError as e:
+            yield number, None, f"❌ Line {number}: {e}"
+            continue
+        yield record.get("id", number), record["query"], record.get("chapter", default_chapter)
+
+
+def solve_task(task: Task) -> SolveResult:
+    query_id, query, chapter = task
+    if query is None:
+        return SolveResult(query_id, None, "", chapter, False, 0.0)
+    return solve(query, chapter, query_id)
+
+
+def _init_worker() -> None:
+    import warnings
+    warnings.filterwarnings("ignore")
+    warm_up()
+
+
+def solve_all(tasks: Iterable[Task], workers: int, chunksize: int = 4) -> Iterator[SolveResult]:
+    """Results in input order; workers <= 1 solves in this process."""
+    if workers <= 1:
+        _init_worker()
+        yield from map(solve_task, tasks)
+        return
+    with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+        yield from pool.imap(solve_task, tasks, chunksize)
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Solve JSONL queries with the chapter routers")
+    parser.add_argument("input", help="JSONL file of queries, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="JSONL file for answers (default: stdout)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chapter", help="chapter for lines without one (number, label or title)")
+    parser.add_argument("--chunksize", type=int, default=4, help="queries sent to a worker at a time")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    latencies, failed = [], 0
+    start = time.perf_counter()
+    try:
+        for result in solve_all(read_tasks(source, args.chapter), args.workers, args.chunksize):
+            sink.write(json.dumps(result._asdict(), ensure_ascii=False) + "\n")
+            sink.flush()
+            latencies.append(result.latency_ms)
+            failed += not result.ok
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"{len(latencies)} queries, {failed} failed, {elapsed:.2f} s "
+          f"({len(latencies) / elapsed if elapsed else 0:.1f} queries/s, {args.workers} workers); "
+          f"latency p50 {percentile(latencies, 0.5):.1f} ms, p95 {percentile(latencies, 0.95):.1f} ms, "
+          f"max {latencies[-1] if latencies else 0:.1f} ms", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# File: headless/dispatch.py
+
+"""
+Query → chapter router → markdown, without Streamlit.
+
+Each chapter's route_query is listed as "router" in config/chapters_config.json
+and imported on first use through handler_registry.get_router. The chapter
+comes from the caller (number, key, label or title) or, failing that, from a
+keyword scan of the query.
+"""
+
+import os
+import time
+from typing import NamedTuple, Optional, Union
+
+# Worker processes have no display; plotting modules must not pick a GUI backend
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+from handler_registry import get_router, load_registry
+from utils.keyword_matcher import KeywordMatcher
+
+# Chapter number → phrases that identify it; longer matched phrases win (KeywordHits.rank)
+CHAPTER_KEYWORDS = {
+    1: ["hcf", "lcm", "highest common factor", "lowest common multiple", "prime factor",
+        "irrational", "euclid", "real number"],
+    2: ["polynomial", "factor", "factorise", "factorize", "zeroes", "zeros", "x^2", "x²", "x**2",
+        "quadratic", "cubic"],
+    6: ["triangle", "hypotenuse", "pythagoras", "pythagorean", "similar", "bpt",
+        "basic proportionality", "heron"],
+    11: ["sector", "segment", "arc", "circle"],
+    12: ["cylinder", "cone", "sphere", "hemisphere", "cuboid", "cube", "volume", "surface area",
+          "combined solid"],
+}
+
+_chapter_matcher = KeywordMatcher({str(number): words for number, words in CHAPTER_KEYWORDS.items()})
+
+
+class SolveResult(NamedTuple):
+    id: Optional[Union[int, str]]
+    chapter: Optional[str]    # chapter label, e.g. "Chapter 6: Triangles"
+    query: str
+    answer: str               # router markdown, or a "❌ ..." message
+    ok: bool
+    latency_ms: float
+
+
+def _labels_by_number():
+    return {entry.number: label for label, entry in load_registry().items()}
+
+
+def resolve_chapter(chapter: Union[int, str, None]) -> Optional[str]:
+    """Chapter label for 6, "6", "chapter6", "Chapter 6", "Chapter 6: Triangles" or "Triangles"."""
+    if chapter is None:
+        return None
+    registry = load_registry()
+    text = str(chapter).strip()
+    if text in registry:
+        return text
+    digits = text.lower().replace("chapter", "").split(":")[0].strip()
+    if digits.isdigit():
+        return _labels_by_number().get(int(digits))
+    for label, entry in registry.items():
+        if entry.title.lower() == text.lower():
+            return label
+    return None
+
+
+def detect_chapter(query: str) -> Optional[str]:
+    """Best-matching chapter label with a router, or None if no chapter keyword occurs."""
+    labels = _labels_by_number()
+    for number, _ in _chapter_matcher.scan(query).rank():
+        label = labels.get(int(number))
+        if label and load_registry()[label].router:
+            return label
+    return None
+
+
+def warm_up() -> None:
+    """Import every router now, so the first query of a worker is not charged for it."""
+    for label, entry in load_registry().items():
+        if entry.router:
+            get_router(label)
+
+
+def solve(query: str, chapter: Union[int, str, None] = None,
+          query_id: Optional[Union[int, str]] = None) -> SolveResult:
+    """Route one query; errors come back as a "❌" answer, never as an exception."""
+    label = resolve_chapter(chapter) if chapter is not None else detect_chapter(query)
+    start = time.perf_counter()
+    if label is None:
+        answer = (f"❌ Unknown chapter: {chapter}" if chapter is not None
+                  else "❌ Could not tell which chapter this query belongs to. Give a chapter.")
+    else:
+        router = get_router(label)
+        if router is None:
+            answer = f"❌ {label} has no solver yet."
+        else:
+            try:
+                answer = router(query)
+            except Exception as e:
+                answer = f"❌ Error while solving: {e}"
+    latency_ms = (time.perf_counter() - start) * 1000
+    return SolveResult(query_id, label, query, answer, not answer.lstrip().startswith("❌"), latency_ms)
@@ -0,0 +1,349 @@
+# File: headless/http_api.py
+
+"""
+Local HTTP/JSON API over the chapter routers and plotting functions.
+
+    GET  /health                         → workers, pending jobs, chapters with a router
+    GET  /solve/{chapter}?q=...          → dispatch.SolveResult as JSON
+    POST /solve/{chapter}  {"query": ...}
+    GET  /plot/{shape}?radius=7&angle=60 → image bytes (fmt=png|svg)
+    POST /plot/{shape}     {"radius": 7, "angle": 60}
+
+{chapter} is a number, key, label or title, or "auto" to detect it from the
+query. The server is a single asyncio loop (stdlib only, HTTP/1.1 with
+keep-alive); every sympy/matplotlib call runs in a process pool. At most
+--max-pending jobs are queued or running; beyond that the API answers 503
+instead of queueing without bound, and a job slower than --timeout gets 504.
+
+Usage: python -m headless.http_api [--host 127.0.0.1] [--port 8765] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from handler_registry import load_entry_point, load_registry
+from headless.dispatch import resolve_chapter, solve, warm_up
+from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.polynomial_analysis import MAX_DEGREE
+
+MAX_BODY_BYTES = 64 * 1024
+IMAGE_TYPES = {"png": "image/png", "svg": "image/svg+xml"}
+
+
+def _number(value) -> float:
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError("must be a finite number")
+    return number
+
+
+def _numbers(value) -> list:
+    """[3, 4, 5] from a JSON list or "3,4,5" from a query string."""
+    items = value.split(",") if isinstance(value, str) else list(value)
+    return [_number(item) for item in items]
+
+
+def _positive(value) -> float:
+    number = _number(value)
+    if number <= 0:
+        raise ValueError("must be positive")
+    return number
+
+
+def _angle(value) -> float:
+    number = _number(value)
+    if not 0 < number <= 360:
+        raise ValueError("must be between 0° and 360°")
+    return number
+
+
+def _sides(value) -> list:
+    """Three positive sides that satisfy the triangle inequality."""
+    sides = _numbers(value)
+    if len(sides) != 3:
+        raise ValueError("needs exactly 3 sides")
+    if min(sides) <= 0:
+        raise ValueError("sides must be positive")
+    a, b, c = sorted(sides)
+    if a + b <= c:
+        raise ValueError("sides do not form a triangle")
+    return sides
+
+
+def _coefficients(value) -> list:
+    coefficients = _numbers(value)
+    if not 2 <= len(coefficients) <= MAX_DEGREE + 1:
+        raise ValueError(f"needs between 2 and {MAX_DEGREE + 1} coefficients (degree 1 to {MAX_DEGREE})")
+    if coefficients[0] == 0:
+        raise ValueError("leading coefficient must not be zero")
+    return coefficients
+
+
+def _flag(value) -> bool:
+    return value if isinstance(value, bool) else str(value).lower() in ("1", "true", "yes")
+
+
+# shape → (plotting function, {parameter: converter}); converters raise ValueError on bad input
+PLOTS = {
+    "sector": ("chapters.chapter11_areas_circles.plot_circles:plot_sector", {"radius": _positive, "angle": _angle}),
+    "segment": ("chapters.chapter11_areas_circles.plot_circles:plot_segment", {"radius": _positive, "angle": _angle}),
+    "polynomial": ("chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.plot_polynomial:plot_polynomial",
+                   {"coefficients": _coefficients}),
+    "cylinder": ("chapters.chapter12_surface_areas_and_volumes.plot_solids:plot_cylinder",
+                 {"radius": _positive, "height": _positive}),
+    "cone": ("chapters.chapter12_surface_areas_and_volumes.plot_solids:plot_cone",
+             {"radius": _positive, "height": _positive}),
+    "sphere": ("chapters.chapter12_surface_areas_and_volumes.plot_solids:plot_sphere",
+               {"radius": _positive, "is_hemisphere": _flag}),
+    "cuboid": ("chapters.chapter12_surface_areas_and_volumes.plot_solids:plot_cuboid",
+               {"length": _positive, "breadth": _positive, "height": _positive}),
+    "right_triangle": ("chapters.chapter6_triangles.visualization:render_right_triangle",
+                       {"base": _positive, "height": _positive}),
+    "triangle": ("chapters.chapter6_triangles.visualization:render_triangle", {"sides": _sides}),
+    "similar_triangles": ("chapters.chapter6_triangles.visualization:render_similar_triangles",
+                          {"triangle1": _sides, "triangle2": _sides, "scale_factor": _positive}),
+}
+OPTIONAL_PARAMETERS = {"is_hemisphere", "scale_factor"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    params: Dict[str, str]
+    headers: Dict[str, str]
+    body: bytes
+
+    def json_params(self) -> Dict[str, Any]:
+        """Query-string parameters, overridden by a JSON object body."""
+        params: Dict[str, Any] = dict(self.params)
+        if self.body:
+            try:
+                payload = json.loads(self.body)
+            except ValueError:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "Body is not valid JSON")
+            if not isinstance(payload, dict):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+            params.update(payload)
+        return params
+
+
+# Jobs run in the worker processes; they must be importable module-level functions
+
+def _init_worker() -> None:
+    import warnings
+    warnings.filterwarnings("ignore")
+    warm_up()
+
+
+def _solve_job(query: str, chapter: Optional[str]) -> Dict[str, Any]:
+    return solve(query, chapter)._asdict()
+
+
+def _plot_job(shape: str, kwargs: Dict[str, Any]) -> bytes:
+    return load_entry_point(PLOTS[shape][0])(**kwargs)
+
+
+def plot_arguments(shape: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Validated keyword arguments for a shape's plotting function."""
+    if shape not in PLOTS:
+        raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown shape: {shape}. Try one of: {', '.join(PLOTS)}")
+    fmt = str(params.get("fmt", "png")).lower()
+    if fmt not in IMAGE_TYPES:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "fmt must be png or svg")
+    kwargs: Dict[str, Any] = {"fmt": fmt}
+    for name, convert in PLOTS[shape][1].items():
+        if name not in params:
+            if name in OPTIONAL_PARAMETERS:
+                continue
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Missing parameter: {name}")
+        try:
+            kwargs[name] = convert(params[name])
+        except (TypeError, ValueError) as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid value for {name}: {params[name]!r} ({e})")
+    if shape == "polynomial":
+        kwargs["degree"] = len(kwargs["coefficients"]) - 1
+    return kwargs
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """Next request on the connection, or None once the client has closed it."""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, target, _ = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length") or 0)
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+    body = await reader.readexactly(length) if length else b""
+    url = urlsplit(target)
+    return Request(method.upper(), unquote(url.path), dict(parse_qsl(url.query)), headers, body)
+
+
+def encode_response(status: HTTPStatus, content_type: str, body: bytes, keep_alive: bool,
+                    extra_headers: Optional[Dict[str, str]] = None) -> bytes:
+    headers = {
+        "Content-Type": content_type,
+        "Content-Length": str(len(body)),
+        "Connection": "keep-alive" if keep_alive else "close",
+        **(extra_headers or {}),
+    }
+    head = f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+    head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+    return head.encode("latin-1") + b"\r\n" + body
+
+
+def json_body(payload: Any) -> Tuple[str, bytes]:
+    return "application/json; charset=utf-8", json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+class SolveAPI:
+    """The route table plus the bounded process pool behind it."""
+
+    def __init__(self, workers: int = os.cpu_count() or 1, max_pending: int = 64, timeout: float = 30.0):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.pending = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> None:
+        self._pool = ProcessPoolExecutor(self.workers, initializer=_init_worker)
+
+    def stop(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def _release(self, _future) -> None:
+        self.pending -= 1
+
+    async def run_job(self, func, *args):
+        """
+        Run func in the pool; 503 when max_pending jobs are already queued or
+        running, 504 on timeout. A timed-out job keeps running in its worker,
+        so its slot is only released when the job itself finishes.
+        """
+        if self.pending >= self.max_pending:
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Server busy, try again")
+        self.pending += 1
+        future = asyncio.get_running_loop().run_in_executor(self._pool, func, *args)
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            raise HTTPError(HTTPStatus.GATEWAY_TIMEOUT, f"No answer within {self.timeout:g} s")
+
+    async def handle(self, request: Request) -> Tuple[HTTPStatus, str, bytes]:
+        parts = [part for part in request.path.split("/") if part]
+        if request.method not in ("GET", "POST"):
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{request.method} is not supported")
+
+        if parts == ["health"]:
+            chapters = [label for label, entry in load_registry().items() if entry.router]
+            return (HTTPStatus.OK, *json_body({"status": "ok", "workers": self.workers,
+                                               "pending": self.pending, "chapters": chapters}))
+
+        if len(parts) == 2 and parts[0] == "solve":
+            params = request.json_params()
+            query = params.get("query", params.get("q"))
+            if not isinstance(query, str) or not query.strip():
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "Give the query as ?q= or {\"query\": ...}")
+            chapter = None
+            if parts[1] != "auto":
+                chapter = resolve_chapter(parts[1])
+                if chapter is None or not load_registry()[chapter].router:
+                    raise HTTPError(HTTPStatus.NOT_FOUND, f"No solver for chapter: {parts[1]}")
+            result = await self.run_job(_solve_job, query, chapter)
+            return (HTTPStatus.OK, *json_body(result))
+
+        if len(parts) == 2 and parts[0] == "plot":
+            kwargs = plot_arguments(parts[1], request.json_params())
+            image = await self.run_job(_plot_job, parts[1], kwargs)
+            return HTTPStatus.OK, IMAGE_TYPES[kwargs["fmt"]], image
+
+        raise HTTPError(HTTPStatus.NOT_FOUND, "Try /solve/{chapter}, /plot/{shape} or /health")
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                keep_alive = True
+                extra_headers = None
+                try:
+                    request = await read_request(reader)
+                    if request is None:
+                        break
+                    keep_alive = request.headers.get("connection", "").lower() != "close"
+                    status, content_type, body = await self.handle(request)
+                except HTTPError as e:
+                    status, (content_type, body) = e.status, json_body({"error": e.message})
+                    if e.status == HTTPStatus.SERVICE_UNAVAILABLE:
+                        extra_headers = {"Retry-After": "1"}
+                    if e.status in (HTTPStatus.BAD_REQUEST, HTTPStatus.REQUEST_ENTITY_TOO_LARGE):
+                        keep_alive = False  # the rest of the stream may not be at a request boundary
+                except Exception as e:
+                    status, (content_type, body) = HTTPStatus.INTERNAL_SERVER_ERROR, json_body({"error": str(e)})
+                writer.write(encode_response(status, content_type, body, keep_alive, extra_headers))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        self.start()
+        try:
+            server = await asyncio.start_server(self.handle_connection, host, port)
+            print(f"Serving on http://{host}:{port} with {self.workers} workers", file=sys.stderr)
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.stop()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="HTTP/JSON API for the chapter solvers and plots")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-pending", type=int, default=64, help="queued + running jobs before answering 503")
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds per job before answering 504")
+    args = parser.parse_args(argv)
+
+    api = SolveAPI(args.workers, args.max_pending, args.timeout)
+    try:
+        asyncio.run(api.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# File: headless/test_dispatch.py
+
+import json
+import sys
+import os
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.abspath(__file__), "../.."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from headless.batch_cli import read_tasks, solve_all
+from headless.dispatch import detect_chapter, resolve_chapter, solve
+
+
+def test_chapter_resolution_and_detection():
+    for value in (6, "6", "chapter6", "Chapter 6", "Chapter 6: Triangles", "triangles"):
+        assert resolve_chapter(value) == "Chapter 6: Triangles"
+    assert resolve_chapter("Chapter 99") is None
+    assert detect_chapter("Find area of sector with radius 7 cm and angle 60°") == "Chapter 11: Areas Related to Circles"
+    # "prime factor" outweighs the polynomial keyword "factor"
+    assert detect_chapter("prime factors of 360") == "Chapter 1: Real Numbers"
+    assert detect_chapter("good morning") is None
+
+
+def test_solve_never_raises_and_batch_keeps_order():
+    result = solve("Find area of sector with radius 7 cm and angle 60°", query_id="a")
+    assert result.ok and "25.67 cm²" in result.answer and result.id == "a"
+    assert not solve("good morning").ok
+    assert not solve("mean of 1, 2, 3", chapter="Statistics").ok
+
+    lines = [json.dumps({"id": "x", "query": "volume of cylinder radius 7 height 10"}), "", "not json",
+             json.dumps({"query": "Find HCF of 12 and 18"})]
+    results = list(solve_all(read_tasks(lines), workers=1))
+    assert [r.id for r in results] == ["x", 3, 4]
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[2].chapter == "Chapter 1: Real Numbers"
+
+
+if __name__ == "__main__":
+    test_chapter_resolution_and_detection()
+    test_solve_never_raises_and_batch_keeps_order()
+    print("All headless dispatch tests passed")
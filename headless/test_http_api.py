@@ -0,0 +1,86 @@
+# File: headless/test_http_api.py
+
+import asyncio
+import json
+import sys
+import os
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.abspath(__file__), "../.."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from headless.http_api import HTTPError, Request, SolveAPI, plot_arguments
+
+
+def call(api, method, path, params=None, body=b""):
+    try:
+        status, _, payload = asyncio.run(api.handle(Request(method, path, params or {}, {}, body)))
+    except HTTPError as e:
+        return e.status, e.message
+    return status, payload
+
+
+def test_plot_arguments_are_validated():
+    assert plot_arguments("sector", {"radius": "7", "angle": 60}) == {"fmt": "png", "radius": 7.0, "angle": 60.0}
+    assert plot_arguments("polynomial", {"coefficients": "1,-5,6", "fmt": "svg"})["degree"] == 2
+    for shape, params in (("hexagon", {}), ("sector", {"radius": 7}), ("sector", {"radius": "x", "angle": 1}),
+                          ("sector", {"radius": 7, "angle": 1, "fmt": "gif"}),
+                          ("sector", {"radius": -7, "angle": 400}), ("right_triangle", {"base": 0, "height": 4}),
+                          ("triangle", {"sides": "1,1,5"}), ("triangle", {"sides": "3,4"}),
+                          ("similar_triangles", {"triangle1": [3, 4, 5], "triangle2": [1, 2, 8]}),
+                          ("polynomial", {"coefficients": [5]}), ("polynomial", {"coefficients": [0, 1, 2]}),
+                          ("cylinder", {"radius": "nan", "height": 2})):
+        try:
+            plot_arguments(shape, params)
+            assert False, (shape, params)
+        except HTTPError:
+            pass
+
+
+def test_routes_through_the_process_pool():
+    api = SolveAPI(workers=1)
+    api.start()
+    try:
+        status, payload = call(api, "POST", "/solve/11",
+                               body=json.dumps({"query": "area of sector with radius 7 cm and angle 60"}).encode())
+        result = json.loads(payload)
+        assert status == 200 and result["ok"] and "25.67 cm²" in result["answer"]
+        assert call(api, "GET", "/solve/99", {"q": "x"})[0] == 404
+        assert call(api, "GET", "/solve/auto")[0] == 400
+        assert call(api, "DELETE", "/health")[0] == 405
+        assert json.loads(call(api, "GET", "/health")[1])["workers"] == 1
+    finally:
+        api.stop()
+
+
+def test_timed_out_job_keeps_its_slot_until_it_finishes():
+    api = SolveAPI(workers=1, max_pending=1, timeout=0.1)
+    api.start()
+
+    async def scenario():
+        try:
+            await api.run_job(time.sleep, 1.0)
+            assert False, "expected a 504"
+        except HTTPError as e:
+            assert e.status == 504
+        # The worker is still sleeping, so the pool is still full
+        assert api.pending == 1
+        try:
+            await api.run_job(time.sleep, 0)
+            assert False, "expected a 503"
+        except HTTPError as e:
+            assert e.status == 503
+        await asyncio.sleep(1.2)
+        assert api.pending == 0
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        api.stop()
+
+
+if __name__ == "__main__":
+    test_plot_arguments_are_validated()
+    test_routes_through_the_process_pool()
+    test_timed_out_job_keeps_its_slot_until_it_finishes()
+    print("All HTTP API tests passed")
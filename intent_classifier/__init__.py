@@ -0,0 +1,66 @@
+"""
+intent_classifier package
+
+Offline intent classification for chapter routers. The local model answers
+confident queries without a network call; the LLM is only consulted otherwise.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from intent_classifier.model import LocalIntentClassifier, load_corpus
+
+# Below this confidence the router asks the LLM instead
+CONFIDENCE_THRESHOLD = 0.6
+
+_models: Dict[str, LocalIntentClassifier] = {}
+_models_lock = threading.Lock()
+
+
+def get_classifier(chapter: str) -> LocalIntentClassifier:
+    """Train (once per process) and return the classifier for a chapter corpus."""
+    model = _models.get(chapter)
+    if model is None:
+        with _models_lock:
+            model = _models.get(chapter)
+            if model is None:
+                model = LocalIntentClassifier().fit(load_corpus(chapter))
+                _models[chapter] = model
+    return model
+
+
+def classify_intent(chapter: str, query: str,
+                    extract_parameters: Optional[Callable[[str, str], Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Classify a query with the local model.
+    Returns {"intent", "parameters", "confidence", "source": "local"}; parameters
+    come from the chapter's own regex parser `extract_parameters(intent, query)`,
+    which returns None when it cannot read the values it needs.
+    """
+    intent, confidence = get_classifier(chapter).predict(query)
+    parameters = {}
+    if extract_parameters is not None and intent != "unknown":
+        parameters = extract_parameters(intent, query)
+    return {
+        "intent": intent,
+        "parameters": parameters,
+        "confidence": confidence,
+        "source": "local",
+    }
+
+
+def interpret_with_fallback(chapter: str, query: str, llm_interpreter: Callable[[str], Dict[str, Any]],
+                            extract_parameters: Optional[Callable[[str, str], Dict[str, Any]]] = None,
+                            threshold: float = CONFIDENCE_THRESHOLD) -> Dict[str, Any]:
+    """
+    Use the local model when it is confident and its parameters could be parsed,
+    otherwise defer to the LLM interpreter.
+    """
+    try:
+        result = classify_intent(chapter, query, extract_parameters)
+        if result["confidence"] >= threshold and result["parameters"] is not None:
+            return result
+    except (OSError, ValueError, KeyError):
+        # Missing or malformed corpus: behave as before and ask the LLM
+        pass
+    return llm_interpreter(query)
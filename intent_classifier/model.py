@@ -0,0 +1,122 @@
+# File: intent_classifier/model.py
+
+import json
+import math
+import os
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+NGRAM_SIZES = (2, 3, 4)
+NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+SPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, collapse whitespace and replace every number with '0'."""
+    text = NUMBER_PATTERN.sub("0", str(text).lower())
+    return SPACE_PATTERN.sub(" ", text).strip()
+
+
+def extract_features(text: str) -> Counter:
+    """
+    Character n-grams (2-4) plus word unigrams of the normalized text.
+    Numbers are collapsed so 'radius 7' and 'radius 14' share features.
+    """
+    text = normalize_text(text)
+    padded = f" {text} "
+    features = Counter()
+    for n in NGRAM_SIZES:
+        for i in range(len(padded) - n + 1):
+            features[padded[i:i + n]] += 1
+    for word in text.split(" "):
+        if word:
+            features["w:" + word] += 1
+    return features
+
+
+def load_corpus(chapter: str) -> List[Tuple[str, str]]:
+    """Load (query, intent) pairs from corpus/<chapter>.jsonl."""
+    path = os.path.join(CORPUS_DIR, f"{chapter}.jsonl")
+    examples = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                row = json.loads(line)
+                examples.append((row["query"], row["intent"]))
+    return examples
+
+
+class LocalIntentClassifier:
+    """
+    TF-IDF weighted char n-gram classifier with one weight vector per intent
+    (the normalized class centroid), i.e. a linear model scored by cosine similarity.
+    Confidence is the softmax probability of the best intent.
+    """
+
+    def __init__(self, temperature: float = 0.05):
+        self.temperature = temperature
+        self.idf: Dict[str, float] = {}
+        self.weights: Dict[str, Dict[str, float]] = {}
+        self.default_idf = 1.0
+
+    def fit(self, examples: Iterable[Tuple[str, str]]) -> "LocalIntentClassifier":
+        """Train on (query, intent) pairs."""
+        examples = list(examples)
+        feature_rows = [(extract_features(query), intent) for query, intent in examples]
+
+        document_frequency = Counter()
+        for features, _ in feature_rows:
+            document_frequency.update(features.keys())
+        total = len(feature_rows)
+        self.idf = {
+            feature: math.log((1 + total) / (1 + df)) + 1.0
+            for feature, df in document_frequency.items()
+        }
+        self.default_idf = math.log(1 + total) + 1.0
+
+        centroids: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for features, intent in feature_rows:
+            for feature, value in self._vectorize(features).items():
+                centroids[intent][feature] += value
+        self.weights = {intent: self._normalize(vector) for intent, vector in centroids.items()}
+        return self
+
+    def _vectorize(self, features: Counter) -> Dict[str, float]:
+        """Sublinear TF-IDF vector, L2 normalized. Unseen features are dropped."""
+        vector = {
+            feature: (1.0 + math.log(count)) * self.idf[feature]
+            for feature, count in features.items()
+            if feature in self.idf
+        }
+        return self._normalize(vector)
+
+    @staticmethod
+    def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+        norm = math.sqrt(sum(v * v for v in vector.values()))
+        if norm == 0:
+            return dict(vector)
+        return {k: v / norm for k, v in vector.items()}
+
+    def scores(self, query: str) -> Dict[str, float]:
+        """Cosine similarity of the query against every intent."""
+        vector = self._vectorize(extract_features(query))
+        return {
+            intent: sum(value * weights.get(feature, 0.0) for feature, value in vector.items())
+            for intent, weights in self.weights.items()
+        }
+
+    def predict(self, query: str) -> Tuple[str, float]:
+        """Return (best intent, confidence in [0, 1])."""
+        scores = self.scores(query)
+        if not scores:
+            return "unknown", 0.0
+        best = max(scores, key=scores.get)
+        if scores[best] <= 0:
+            return "unknown", 0.0
+        top = scores[best]
+        exp_sum = sum(math.exp((s - top) / self.temperature) for s in scores.values())
+        return best, 1.0 / exp_sum
@@ -1,7 +1,7 @@
 # File: topic_handlers/chapter11_areas_circles_handler.py
 
 import streamlit as st
-import math
+from chapters.chapter11_areas_circles.main_router import route_query
 from chapters.chapter11_areas_circles.plot_circles import plot_sector, plot_segment
 
 def handle_chapter11_areas_circles(topic: str):
@@ -36,7 +36,7 @@ def handle_chapter11_areas_circles(topic: str):
             
             if user_query:
                 with st.spinner('Calculating...'):
-                    result = calculate_area(user_query)
+                    result = route_query(user_query)
                     st.markdown("---")
                     st.markdown(result)
         
@@ -92,82 +92,6 @@ def handle_chapter11_areas_circles(topic: str):
     elif 'Question Bank' in topic:
         display_question_bank()
 
-def calculate_area(query: str) -> str:
-    """Calculate area based on the query."""
-    import re
-    
-    # Extract radius and angle
-    radius_match = re.search(r'radius[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
-    angle_match = re.search(r'angle[:\s]+(\d+(?:\.\d+)?)', query, re.IGNORECASE)
-    
-    if not (radius_match and angle_match):
-        return "❌ Could not extract radius and angle from the query. Please specify both values."
-    
-    radius = float(radius_match.group(1))
-    angle = float(angle_match.group(1))
-    
-    if radius <= 0 or angle <= 0 or angle > 360:
-        return "❌ Invalid values. Radius must be positive and angle must be between 0° and 360°."
-    
-    # Use π = 22/7 for calculations
-    pi = 22/7
-    
-    if "sector" in query.lower():
-        # Sector area = (θ/360°) × πr²
-        area = (angle/360) * pi * radius**2
-        
-        result = f"""
-✅ **Sector Area Solution:**
-
-Given:
-• Radius (r) = {radius} cm
-• Angle (θ) = {angle}°
-
-📝 **Step-by-Step Solution:**
-
-**Area of Sector = (θ/360°) × πr²**
-   = ({angle}/360) × {pi:.3f} × {radius}²
-   = {angle/360:.3f} × {pi:.3f} × {radius**2:.2f}
-   = **{area:.2f} cm²**
-
-💡 **Summary:**
-• Area of Sector = {area:.2f} cm²
-"""
-    else:  # segment area
-        # Segment area = (θ/360°) × πr² - ½r²sin(θ)
-        sector_area = (angle/360) * pi * radius**2
-        triangle_area = 0.5 * radius**2 * math.sin(math.radians(angle))
-        area = sector_area - triangle_area
-        
-        result = f"""
-✅ **Segment Area Solution:**
-
-Given:
-• Radius (r) = {radius} cm
-• Angle (θ) = {angle}°
-
-📝 **Step-by-Step Solution:**
-
-**1. Area of Sector = (θ/360°) × πr²**
-   = ({angle}/360) × {pi:.3f} × {radius}²
-   = {angle/360:.3f} × {pi:.3f} × {radius**2:.2f}
-   = {sector_area:.2f} cm²
-
-**2. Area of Triangle = ½r²sin(θ)**
-   = 0.5 × {radius}² × sin({angle}°)
-   = 0.5 × {radius**2:.2f} × {math.sin(math.radians(angle)):.3f}
-   = {triangle_area:.2f} cm²
-
-**3. Area of Segment = Sector Area - Triangle Area**
-   = {sector_area:.2f} - {triangle_area:.2f}
-   = **{area:.2f} cm²**
-
-💡 **Summary:**
-• Area of Segment = {area:.2f} cm²
-"""
-    
-    return result
-
 def display_all_formulas():
     """Display all formulas in a structured format."""
     st.markdown("""
@@ -2,10 +2,25 @@
 
 import streamlit as st
 from chapters.chapter12_surface_areas_and_volumes.main_router import route_query
-from chapters.chapter12_surface_areas_and_volumes.plot_solids import (
-    plot_cylinder, plot_cone, plot_sphere, plot_cuboid, 
-    plot_combined_solid, create_2d_net
-)
+from chapters.chapter12_surface_areas_and_volumes import plot_solids
+
+
+def get_solid_renderer(interactive: bool):
+    """Plotly renderer (rotatable in the browser) or the static matplotlib one; same API."""
+    if interactive:
+        from chapters.chapter12_surface_areas_and_volumes import plot_solids_plotly
+        return plot_solids_plotly
+    return plot_solids
+
+
+def show_plot(plot, caption: str):
+    """Display a rendered solid: image bytes from plot_solids or a Plotly figure."""
+    if isinstance(plot, (bytes, bytearray)):
+        st.image(plot, caption=caption, use_container_width=True)
+    else:
+        st.plotly_chart(plot, use_container_width=True)
+        st.caption(caption)
+
 
 def handle_chapter12_surface_areas(topic: str):
     st.subheader(f'Selected: {topic}')
@@ -60,7 +75,7 @@ def handle_chapter12_surface_areas(topic: str):
             4. The 3D visualization will appear below
             
             You can also:
-            - See the shape from different angles in the saved image
+            - Drag to rotate the interactive view and see the shape from any angle
             - View net diagrams for some shapes (like cylinder and cube)
             - Compare different shapes by generating multiple plots
             """)
@@ -70,6 +85,9 @@ def handle_chapter12_surface_areas(topic: str):
             
             with col_left:
                 st.markdown("### 🎯 Select Shape")
+                interactive = st.toggle("🔄 Interactive 3D view", value=True,
+                                        help="Rotate and zoom in the browser; turn off for a static image")
+                renderer = get_solid_renderer(interactive)
                 shape_type = st.selectbox(
                     "Select shape to visualize:",
                     ["Sphere", "Hemisphere", "Cube", "Cuboid", "Cylinder", "Cone", "Combined Solids"]
@@ -81,28 +99,28 @@ def handle_chapter12_surface_areas(topic: str):
                     radius = st.number_input("Radius (cm):", min_value=1.0, value=7.0, step=0.5)
                     if st.button("🎨 Generate Sphere Plot", use_container_width=True):
                         with st.spinner('Generating 3D visualization...'):
-                            plot_path = plot_sphere(radius, is_hemisphere=False)
-                            st.session_state['current_plot'] = plot_path
+                            plot = renderer.plot_sphere(radius, is_hemisphere=False)
+                            st.session_state['current_plot'] = plot
                             st.session_state['plot_caption'] = f"3D Sphere Visualization (r = {radius} cm)"
                 
                 elif shape_type == "Hemisphere":
                     radius = st.number_input("Radius (cm):", min_value=1.0, value=7.0, step=0.5)
                     if st.button("🎨 Generate Hemisphere Plot", use_container_width=True):
                         with st.spinner('Generating 3D visualization...'):
-                            plot_path = plot_sphere(radius, is_hemisphere=True)
-                            st.session_state['current_plot'] = plot_path
+                            plot = renderer.plot_sphere(radius, is_hemisphere=True)
+                            st.session_state['current_plot'] = plot
                             st.session_state['plot_caption'] = f"3D Hemisphere Visualization (r = {radius} cm)"
                 
                 elif shape_type == "Cube":
                     side = st.number_input("Side/Edge (cm):", min_value=1.0, value=5.0, step=0.5)
                     if st.button("🎨 Generate Cube Plot", use_container_width=True):
                         with st.spinner('Generating 3D visualization...'):
-                            plot_path = plot_cuboid(side, side, side)
-                            st.session_state['current_plot'] = plot_path
+                            plot = renderer.plot_cuboid(side, side, side)
+                            st.session_state['current_plot'] = plot
                             st.session_state['plot_caption'] = f"3D Cube Visualization (a = {side} cm)"
                             
                             # Generate net diagram
-                            net_path = create_2d_net("cube", {"side": side})
+                            net_path = renderer.create_2d_net("cube", {"side": side})
                             st.session_state['current_net'] = net_path
                             st.session_state['net_caption'] = "Net Diagram of Cube"
                 
@@ -117,8 +135,8 @@ def handle_chapter12_surface_areas(topic: str):
                     
                     if st.button("🎨 Generate Cuboid Plot", use_container_width=True):
                         with st.spinner('Generating 3D visualization...'):
-                            plot_path = plot_cuboid(length, breadth, height)
-                            st.session_state['current_plot'] = plot_path
+                            plot = renderer.plot_cuboid(length, breadth, height)
+                            st.session_state['current_plot'] = plot
                             st.session_state['plot_caption'] = f"3D Cuboid Visualization (l = {length}, b = {breadth}, h = {height} cm)"
                 
                 elif shape_type == "Cylinder":
@@ -130,12 +148,12 @@ def handle_chapter12_surface_areas(topic: str):
                     
                     if st.button("🎨 Generate Cylinder Plot", use_container_width=True):
                         with st.spinner('Generating 3D visualization...'):
-                            plot_path = plot_cylinder(radius, height)
-                            st.session_state['current_plot'] = plot_path
+                            plot = renderer.plot_cylinder(radius, height)
+                            st.session_state['current_plot'] = plot
                             st.session_state['plot_caption'] = f"3D Cylinder Visualization (r = {radius}, h = {height} cm)"
                             
                             # Generate net diagram
-                            net_path = create_2d_net("cylinder", {"radius": radius, "height": height})
+                            net_path = renderer.create_2d_net("cylinder", {"radius": radius, "height": height})
                             st.session_state['current_net'] = net_path
                             st.session_state['net_caption'] = "Net Diagram of Cylinder"
                 
@@ -148,8 +166,8 @@ def handle_chapter12_surface_areas(topic: str):
                     
                     if st.button("🎨 Generate Cone Plot", use_container_width=True):
                         with st.spinner('Generating 3D visualization...'):
-                            plot_path = plot_cone(radius, height)
-                            st.session_state['current_plot'] = plot_path
+                            plot = renderer.plot_cone(radius, height)
+                            st.session_state['current_plot'] = plot
                             st.session_state['plot_caption'] = f"3D Cone Visualization (r = {radius}, h = {height} cm)"
                 
                 elif shape_type == "Combined Solids":
@@ -164,8 +182,8 @@ def handle_chapter12_surface_areas(topic: str):
                         
                         if st.button("Generate Combined Solid Plot"):
                             with st.spinner('Generating visualization...'):
-                                plot_path = plot_combined_solid(radius, height)
-                                st.image(plot_path, caption="Combined Solid Visualization", use_container_width=True)
+                                plot = renderer.plot_combined_solid(radius, height)
+                                show_plot(plot, "Combined Solid Visualization")
                                 
                                 # Display volume calculation
                                 hemisphere_volume = (2/3) * (22/7) * radius**3
@@ -197,15 +215,11 @@ def handle_chapter12_surface_areas(topic: str):
             with col_right:
                 st.markdown("### 🖼️ Visualization")
                 if 'current_plot' in st.session_state:
-                    st.image(st.session_state['current_plot'], 
-                            caption=st.session_state['plot_caption'],
-                            use_container_width=True)
+                    show_plot(st.session_state['current_plot'], st.session_state['plot_caption'])
                     
                     if 'current_net' in st.session_state:
                         st.markdown("### 📐 Net Diagram")
-                        st.image(st.session_state['current_net'],
-                                caption=st.session_state['net_caption'],
-                                use_container_width=True)
+                        show_plot(st.session_state['current_net'], st.session_state['net_caption'])
                 else:
                     st.info("👈 Select a shape and enter dimensions to generate a 3D visualization")
         
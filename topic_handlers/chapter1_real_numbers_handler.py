@@ -2,7 +2,13 @@
 
 import streamlit as st
 import math
-from chapters.chapter1_real_numbers.main_router import route_query
+from chapters.chapter1_real_numbers.main_router import route_query, MAX_EUCLID_STEPS
+from chapters.chapter1_real_numbers.sub_chapters.hcf_lcm.solver_hcf_lcm import (
+    hcf_lcm_worksheet, parse_number_groups, format_answer_key, answer_key_csv, iter_euclidean_lines
+)
+
+# Keeps inputs below 2^53, above which the browser's number input loses precision
+MAX_INPUT_NUMBER = 10**15
 
 def handle_chapter1_real_numbers(topic: str):
     st.subheader(f'Selected: {topic}')
@@ -64,9 +70,9 @@ def handle_chapter1_real_numbers(topic: str):
                 
                 col1, col2 = st.columns(2)
                 with col1:
-                    num1 = st.number_input("First Number:", min_value=1, max_value=10000, value=12, step=1, key="hcf_num1")
+                    num1 = st.number_input("First Number:", min_value=1, max_value=MAX_INPUT_NUMBER, value=12, step=1, key="hcf_num1")
                 with col2:
-                    num2 = st.number_input("Second Number:", min_value=1, max_value=10000, value=18, step=1, key="hcf_num2")
+                    num2 = st.number_input("Second Number:", min_value=1, max_value=MAX_INPUT_NUMBER, value=18, step=1, key="hcf_num2")
                 
                 if st.button("Calculate HCF and LCM"):
                     with st.spinner('Calculating...'):
@@ -79,7 +85,7 @@ def handle_chapter1_real_numbers(topic: str):
             elif example_type == "Prime Factorization":
                 st.markdown("**🧮 Prime Factorization**")
                 
-                number = st.number_input("Enter a number:", min_value=2, max_value=10000, value=60, step=1, key="prime_num")
+                number = st.number_input("Enter a number:", min_value=2, max_value=MAX_INPUT_NUMBER, value=60, step=1, key="prime_num")
                 
                 if st.button("Find Prime Factorization"):
                     with st.spinner('Calculating...'):
@@ -142,17 +148,29 @@ def handle_chapter1_real_numbers(topic: str):
             else:  # Euclidean Algorithm
                 st.markdown("**🔄 Euclidean Algorithm**")
                 
+                # Text inputs so integers of any size can be entered
                 col1, col2 = st.columns(2)
                 with col1:
-                    a = st.number_input("First Number (a):", min_value=1, max_value=10000, value=48, step=1, key="euc_a")
+                    a = st.text_input("First Number (a):", value="48", key="euc_a")
                 with col2:
-                    b = st.number_input("Second Number (b):", min_value=1, max_value=10000, value=18, step=1, key="euc_b")
+                    b = st.text_input("Second Number (b):", value="18", key="euc_b")
+                col3, col4 = st.columns(2)
+                with col3:
+                    extended = st.checkbox("Show Bézout coefficients (extended Euclid)", key="euc_ext")
+                with col4:
+                    max_steps = st.number_input("Steps to show:", min_value=2, max_value=1000,
+                                                value=MAX_EUCLID_STEPS, step=2, key="euc_cap")
                 
                 if st.button("Apply Euclidean Algorithm"):
-                    with st.spinner('Calculating...'):
+                    a, b = a.strip(), b.strip()
+                    if not (a.isdigit() and b.isdigit() and int(a) > 0 and int(b) > 0):
+                        st.error("❌ Please enter two positive whole numbers.")
+                    else:
                         try:
-                            result = route_query(f"Find HCF of {int(a)} and {int(b)} using Euclidean algorithm")
-                            st.markdown(result)
+                            # Lines are rendered as each division is computed
+                            for line in iter_euclidean_lines(int(a), int(b), int(max_steps), extended):
+                                if line:
+                                    st.markdown(line)
                         except Exception as e:
                             st.error(f"Error: {str(e)}")
         
@@ -175,6 +193,7 @@ def handle_chapter1_real_numbers(topic: str):
                 value="Medium"
             )
             display_practice_problems(difficulty)
+            display_worksheet_answer_key()
     
     elif 'Question Bank' in topic:
         display_question_bank()
@@ -324,6 +343,28 @@ def display_practice_problems(difficulty: str):
     for i, q in enumerate(problems[difficulty], 1):
         st.markdown(f"{i}. {q}")
 
+def display_worksheet_answer_key():
+    """Bulk HCF/LCM answer key for a teacher's worksheet, one question per line."""
+    with st.expander("📝 Worksheet Answer Key (HCF & LCM)"):
+        text = st.text_area(
+            "One question per line, numbers separated by commas or spaces:",
+            placeholder="12, 18\n24, 36, 48\n1071, 462",
+            key="worksheet_groups"
+        )
+        show_steps = st.checkbox("Include step-by-step solutions", key="worksheet_steps")
+        if st.button("Generate Answer Key", key="worksheet_btn") and text.strip():
+            # Lines with zero, negative or decimal numbers are reported in their row
+            results = hcf_lcm_worksheet(parse_number_groups(text))
+            st.markdown(format_answer_key(results))
+            st.download_button(
+                "⬇️ Download CSV", answer_key_csv(results),
+                file_name="hcf_lcm_answer_key.csv", mime="text/csv"
+            )
+            if show_steps:
+                # Steps are only built here; Streamlit does not allow nested expanders
+                for i, result in enumerate(results, 1):
+                    st.markdown(f"**Q{i}.** {result.steps()}")
+
 def display_question_bank():
     st.markdown("""
 ### 📚 Question Bank - Real Numbers
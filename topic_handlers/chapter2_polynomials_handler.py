@@ -1,18 +1,20 @@
 # File: cbse_math_solver/handlers/chapter2_polynomials_handler.py
 
 import streamlit as st
-from sympy import symbols, Poly, sympify
 
 from utils.sanitizer import sanitize_expression, clean_query
 from chapters.chapter2_polynomials.main_router import route_query
 from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.plot_polynomial import plot_polynomial
 from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.narrator_polynomial import narrate_polynomial_plot
+from chapters.chapter2_polynomials.sub_chapters.polynomial_factoring.polynomial_analysis import MAX_DEGREE, analyze_polynomial
+
+CURVE_NAMES = {2: "Quadratic", 3: "Cubic", 4: "Quartic", 5: "Quintic"}
 
 def handle_chapter2_polynomials(topic: str):
     st.subheader(f'Selected: {topic}')
 
     if topic == 'Chapter 2: Polynomials > Polynomial Factoring':
-        st.markdown('### 🧮 Polynomial Factoring (Quadratic & Cubic)')
+        st.markdown('### 🧮 Polynomial Factoring (Quadratic, Cubic & Higher Degree)')
         
         # Add example buttons for quick testing
         col1, col2, col3 = st.columns(3)
@@ -29,7 +31,7 @@ def handle_chapter2_polynomials(topic: str):
         # Input field
         default_value = st.session_state.get('poly_input', '')
         user_query = st.text_input(
-            'Enter polynomial to factor (supports quadratic and cubic):',
+            f'Enter polynomial to factor (degree 2 up to {MAX_DEGREE}):',
             value=default_value,
             placeholder="e.g., x^2 + 5x + 6 or x^3 - 2x^2 - 5x + 6"
         )
@@ -48,34 +50,22 @@ def handle_chapter2_polynomials(topic: str):
 
                 # Try plotting
                 try:
-                    expr = sanitize_expression(raw_expr)
-                    x = symbols('x')
-                    poly = Poly(sympify(expr), x)
-                    degree = poly.degree()
-                    coeffs = poly.all_coeffs()
-
-                    if degree == 2 and len(coeffs) == 3:
-                        # Quadratic polynomial
-                        a, b, c = map(float, coeffs)
-                        plot_path = plot_polynomial([a, b, c], degree=2)
-                        st.image(plot_path, caption="Quadratic Polynomial Curve")
+                    # The solver has already analysed this polynomial; this is a cache hit
+                    analysis = analyze_polynomial(sanitize_expression(raw_expr))
+                    degree = analysis.degree
+                    coeffs = analysis.float_coefficients
 
-                        st.markdown("### 🗣️ Visual Explanation")
-                        narration = narrate_polynomial_plot([a, b, c], degree=2)
-                        st.info(narration)
-                        
-                    elif degree == 3 and len(coeffs) == 4:
-                        # Cubic polynomial
-                        a, b, c, d = map(float, coeffs)
-                        plot_path = plot_polynomial([a, b, c, d], degree=3)
-                        st.image(plot_path, caption="Cubic Polynomial Curve")
+                    if 2 <= degree <= MAX_DEGREE and len(coeffs) == degree + 1:
+                        plot_path = plot_polynomial(list(coeffs), degree=degree)
+                        curve_name = CURVE_NAMES.get(degree, f"Degree {degree}")
+                        st.image(plot_path, caption=f"{curve_name} Polynomial Curve")
 
                         st.markdown("### 🗣️ Visual Explanation")
-                        narration = narrate_polynomial_plot([a, b, c, d], degree=3)
+                        narration = narrate_polynomial_plot(list(coeffs), degree=degree)
                         st.info(narration)
                         
                     else:
-                        st.warning(f"Plotting is supported only for quadratic (degree 2) and cubic (degree 3) polynomials. Your polynomial has degree {degree}.")
+                        st.warning(f"Plotting is supported for polynomials of degree 2 to {MAX_DEGREE}. Your polynomial has degree {degree}.")
 
                 except Exception as e:
                     st.warning(f"⚠️ Could not extract coefficients for plotting: {e}")
@@ -86,12 +76,13 @@ def handle_chapter2_polynomials(topic: str):
             **Supported polynomial types:**
             - **Quadratic**: ax² + bx + c
             - **Cubic**: ax³ + bx² + cx + d
+            - **Higher degree**: up to degree 20, e.g. x⁴ - 5x² + 4
             
             **How it works:**
             1. For quadratics, we check the discriminant (b² - 4ac)
-            2. For cubics, we use the Rational Root Theorem and factor theorem
+            2. For cubics and higher degrees, we use the Rational Root Theorem and synthetic division
             3. The graph shows real roots as red dots where the curve crosses the x-axis
-            4. Green triangles (for cubics) show critical points (local max/min)
+            4. Green triangles (cubics and above) show critical points (local max/min)
             
             **Tips:**
             - Use ^ for exponents (x^2 means x²)
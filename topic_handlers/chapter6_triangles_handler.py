@@ -3,8 +3,8 @@
 import streamlit as st
 import math
 import os
-from chapters.chapter6_triangles.utils.triangle_plotter import TrianglePlotter
-from chapters.chapter6_triangles.main_router import route_query
+from chapters.chapter6_triangles import visualization
+from chapters.chapter6_triangles.main_router import solve_query
 from chapters.chapter6_triangles.educational_intent_handler import EducationalIntentHandler
 
 def handle_chapter6_triangles(topic: str):
@@ -44,16 +44,21 @@ def handle_chapter6_triangles(topic: str):
             if user_query and (trigger_calculation or st.button("✅ Solve")):
                 with st.spinner('Calculating...'):
                     try:
-                        result = route_query(user_query)
+                        solution = solve_query(user_query)
                         st.markdown("---")
-                        st.markdown(result)
+                        st.markdown(solution if isinstance(solution, str) else solution.text)
+
+                        # Drawing is a separate, cached step; the solver itself only computes
+                        image = visualization.render_solution(solution)
+                        if image:
+                            st.markdown("📊 **Visualization:**")
+                            st.image(image)
                     except Exception as e:
                         st.error(f"❌ Error processing query: {str(e)}")
                         st.info("💡 Please try one of the example queries or check your input format.")
         
         with tab2:
             st.markdown("#### 📊 Visualize Triangles")
-            plotter = TrianglePlotter()
             
             shape_type = st.selectbox(
                 "Select type of triangle:",
@@ -70,8 +75,7 @@ def handle_chapter6_triangles(topic: str):
                 if st.button("Generate Right Triangle"):
                     with st.spinner('Generating visualization...'):
                         try:
-                            fig = plotter.plot_right_triangle(base, height)
-                            st.pyplot(fig)
+                            st.image(visualization.render_right_triangle(base, height))
                             hypotenuse = math.sqrt(base**2 + height**2)
                             area = 0.5 * base * height
                             st.success(f"✅ **Calculations:**\n- Hypotenuse: {hypotenuse:.2f} cm\n- Area: {area:.2f} cm²")
@@ -114,8 +118,7 @@ def handle_chapter6_triangles(topic: str):
                             sorted2 = sorted(sides2)
                             scale_factor = sorted2[0] / sorted1[0]
                             
-                            fig = plotter.plot_similar_triangles(sides1, sides2, scale_factor)
-                            st.pyplot(fig)
+                            st.image(visualization.render_similar_triangles(sides1, sides2, scale_factor))
                             
                             ratios = [sorted2[i] / sorted1[i] for i in range(3)]
                             is_similar = all(abs(ratios[0] - ratio) < 0.001 for ratio in ratios)
@@ -144,8 +147,7 @@ def handle_chapter6_triangles(topic: str):
                                 st.error("❌ Invalid triangle! The sum of any two sides must be greater than the third side.")
                                 return
                             
-                            fig = plotter.plot_triangle(sides, "General Triangle")
-                            st.pyplot(fig)
+                            st.image(visualization.render_triangle(sides, "General Triangle"))
                             
                             angles = calculate_angles(sides)
                             area = calculate_area_heron(sides)
@@ -199,6 +201,8 @@ def handle_chapter6_triangles(topic: str):
                         st.success("✅ Equal Ratios!")
                     else:
                         st.warning(f"⚠️ Diff: {difference:.3f}")
+                if st.button("🎬 Play BPT Animation"):
+                    show_bpt_animation((AD, DB, AE, EC))
             elif theorem == "Pythagorean Theorem":
                 a = st.number_input("Side a:", value=3.0, min_value=0.1)
                 b = st.number_input("Side b:", value=4.0, min_value=0.1)
@@ -211,6 +215,21 @@ def handle_chapter6_triangles(topic: str):
         display_question_bank()
 
 
+def show_bpt_animation(segments):
+    """Show the BPT animation GIF; repeat requests for the same segments come from the cache."""
+    from chapters.chapter6_triangles.animations import bpt_animation
+
+    with st.spinner("Rendering animation..."):
+        gif, stats = bpt_animation.render_bpt_animation_with_stats(tuple(segments))
+    st.image(gif, caption=f"BPT with AD={segments[0]}, DB={segments[1]}, AE={segments[2]}, EC={segments[3]}")
+
+    if stats:
+        st.caption(f"Rendered {stats['rendered_frames']} of {stats['frames']} frames at "
+                   f"{stats['rendered_fps']:.0f} frames/s; encoded in {stats['total_seconds']:.1f} s")
+    else:
+        st.caption("Served from the animation cache")
+
+
 # Utility Functions
 
 def is_valid_triangle(sides):
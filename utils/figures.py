@@ -0,0 +1,140 @@
+# File: utils/figures.py
+
+"""
+Figure lifecycle for every plotting module.
+
+* create_figure() / create_subplots() build figures on their own Agg canvas,
+  outside pyplot's global figure registry: nothing keeps a figure alive once
+  its caller drops it, so a long-running server cannot pile them up
+* managed_figure() / managed_subplots() are the `with` forms every plotter
+  uses, closed on exit even when drawing fails; closing_figure() does the
+  same for a figure built elsewhere (e.g. by TrianglePlotter)
+* figure_to_bytes() renders a figure and closes it
+* figure_stats() reports live figures and the process RSS
+"""
+
+import io
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+SUPPORTED_FORMATS = ("png", "svg")
+
+_live_figures: "weakref.WeakSet[Figure]" = weakref.WeakSet()
+_counter_lock = threading.Lock()
+_totals = {"created": 0, "closed": 0}
+
+
+def create_figure(**figure_kwargs) -> Figure:
+    """A Figure with an Agg canvas, not registered with pyplot (same arguments as plt.figure)."""
+    fig = Figure(**figure_kwargs)
+    FigureCanvasAgg(fig)
+    _live_figures.add(fig)
+    with _counter_lock:
+        _totals["created"] += 1
+    return fig
+
+
+def create_subplots(nrows: int = 1, ncols: int = 1, **kwargs) -> Tuple[Figure, Any]:
+    """(fig, axes) like plt.subplots, on a figure from create_figure."""
+    subplot_keys = ("sharex", "sharey", "squeeze", "width_ratios", "height_ratios", "subplot_kw", "gridspec_kw")
+    subplot_kwargs = {key: kwargs.pop(key) for key in subplot_keys if key in kwargs}
+    fig = create_figure(**kwargs)
+    return fig, fig.subplots(nrows, ncols, **subplot_kwargs)
+
+
+def close_figure(fig: Figure) -> None:
+    """Release a figure now: drop it from pyplot (if registered) and clear its artists. Safe to repeat."""
+    if fig is None:
+        return
+    plt.close(fig)
+    fig.clear()
+    if fig in _live_figures:
+        _live_figures.discard(fig)
+        with _counter_lock:
+            _totals["closed"] += 1
+
+
+@contextmanager
+def managed_figure(**figure_kwargs) -> Iterator[Figure]:
+    """with managed_figure(figsize=(8, 6)) as fig: ... — closed on exit."""
+    with closing_figure(create_figure(**figure_kwargs)) as fig:
+        yield fig
+
+
+@contextmanager
+def managed_subplots(nrows: int = 1, ncols: int = 1, **kwargs) -> Iterator[Tuple[Figure, Any]]:
+    """with managed_subplots(figsize=(8, 6)) as (fig, ax): ... — closed on exit."""
+    fig, axes = create_subplots(nrows, ncols, **kwargs)
+    with closing_figure(fig):
+        yield fig, axes
+
+
+@contextmanager
+def closing_figure(fig: Figure) -> Iterator[Figure]:
+    """with closing_figure(plotter.plot_x(...)) as fig: ... — takes ownership of fig and closes it on exit."""
+    try:
+        yield fig
+    finally:
+        close_figure(fig)
+
+
+def _rss_bytes() -> Optional[int]:
+    """Current resident set size; the peak on systems without /proc; None on Windows."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource  # POSIX only
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak * 1024 if os.uname().sysname != "Darwin" else peak
+
+
+def figure_stats() -> Dict[str, Any]:
+    """Live figure counts (ours and pyplot's), lifetime totals and RSS in MB."""
+    rss = _rss_bytes()
+    with _counter_lock:
+        totals = dict(_totals)
+    return {
+        "live_figures": len(_live_figures),
+        "pyplot_figures": len(plt.get_fignums()),
+        "created": totals["created"],
+        "closed": totals["closed"],
+        "rss_mb": rss / (1024 * 1024) if rss is not None else None,
+    }
+
+
+def figure_to_bytes(fig: Figure, fmt: str = "png", dpi: int = 150,
+                    save_path: Optional[str] = None, close: bool = True, **savefig_kwargs) -> bytes:
+    """
+    Render a figure to an in-memory PNG/SVG buffer and return the bytes.
+    Nothing touches the disk unless `save_path` is given; every call gets its
+    own buffer, so concurrent sessions cannot overwrite each other's image.
+    """
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported image format: {fmt}. Use one of {SUPPORTED_FORMATS}")
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format=fmt, dpi=dpi, **savefig_kwargs)
+    finally:
+        if close:
+            close_figure(fig)
+    data = buffer.getvalue()
+
+    if save_path:
+        directory = os.path.dirname(save_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(save_path, "wb") as f:
+            f.write(data)
+    return data
@@ -0,0 +1,183 @@
+# File: utils/intent_cache.py
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.environ.get("CBSE_CACHE_DIR", os.path.join(PROJECT_ROOT, ".cache"))
+
+# Results with these intents are never stored, so a transient API failure
+# does not stick to a query.
+UNCACHEABLE_INTENTS = {"error", "unknown"}
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize query text so trivially different spellings share a cache entry.
+    Example: '  Find area  of triangle ABC?? ' → 'Find area of triangle ABC'
+    Case is kept: the cached result holds extracted parameters, and names
+    such as vertices AB and ab are not interchangeable.
+    """
+    text = str(query).strip()
+    text = re.sub(r"\s+", " ", text)
+    return text.rstrip("?.! ")
+
+
+class IntentCache:
+    """
+    Persistent (SQLite) cache of LLM intent classifications.
+    Entries are keyed by (chapter, normalized query), expire after `ttl_seconds`
+    and the least recently used entries are evicted beyond `max_entries`.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, ttl_seconds: float = 7 * 24 * 3600,
+                 max_entries: int = 5000):
+        self.db_path = db_path or os.path.join(CACHE_DIR, "intent_cache.sqlite3")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use (falls back to memory if the disk is read-only)."""
+        if self._conn is None:
+            try:
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            except (OSError, sqlite3.Error):
+                self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS intents (
+                    chapter TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (chapter, query)
+                )
+            """)
+            self._conn.commit()
+        return self._conn
+
+    def get(self, chapter: str, query: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for a query, or None on a miss."""
+        key = normalize_query(query)
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT result, created_at FROM intents WHERE chapter = ? AND query = ?",
+                    (chapter, key)
+                ).fetchone()
+                if row and now - row[1] <= self.ttl_seconds:
+                    conn.execute(
+                        "UPDATE intents SET last_access = ? WHERE chapter = ? AND query = ?",
+                        (now, chapter, key)
+                    )
+                    conn.commit()
+                    self.hits += 1
+                    return json.loads(row[0])
+                if row:
+                    conn.execute("DELETE FROM intents WHERE chapter = ? AND query = ?", (chapter, key))
+                    conn.commit()
+                    self.evictions += 1
+            except sqlite3.Error:
+                pass
+            self.misses += 1
+            return None
+
+    def set(self, chapter: str, query: str, result: Dict[str, Any]) -> None:
+        """Store a classification result and evict expired / least recently used rows."""
+        if not isinstance(result, dict) or result.get("intent") in UNCACHEABLE_INTENTS:
+            return
+        key = normalize_query(query)
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO intents (chapter, query, result, created_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (chapter, key, json.dumps(result), now, now)
+                )
+                self._evict(conn, now)
+                conn.commit()
+            except (sqlite3.Error, TypeError, ValueError):
+                pass
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired rows, then the oldest-accessed rows above max_entries."""
+        expired = conn.execute("DELETE FROM intents WHERE created_at < ?", (now - self.ttl_seconds,))
+        self.evictions += max(expired.rowcount, 0)
+        size = conn.execute("SELECT COUNT(*) FROM intents").fetchone()[0]
+        overflow = size - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM intents WHERE rowid IN "
+                "(SELECT rowid FROM intents ORDER BY last_access ASC LIMIT ?)",
+                (overflow,)
+            )
+            self.evictions += overflow
+
+    def clear(self) -> None:
+        """Remove every cached entry and reset the counters."""
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute("DELETE FROM intents")
+                conn.commit()
+            except sqlite3.Error:
+                pass
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current number of entries."""
+        with self._lock:
+            try:
+                size = self._connection().execute("SELECT COUNT(*) FROM intents").fetchone()[0]
+            except sqlite3.Error:
+                size = 0
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": size,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Shared instance used by all chapter classifiers
+intent_cache = IntentCache()
+
+
+def cached_intent(chapter: str, cache: Optional[IntentCache] = None) -> Callable:
+    """
+    Decorator that puts the shared intent cache in front of an LLM classifier.
+    Usage:
+        @cached_intent("triangles")
+        def interpret_query_triangles(query): ...
+    """
+    def decorator(func: Callable[[str], Dict[str, Any]]) -> Callable[[str], Dict[str, Any]]:
+        @wraps(func)
+        def wrapper(query: str) -> Dict[str, Any]:
+            store = cache or intent_cache
+            cached = store.get(chapter, query)
+            if cached is not None:
+                return cached
+            result = func(query)
+            store.set(chapter, query, result)
+            return result
+        wrapper.cache_chapter = chapter
+        return wrapper
+    return decorator
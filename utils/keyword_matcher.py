@@ -0,0 +1,102 @@
+# File: utils/keyword_matcher.py
+
+"""
+Multi-keyword matcher for the chapter routers (Aho–Corasick).
+
+A router builds one KeywordMatcher from its keyword tables at import time.
+scan(query) then walks the query once, character by character, and reports
+every keyword of every table that occurs in it, so the cost of routing grows
+with the length of the query, not with the number of keywords.
+
+Matching is plain substring matching, like `keyword in query`.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class KeywordHits:
+    """Keywords found in one query, grouped by table (intent)."""
+
+    __slots__ = ("keywords", "_order")
+
+    def __init__(self, keywords: Dict[str, set], order: Sequence[str]):
+        self.keywords = keywords
+        self._order = order
+
+    def __contains__(self, intent: str) -> bool:
+        return intent in self.keywords
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def first(self, intents: Optional[Sequence[str]] = None) -> Optional[str]:
+        """First intent (in the given or table order) with a hit, like an if/elif chain of any() checks."""
+        for intent in intents or self._order:
+            if intent in self.keywords:
+                return intent
+        return None
+
+    def rank(self) -> List[Tuple[str, int]]:
+        """
+        Intents with hits, best first. The score is the total length of the
+        distinct keywords matched, so specific phrases outweigh short words;
+        ties keep table order.
+        """
+        scores = {intent: sum(map(len, words)) for intent, words in self.keywords.items()}
+        return sorted(scores.items(), key=lambda item: (-item[1], self._order.index(item[0])))
+
+    def __repr__(self) -> str:
+        return f"KeywordHits({ {intent: sorted(words) for intent, words in self.keywords.items()} })"
+
+
+class KeywordMatcher:
+    """Aho–Corasick automaton over {intent: [keywords]}; build once, scan many queries."""
+
+    def __init__(self, tables: Dict[str, Iterable[str]], case_sensitive: bool = False):
+        self.case_sensitive = case_sensitive
+        self.order = list(tables)
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[Tuple[str, str]]] = [[]]
+
+        # Trie of all keywords
+        for intent, keywords in tables.items():
+            for keyword in keywords:
+                key = keyword if case_sensitive else keyword.lower()
+                state = 0
+                for ch in key:
+                    if ch not in goto[state]:
+                        goto.append({})
+                        outputs.append([])
+                        goto[state][ch] = len(goto) - 1
+                    state = goto[state][ch]
+                outputs[state].append((intent, keyword))
+
+        # Failure links breadth-first; each state's transitions are completed
+        # with its failure state's, so scanning is one dict lookup per character
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            # goto[fail[state]] is already complete: it is shallower, so it was handled earlier
+            for ch, child in goto[state].items():
+                queue.append(child)
+                fail[child] = goto[fail[state]].get(ch, 0)
+                outputs[child] = outputs[child] + outputs[fail[child]]
+            for ch, target in goto[fail[state]].items():
+                goto[state].setdefault(ch, target)
+
+        self._goto = goto
+        self._outputs = [tuple(out) for out in outputs]
+
+    def scan(self, text: str) -> KeywordHits:
+        """All keyword hits in text, found in a single pass."""
+        if not self.case_sensitive:
+            text = text.lower()
+        goto, outputs = self._goto, self._outputs
+        found: Dict[str, set] = {}
+        state = 0
+        for ch in text:
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                for intent, keyword in outputs[state]:
+                    found.setdefault(intent, set()).add(keyword)
+        return KeywordHits(found, self.order)
@@ -0,0 +1,216 @@
+# File: utils/llm_gateway.py
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Any, Callable, Dict, Optional, Union
+
+DEFAULT_MODEL = "llama3-8b-8192"
+DEFAULT_DEADLINE = float(os.environ.get("LLM_DEADLINE_SECONDS", "4"))
+DEFAULT_MAX_CONCURRENCY = int(os.environ.get("LLM_MAX_CONCURRENCY", "4"))
+
+
+class LLMUnavailable(Exception):
+    """The LLM could not answer; callers should fall back to the regex parsers."""
+
+
+class CircuitOpenError(LLMUnavailable):
+    """Raised without calling the provider while the breaker is open."""
+
+
+class DeadlineExceeded(LLMUnavailable):
+    """Raised when a call does not finish within its deadline."""
+
+
+class ConcurrencyLimitExceeded(LLMUnavailable):
+    """Raised when all LLM slots are busy (the call is not queued)."""
+
+
+class GroqBackend:
+    """Groq chat completions. The client is created on first use, not at import time."""
+
+    def __init__(self, model: str = DEFAULT_MODEL, api_key: Optional[str] = None):
+        self.model = model
+        self.api_key = api_key
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _get_client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    from dotenv import load_dotenv
+                    from groq import Groq
+
+                    load_dotenv()
+                    api_key = self.api_key or os.getenv("GROQ_API_KEY")
+                    if not api_key:
+                        raise LLMUnavailable("GROQ_API_KEY is not set")
+                    # Retries are handled by the gateway's breaker, not the HTTP client
+                    self._client = Groq(api_key=api_key, max_retries=0)
+        return self._client
+
+    def complete(self, prompt: str, temperature: float, timeout: Optional[float]) -> str:
+        response = self._get_client().chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            timeout=timeout
+        )
+        return response.choices[0].message.content
+
+
+class StubBackend:
+    """
+    Local stand-in for the provider, used in tests and offline runs.
+    `response` is a string or a callable(prompt) -> str; `latency` is slept before
+    answering and `error` (an exception instance) is raised instead of answering.
+    """
+
+    def __init__(self, response: Union[str, Callable[[str], str]] = '{"intent": "unknown"}',
+                 latency: float = 0.0, error: Optional[Exception] = None):
+        self.response = response
+        self.latency = latency
+        self.error = error
+        self.calls = 0
+
+    def complete(self, prompt: str, temperature: float, timeout: Optional[float]) -> str:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if self.error is not None:
+            raise self.error
+        return self.response(prompt) if callable(self.response) else self.response
+
+
+class DisabledBackend:
+    """Backend for offline use: every call fails immediately."""
+
+    def complete(self, prompt: str, temperature: float, timeout: Optional[float]) -> str:
+        raise LLMUnavailable("LLM backend is disabled")
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls for
+    `reset_timeout` seconds; then lets a single trial call through (half-open).
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def release_trial(self) -> None:
+        """Give back a half-open trial slot that was not used."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class LLMGateway:
+    """
+    Single entry point for LLM calls: per-call deadline, bounded concurrency and
+    a circuit breaker. Every failure surfaces as LLMUnavailable so chapter
+    interpreters can return an "error" intent and the routers use regex instead.
+    """
+
+    def __init__(self, backend=None, deadline: float = DEFAULT_DEADLINE,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.backend = backend if backend is not None else default_backend()
+        self.deadline = deadline
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="llm")
+        self.counters = {"calls": 0, "successes": 0, "failures": 0, "timeouts": 0,
+                         "short_circuited": 0, "rejected": 0}
+
+    def set_backend(self, backend) -> None:
+        """Swap the provider (e.g. a StubBackend in tests) and reset the breaker."""
+        self.backend = backend
+        self.breaker.record_success()
+
+    def complete(self, prompt: str, temperature: float = 0.2, deadline: Optional[float] = None) -> str:
+        """Return the completion text or raise LLMUnavailable within `deadline` seconds."""
+        deadline = self.deadline if deadline is None else deadline
+        self.counters["calls"] += 1
+
+        if not self.breaker.allow():
+            self.counters["short_circuited"] += 1
+            raise CircuitOpenError("LLM circuit breaker is open")
+        if not self._slots.acquire(blocking=False):
+            self.counters["rejected"] += 1
+            self.breaker.release_trial()
+            raise ConcurrencyLimitExceeded("Too many concurrent LLM calls")
+
+        backend = self.backend
+        # The slot is held until the provider call really ends, even after a timeout
+        future = self._executor.submit(backend.complete, prompt, temperature, deadline)
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            content = future.result(timeout=deadline)
+        except FutureTimeout:
+            self.counters["timeouts"] += 1
+            self.breaker.record_failure()
+            raise DeadlineExceeded(f"LLM call exceeded {deadline:.1f}s deadline")
+        except Exception as e:
+            self.counters["failures"] += 1
+            self.breaker.record_failure()
+            raise LLMUnavailable(str(e)) from e
+
+        self.counters["successes"] += 1
+        self.breaker.record_success()
+        return content
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters plus the current breaker state."""
+        return dict(self.counters, breaker=self.breaker.state)
+
+
+def default_backend():
+    """Pick the backend from LLM_BACKEND: 'groq' (default), 'stub' or 'off'."""
+    name = os.environ.get("LLM_BACKEND", "groq").lower()
+    if name == "stub":
+        return StubBackend()
+    if name in ("off", "none", "disabled"):
+        return DisabledBackend()
+    return GroqBackend()
+
+
+# Shared gateway used by all chapter interpreters
+llm_gateway = LLMGateway()
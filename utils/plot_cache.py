@@ -0,0 +1,200 @@
+# File: utils/plot_cache.py
+
+import hashlib
+import inspect
+import json
+import numbers
+import os
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+from utils.intent_cache import CACHE_DIR
+
+# Bump to invalidate every cached image after a change to plot styling
+STYLE_VERSION = 1
+
+# Arguments that only choose where a file is written, not what is drawn
+OUTPUT_ARGUMENTS = {"save_name", "plot_name", "filename"}
+
+DEFAULT_MAX_BYTES = int(os.environ.get("PLOT_CACHE_MAX_MB", "200")) * 1024 * 1024
+
+
+def _canonical(value: Any) -> Any:
+    """Make arguments JSON-stable: 7, 7.0 and numpy scalars hash the same."""
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, numbers.Real):
+        return float(value)
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)) or hasattr(value, "tolist"):
+        items = value.tolist() if hasattr(value, "tolist") else value
+        return [_canonical(v) for v in items]
+    return repr(value)
+
+
+def _bound_arguments(func: Callable, args: tuple, kwargs: dict) -> Dict[str, Any]:
+    """Map positional and keyword arguments to parameter names, defaults included."""
+    try:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        return dict(bound.arguments)
+    except TypeError:
+        return {"args": args, "kwargs": kwargs}
+
+
+def make_plot_key(func: Callable, args: tuple, kwargs: dict, style_version: int = STYLE_VERSION) -> str:
+    """SHA-256 of (function, bound parameters, style version)."""
+    params = _bound_arguments(func, args, kwargs)
+    params = {k: v for k, v in params.items() if k not in OUTPUT_ARGUMENTS}
+    payload = json.dumps(
+        [f"{func.__module__}.{func.__qualname__}", _canonical(params), style_version],
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PlotCache:
+    """
+    Content-addressed, size-bounded on-disk store of rendered images.
+    Files are named by key; the least recently used ones are deleted once the
+    store grows beyond `max_bytes`.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or os.path.join(CACHE_DIR, "plots")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._index: Optional[OrderedDict] = None  # key → size, oldest first
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.bin")
+
+    def _load_index(self) -> OrderedDict:
+        """Rebuild the LRU order from file modification times (once per process)."""
+        if self._index is None:
+            entries = []
+            if os.path.isdir(self.cache_dir):
+                for name in os.listdir(self.cache_dir):
+                    if name.endswith(".bin"):
+                        path = os.path.join(self.cache_dir, name)
+                        try:
+                            stat = os.stat(path)
+                        except OSError:
+                            continue
+                        entries.append((stat.st_mtime, name[:-4], stat.st_size))
+            entries.sort()
+            self._index = OrderedDict((key, size) for _, key, size in entries)
+            self._total_bytes = sum(self._index.values())
+        return self._index
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached bytes for a key, or None on a miss."""
+        with self._lock:
+            index = self._load_index()
+            if key in index:
+                try:
+                    with open(self._path(key), "rb") as f:
+                        data = f.read()
+                    os.utime(self._path(key))
+                    index.move_to_end(key)
+                    self.hits += 1
+                    return data
+                except OSError:
+                    self._total_bytes -= index.pop(key)
+            self.misses += 1
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store bytes under a key, then evict least recently used entries over the limit."""
+        with self._lock:
+            index = self._load_index()
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp_path = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self._path(key))
+            except OSError:
+                return
+            self._total_bytes -= index.pop(key, 0)
+            index[key] = len(data)
+            self._total_bytes += len(data)
+            while self._total_bytes > self.max_bytes and len(index) > 1:
+                old_key, size = index.popitem(last=False)
+                self._total_bytes -= size
+                self.evictions += 1
+                try:
+                    os.remove(self._path(old_key))
+                except OSError:
+                    pass
+
+    def clear(self) -> None:
+        """Delete every cached image and reset the counters."""
+        with self._lock:
+            for key in list(self._load_index()):
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            self._index = OrderedDict()
+            self._total_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, hit rate and current store size."""
+        with self._lock:
+            index = self._load_index()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(index),
+                "bytes": self._total_bytes,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Shared store used by all plotting modules
+plot_cache = PlotCache()
+
+
+def cached_plot(style_version: int = STYLE_VERSION, cache: Optional[PlotCache] = None,
+                with_info: bool = False) -> Callable:
+    """
+    Decorator for plotting functions that return image bytes. Returns the bytes
+    of a previous render with the same parameters; otherwise renders, stores and
+    returns them. Calls that ask for a file on disk always render so the file is
+    written; non-bytes results (e.g. an error message) are passed through uncached.
+
+    With with_info=True the function returns (bytes, info) and so does the
+    wrapper: only the bytes are stored, and info is None on a cache hit. Use it
+    to report per-render details (timings, sizes) without module state.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            store = cache or plot_cache
+            key = make_plot_key(func, args, kwargs, style_version)
+            params = _bound_arguments(func, args, kwargs)
+            writes_file = any(params.get(name) for name in OUTPUT_ARGUMENTS)
+            if not writes_file:
+                data = store.get(key)
+                if data is not None:
+                    return (data, None) if with_info else data
+
+            result = func(*args, **kwargs)
+            data = result[0] if with_info else result
+            if isinstance(data, (bytes, bytearray)):
+                store.put(key, bytes(data))
+            return result
+        wrapper.plot_cache_key = lambda *args, **kwargs: make_plot_key(func, args, kwargs, style_version)
+        return wrapper
+    return decorator
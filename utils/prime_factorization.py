@@ -0,0 +1,171 @@
+# File: utils/prime_factorization.py
+
+"""
+Prime factorization engine shared by the Real Numbers solvers.
+
+* n ≤ SIEVE_LIMIT: smallest-prime-factor sieve, built once on first use
+* larger n: trial division by small primes, then Miller–Rabin to spot primes
+  and Brent's variant of Pollard's rho to split composites
+* results are memoized, so factorizing the same number twice is a dict lookup
+* divisors() builds the divisor set from the factorization instead of
+  trial-dividing every number up to n
+"""
+
+import math
+import random
+import threading
+from array import array
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple
+
+SIEVE_LIMIT = 1_000_000
+
+# Trial-divide by these before running Pollard's rho on a large number
+SMALL_PRIMES = [p for p in range(2, 1000) if all(p % d for d in range(2, int(p ** 0.5) + 1))]
+
+# Deterministic Miller–Rabin witnesses for every n < 3.3 × 10^24
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+_sieve = None
+_sieve_lock = threading.Lock()
+
+
+def _smallest_prime_factors() -> array:
+    """spf[n] = smallest prime dividing n, for 2 ≤ n ≤ SIEVE_LIMIT."""
+    global _sieve
+    if _sieve is None:
+        with _sieve_lock:
+            if _sieve is None:
+                limit = math.isqrt(SIEVE_LIMIT)
+                is_composite = bytearray(limit + 1)
+                primes = []
+                for p in range(2, limit + 1):
+                    if not is_composite[p]:
+                        primes.append(p)
+                        is_composite[p * p::p] = b"\x01" * len(range(p * p, limit + 1, p))
+                spf = array("I", range(SIEVE_LIMIT + 1))
+                # Largest primes first, so each entry ends up holding the smallest
+                for p in reversed(primes):
+                    count = len(range(p * p, SIEVE_LIMIT + 1, p))
+                    spf[p * p::p] = array("I", [p]) * count
+                _sieve = spf
+    return _sieve
+
+
+def is_prime(n: int) -> bool:
+    """Miller–Rabin primality test (deterministic below 3.3 × 10^24)."""
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES[:13]:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def pollard_rho(n: int) -> int:
+    """Return a non-trivial factor of an odd composite n (Brent's cycle detection)."""
+    if n % 2 == 0:
+        return 2
+    rng = random.Random(n)
+    while True:
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # Batched gcd overshot; step back one iteration at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def _factor_large(n: int, counts: Counter) -> None:
+    """Split n > 1 into primes with Miller–Rabin and Pollard's rho."""
+    if n <= SIEVE_LIMIT:
+        spf = _smallest_prime_factors()
+        while n > 1:
+            counts[spf[n]] += 1
+            n //= spf[n]
+        return
+    if is_prime(n):
+        counts[n] += 1
+        return
+    d = pollard_rho(n)
+    _factor_large(d, counts)
+    _factor_large(n // d, counts)
+
+
+@lru_cache(maxsize=4096)
+def factorize(n: int) -> Tuple[Tuple[int, int], ...]:
+    """((prime, exponent), ...) in increasing order of prime; () for n = 1."""
+    n = int(n)
+    if n < 1:
+        raise ValueError(f"Cannot factorize {n}: need a positive integer")
+    counts = Counter()
+    if n > SIEVE_LIMIT:
+        for p in SMALL_PRIMES:
+            if p * p > n:
+                break
+            while n % p == 0:
+                counts[p] += 1
+                n //= p
+    if n > 1:
+        _factor_large(n, counts)
+    return tuple(sorted(counts.items()))
+
+
+def factor_counts(n: int) -> Dict[int, int]:
+    """{prime: exponent} for n."""
+    return dict(factorize(n))
+
+
+def prime_factor_list(n: int) -> List[int]:
+    """Prime factors of n with repetition, smallest first: 360 → [2, 2, 2, 3, 3, 5]."""
+    return [p for p, exponent in factorize(n) for _ in range(exponent)]
+
+
+@lru_cache(maxsize=1024)
+def divisors(n: int) -> Tuple[int, ...]:
+    """Positive divisors of |n| in increasing order: 12 → (1, 2, 3, 4, 6, 12)."""
+    result = [1]
+    for p, exponent in factorize(abs(int(n))):
+        result = [d * p ** k for d in result for k in range(exponent + 1)]
+    return tuple(sorted(result))
+
+
+def divisor_pairs(n: int) -> Iterator[Tuple[int, int]]:
+    """(d, |n| // d) for each divisor d ≤ √|n|, smallest d first."""
+    n = abs(int(n))
+    for d in divisors(n):
+        if d * d > n:
+            break
+        yield d, n // d
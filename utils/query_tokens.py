@@ -0,0 +1,125 @@
+# File: utils/query_tokens.py
+
+"""
+Shared query tokenizer and precompiled pattern registry for the chapter parsers.
+
+* tokenize(query) scans the query once with a single compiled pattern into
+  numbers (with their unit), √-terms, words and operators, and records which
+  label each number follows ("radius 7 cm" → labels["radius"] = 7)
+* the result is memoized, so the router, the local classifier's parameter
+  extractors and the rule-based fallback all share one scan per query
+* shapes that do not fit a token stream, such as "(3, 4, 5)", are regexes
+  compiled once via register() and listed in PATTERNS
+"""
+
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, NamedTuple, Optional, Pattern, Tuple, Union
+
+NUMBER = r'\d+(?:\.\d+)?'
+
+PATTERNS: Dict[str, Pattern] = {}
+
+
+def register(name: str, pattern: str, flags: int = 0) -> Pattern:
+    """Compile a pattern once and record it in PATTERNS under name."""
+    if name not in PATTERNS:
+        PATTERNS[name] = re.compile(pattern, flags)
+    return PATTERNS[name]
+
+
+# Longest spellings first so "degrees" is not read as "deg" + "rees"
+UNITS = ("degrees", "degree", "deg", "°", "cm", "mm", "km", "m")
+ANGLE_UNITS = {"degrees": "°", "degree": "°", "deg": "°", "°": "°"}
+
+# Two-word labels; a number after "slant height" is not also the "height"
+COMPOUND_LABELS = {("slant", "height"): "slant height"}
+
+# Separators allowed between a label and its number: "base: 3", "base = 3"
+LABEL_SEPARATORS = {":", "="}
+
+_TOKEN_PATTERN = register("token", rf"""
+    (?P<root>√\s*(?P<radicand>\d+))
+  | (?P<number>{NUMBER})(?:\s*(?P<unit>{'|'.join(map(re.escape, UNITS))})(?![a-z]))?
+  | (?P<word>[^\W\d_]+)
+  | (?P<op>[-+*/^=(),:])
+""", re.VERBOSE | re.IGNORECASE)
+
+
+class Token(NamedTuple):
+    kind: str  # "number", "root", "word" or "op"
+    text: str
+    value: Union[int, float, str]
+    unit: Optional[str] = None
+
+
+def _to_number(text: str) -> Union[int, float]:
+    """Whole numbers stay exact ints (no float rounding above 2^53)."""
+    return float(text) if '.' in text else int(text)
+
+
+class QueryTokens:
+    """One pass over a query; read-only views of what the parsers need."""
+
+    __slots__ = ("query", "tokens", "numbers", "angles", "roots", "units", "words", "labels")
+
+    def __init__(self, query: str):
+        self.query = query
+        tokens, numbers, angles, roots, units, words, labels = [], [], [], [], {}, set(), {}
+        previous_words = ()  # up to two words since the last number, for labelling it
+        for match in _TOKEN_PATTERN.finditer(query):
+            kind, text = match.lastgroup, match.group()
+            if kind == "word":
+                word = text.lower()
+                tokens.append(Token("word", text, word))
+                words.add(word)
+                previous_words = previous_words[-1:] + (word,)
+            elif kind == "op":
+                tokens.append(Token("op", text, text))
+                if text not in LABEL_SEPARATORS:
+                    previous_words = ()
+            elif kind == "root":
+                value = int(match.group("radicand"))
+                tokens.append(Token("root", text, value))
+                numbers.append(value)
+                roots.append(value)
+                previous_words = ()
+            else:  # "number", or "unit" when a unit follows it
+                unit = match.group("unit")
+                if unit:
+                    unit = unit.lower()
+                    unit = ANGLE_UNITS.get(unit, unit)
+                    units[unit] = None
+                value = _to_number(match.group("number"))
+                tokens.append(Token("number", text, value, unit))
+                numbers.append(value)
+                if unit == "°":
+                    angles.append(value)
+                if previous_words:
+                    labels.setdefault(COMPOUND_LABELS.get(previous_words, previous_words[-1]), value)
+                previous_words = ()
+
+        self.tokens: Tuple[Token, ...] = tuple(tokens)
+        self.numbers = tuple(numbers)
+        self.angles = tuple(angles)
+        self.roots = tuple(roots)
+        self.units = tuple(units)
+        self.words = frozenset(words)
+        self.labels = MappingProxyType(labels)
+
+    def label(self, *names: str) -> Optional[Union[int, float]]:
+        """Value after the first of names found in the query ("radius", "diameter", ...), else None."""
+        for name in names:
+            if name in self.labels:
+                return self.labels[name]
+        return None
+
+    def __repr__(self) -> str:
+        return f"QueryTokens({self.query!r}, numbers={self.numbers}, labels={dict(self.labels)})"
+
+
+@lru_cache(maxsize=512)
+def tokenize(query: str) -> QueryTokens:
+    """Tokens for query, scanned once and memoized."""
+    return QueryTokens(query)
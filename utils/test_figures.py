@@ -0,0 +1,55 @@
+# File: utils/test_figures.py
+
+import sys
+import os
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.abspath(__file__), "../.."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.figures import closing_figure, figure_stats, figure_to_bytes, managed_figure, managed_subplots
+
+
+def test_managed_figures_are_closed_on_exit():
+    before = figure_stats()
+    with managed_subplots(1, 2, figsize=(4, 3)) as (fig, (ax1, ax2)):
+        ax1.plot([0, 1], [0, 1])
+        data = figure_to_bytes(fig)  # closes it already; the exit must not count it twice
+    assert data.startswith(b"\x89PNG")
+    with managed_figure(figsize=(4, 3)) as fig:
+        fig.add_subplot(111)
+    after = figure_stats()
+    assert after["live_figures"] == before["live_figures"]
+    assert after["created"] - before["created"] == after["closed"] - before["closed"] == 2
+    assert after["pyplot_figures"] == before["pyplot_figures"]
+
+
+def test_figure_is_closed_when_drawing_fails():
+    before = figure_stats()
+    try:
+        with managed_figure(figsize=(4, 3)) as fig:
+            fig.add_subplot(111)
+            raise RuntimeError("drawing failed")
+    except RuntimeError:
+        pass
+    assert not fig.axes
+    assert figure_stats()["closed"] - before["closed"] == 1
+
+
+def test_closing_figure_takes_ownership():
+    with managed_figure() as fig:
+        pass
+    with closing_figure(fig) as owned:  # already closed: closing again is harmless
+        assert owned is fig
+    before = figure_stats()
+    with managed_subplots() as (fig, ax):
+        with closing_figure(fig):
+            ax.plot([0, 1], [1, 0])
+        assert not fig.axes
+    assert figure_stats()["closed"] - before["closed"] == 1
+
+
+if __name__ == "__main__":
+    test_managed_figures_are_closed_on_exit()
+    test_figure_is_closed_when_drawing_fails()
+    test_closing_figure_takes_ownership()
+    print("All figure lifecycle tests passed")
@@ -0,0 +1,67 @@
+# File: utils/test_intent_cache.py
+
+import sys
+import os
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.abspath(__file__), "../.."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.intent_cache import IntentCache, cached_intent, normalize_query
+
+
+def make_cache(**kwargs) -> IntentCache:
+    return IntentCache(db_path=os.path.join(tempfile.mkdtemp(), "intents.sqlite3"), **kwargs)
+
+
+def test_normalizer_keeps_case():
+    assert normalize_query("  Find area \t of  triangle ABC?? ") == "Find area of triangle ABC"
+    assert normalize_query("find AB") != normalize_query("find ab")
+
+
+def test_entries_expire_after_ttl():
+    cache = make_cache(ttl_seconds=0.05)
+    cache.set("triangles", "q", {"intent": "calculate_area"})
+    assert cache.get("triangles", "q ") == {"intent": "calculate_area"}
+    time.sleep(0.06)
+    assert cache.get("triangles", "q") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = make_cache(max_entries=2)
+    cache.set("triangles", "a", {"intent": "a"})
+    time.sleep(0.01)
+    cache.set("triangles", "b", {"intent": "b"})
+    time.sleep(0.01)
+    assert cache.get("triangles", "a")  # a is now more recent than b
+    time.sleep(0.01)
+    cache.set("triangles", "c", {"intent": "c"})
+    assert cache.get("triangles", "b") is None
+    assert cache.get("triangles", "a") and cache.get("triangles", "c")
+    # Failures are never stored
+    cache.set("triangles", "d", {"intent": "error"})
+    assert cache.get("triangles", "d") is None
+
+
+def test_decorator_calls_the_classifier_once_per_query():
+    calls = []
+
+    @cached_intent("triangles", cache=make_cache())
+    def classify(query):
+        calls.append(query)
+        return {"intent": "check_similarity", "parameters": {"side": query.split()[-1]}}
+
+    assert classify("similar AB") == classify("  similar AB? ")
+    assert classify("similar ab")["parameters"] == {"side": "ab"}
+    assert calls == ["similar AB", "similar ab"]
+    assert classify.cache_chapter == "triangles"
+
+
+if __name__ == "__main__":
+    test_normalizer_keeps_case()
+    test_entries_expire_after_ttl()
+    test_least_recently_used_entries_are_evicted()
+    test_decorator_calls_the_classifier_once_per_query()
+    print("All intent cache tests passed")
@@ -0,0 +1,37 @@
+# File: utils/test_keyword_matcher.py
+
+import sys
+import os
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.abspath(__file__), "../.."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.keyword_matcher import KeywordMatcher
+
+
+def test_matches_substring_semantics_with_overlaps():
+    tables = {"hcf_lcm": ["hcf and lcm"], "hcf": ["hcf", "common factor"], "factor": ["factor", "actor"]}
+    hits = KeywordMatcher(tables).scan("Find HCF and LCM, the highest Common Factor")
+    assert hits.keywords == {
+        "hcf_lcm": {"hcf and lcm"}, "hcf": {"hcf", "common factor"}, "factor": {"factor", "actor"}
+    }
+    assert hits.first() == "hcf_lcm"
+    assert hits.first(["factor", "hcf"]) == "factor"
+    assert hits.rank()[0] == ("hcf", len("hcf") + len("common factor"))
+    assert not KeywordMatcher(tables).scan("area of a circle")
+
+
+def test_real_numbers_router_keeps_priority():
+    from chapters.chapter1_real_numbers.main_router import parse_real_numbers_query
+
+    assert parse_real_numbers_query("find hcf and lcm of 12 and 18")[0] == "hcf_lcm"
+    # "euclidean algorithm" is also an HCF keyword; the Euclidean route comes first
+    query_type, params = parse_real_numbers_query("extended euclidean algorithm for 35 and 15")
+    assert query_type == "euclidean_algorithm" and params["extended"]
+    assert parse_real_numbers_query("prime factors of 360")[0] == "prime_factorization"
+
+
+if __name__ == "__main__":
+    test_matches_substring_semantics_with_overlaps()
+    test_real_numbers_router_keeps_priority()
+    print("All keyword matcher tests passed")
@@ -0,0 +1,75 @@
+# File: utils/test_llm_gateway.py
+
+import sys
+import os
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.abspath(__file__), "../.."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.llm_gateway import (
+    LLMGateway, StubBackend, LLMUnavailable, DeadlineExceeded, CircuitOpenError, llm_gateway
+)
+
+
+def test_slow_provider_hits_deadline():
+    gateway = LLMGateway(backend=StubBackend(latency=1.0), deadline=0.1)
+    start = time.monotonic()
+    try:
+        gateway.complete("prompt")
+        assert False, "expected DeadlineExceeded"
+    except DeadlineExceeded:
+        pass
+    assert time.monotonic() - start < 0.5
+
+
+def test_breaker_opens_after_repeated_failures():
+    backend = StubBackend(error=RuntimeError("provider down"))
+    gateway = LLMGateway(backend=backend, failure_threshold=2, reset_timeout=60)
+    for _ in range(2):
+        try:
+            gateway.complete("prompt")
+        except LLMUnavailable:
+            pass
+    try:
+        gateway.complete("prompt")
+        assert False, "expected CircuitOpenError"
+    except CircuitOpenError:
+        pass
+    # The open breaker must not reach the provider
+    assert backend.calls == 2
+    assert gateway.stats()["breaker"] == "open"
+
+
+def test_breaker_half_open_recovers():
+    backend = StubBackend(error=RuntimeError("provider down"))
+    gateway = LLMGateway(backend=backend, failure_threshold=1, reset_timeout=0.05)
+    try:
+        gateway.complete("prompt")
+    except LLMUnavailable:
+        pass
+    time.sleep(0.06)
+    backend.error = None
+    backend.response = '{"intent": "calculate_area"}'
+    assert gateway.complete("prompt") == '{"intent": "calculate_area"}'
+    assert gateway.stats()["breaker"] == "closed"
+
+
+def test_interpreter_falls_back_to_error_intent():
+    from chapters.chapter6_triangles.interpret_query_triangles import interpret_query_triangles
+
+    previous = llm_gateway.backend
+    llm_gateway.set_backend(StubBackend(error=RuntimeError("provider down")))
+    try:
+        result = interpret_query_triangles(f"gateway failure check {time.time()}")
+        assert result["intent"] == "error"
+    finally:
+        llm_gateway.set_backend(previous)
+
+
+if __name__ == "__main__":
+    test_slow_provider_hits_deadline()
+    test_breaker_opens_after_repeated_failures()
+    test_breaker_half_open_recovers()
+    test_interpreter_falls_back_to_error_intent()
+    print("All LLM gateway tests passed")
@@ -0,0 +1,119 @@
+# File: utils/test_plot_cache.py
+
+import sys
+import os
+import tempfile
+import time
+
+import numpy as np
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.abspath(__file__), "../.."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.plot_cache import PlotCache, cached_plot, make_plot_key
+
+
+def make_cache(**kwargs) -> PlotCache:
+    return PlotCache(cache_dir=os.path.join(tempfile.mkdtemp(), "plots"), **kwargs)
+
+
+def plot_circle(radius, angle=360, save_name=None, fmt="png"):
+    return f"{radius}:{angle}:{fmt}".encode()
+
+
+def test_keys_are_canonical():
+    key = make_plot_key(plot_circle, (7,), {})
+    assert make_plot_key(plot_circle, (7.0,), {}) == key
+    assert make_plot_key(plot_circle, (np.int64(7),), {}) == key
+    assert make_plot_key(plot_circle, (), {"radius": 7, "angle": 360}) == key  # defaults applied
+    assert make_plot_key(plot_circle, (7,), {"save_name": "circle.png"}) == key  # output arguments ignored
+    assert make_plot_key(plot_circle, (7,), {"fmt": "svg"}) != key
+    assert make_plot_key(plot_circle, (7,), {}, style_version=99) != key
+    assert (make_plot_key(plot_circle, (np.array([1, 2]),), {})
+            == make_plot_key(plot_circle, ([1.0, 2.0],), {}))
+
+
+def test_least_recently_used_entries_are_evicted_by_size():
+    cache = make_cache(max_bytes=25)
+    cache.put("a", b"x" * 10)
+    time.sleep(0.01)
+    cache.put("b", b"y" * 10)
+    assert cache.get("a") == b"x" * 10  # a is now more recent than b
+    cache.put("c", b"z" * 10)
+    assert cache.get("b") is None
+    assert cache.get("a") and cache.get("c")
+    assert cache.stats()["bytes"] == 20 and cache.stats()["evictions"] == 1
+
+    # A new PlotCache on the same directory rebuilds the order from the files
+    reopened = PlotCache(cache_dir=cache.cache_dir, max_bytes=25)
+    assert reopened.stats()["entries"] == 2 and reopened.get("c") == b"z" * 10
+
+
+def test_decorator_renders_once_per_key():
+    calls = []
+    cache = make_cache()
+
+    @cached_plot(cache=cache)
+    def plot(radius, angle=360, fmt="png"):
+        calls.append((radius, angle))
+        return plot_circle(radius, angle, fmt=fmt)
+
+    assert plot(7) == plot(7.0) == plot(radius=7, angle=360) == b"7:360:png"
+    assert calls == [(7, 360)]
+    assert cache.stats()["hits"] == 2
+
+
+def test_file_writing_calls_always_render():
+    calls = []
+    cache = make_cache()
+    out_dir = tempfile.mkdtemp()
+
+    @cached_plot(cache=cache)
+    def plot(radius, save_name=None):
+        calls.append(save_name)
+        data = plot_circle(radius)
+        if save_name:
+            with open(os.path.join(out_dir, save_name), "wb") as f:
+                f.write(data)
+        return data
+
+    plot(3)
+    plot(3, "circle.png")  # cached already, but the file must still be written
+    plot(3, save_name="circle2.png")
+    assert calls == [None, "circle.png", "circle2.png"]
+    assert sorted(os.listdir(out_dir)) == ["circle.png", "circle2.png"]
+    assert plot(3) == b"3:360:png" and len(calls) == 3
+
+
+def test_non_bytes_results_are_not_cached():
+    calls = []
+
+    @cached_plot(cache=make_cache())
+    def plot(radius):
+        calls.append(radius)
+        return "Error creating plot" if radius <= 0 else plot_circle(radius)
+
+    assert plot(-1) == plot(-1) == "Error creating plot"
+    assert calls == [-1, -1]
+
+
+def test_with_info_reports_hits():
+    cache = make_cache()
+
+    @cached_plot(cache=cache, with_info=True)
+    def plot(radius):
+        return plot_circle(radius), {"rendered": radius}
+
+    assert plot(5) == (b"5:360:png", {"rendered": 5})
+    assert plot(5.0) == (b"5:360:png", None)
+    assert cache.stats()["entries"] == 1
+
+
+if __name__ == "__main__":
+    test_keys_are_canonical()
+    test_least_recently_used_entries_are_evicted_by_size()
+    test_decorator_renders_once_per_key()
+    test_file_writing_calls_always_render()
+    test_non_bytes_results_are_not_cached()
+    test_with_info_reports_hits()
+    print("All plot cache tests passed")
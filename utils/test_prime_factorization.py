@@ -0,0 +1,35 @@
+# File: utils/test_prime_factorization.py
+
+import sys
+import os
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.abspath(__file__), "../.."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.prime_factorization import divisors, divisor_pairs, factorize, prime_factor_list, is_prime
+
+
+def test_small_numbers_use_sieve():
+    assert prime_factor_list(360) == [2, 2, 2, 3, 3, 5]
+    assert factorize(1) == ()
+    assert factorize(999983) == ((999983, 1),)
+
+
+def test_large_semiprime_and_prime():
+    assert factorize(1000000007 * 998244353) == ((998244353, 1), (1000000007, 1))
+    assert is_prime(2**61 - 1)
+    assert not is_prime(3215031751)  # strong pseudoprime to bases 2, 3, 5, 7
+
+
+def test_divisors_from_factorization():
+    assert divisors(12) == (1, 2, 3, 4, 6, 12)
+    assert divisors(-36) == divisors(36)
+    assert list(divisor_pairs(36)) == [(1, 36), (2, 18), (3, 12), (4, 9), (6, 6)]
+    assert len(divisors(2**40 * 3**10)) == 41 * 11
+
+
+if __name__ == "__main__":
+    test_small_numbers_use_sieve()
+    test_large_semiprime_and_prime()
+    test_divisors_from_factorization()
+    print("All prime factorization tests passed")